@@ -0,0 +1,97 @@
+"""Benchmark the startup cost of importing quant_py against a stored budget.
+
+Each entry point is imported in a fresh interpreter under ``python -X importtime``
+and its cumulative import time (best of several runs) compared to the budget in
+``import_budget.json``. The budget also lists dependencies each entry point must
+defer to first use; loading any of them at import time is a regression too.
+
+Run with ``uv run python benchmarks/bench_import_time.py``; the exit code is
+non-zero if any entry point is over budget. Pass ``--update`` to re-baseline the
+budgets from the current timings.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+BUDGET_PATH = Path(__file__).with_name("import_budget.json")
+
+
+class ImportProfile(NamedTuple):
+    total_ms: float
+    package_ms: float
+    loaded: frozenset[str]
+
+
+def profile_import(module: str) -> ImportProfile:
+    """Import a module in a fresh interpreter and parse ``-X importtime``."""
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    package_us = 0
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        name = name.strip()
+        loaded.add(name)
+        if name.split(".")[0] == "quant_py":
+            package_us += int(self_us)
+        if name == module:
+            total_us = int(cumulative_us)
+    return ImportProfile(total_us / 1e3, package_us / 1e3, frozenset(loaded))
+
+
+def best_of(module: str, repeat: int) -> ImportProfile:
+    profiles = [profile_import(module) for _ in range(repeat)]
+    return min(profiles, key=lambda profile: profile.total_ms)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--update", action="store_true", help="re-baseline the stored budgets"
+    )
+    args = parser.parse_args()
+
+    budget = json.loads(BUDGET_PATH.read_text())
+    failures = []
+    print(f"{'module':<32}{'total':>10}{'quant_py':>10}{'budget':>10}  status")
+    for module, entry in budget["modules"].items():
+        profile = best_of(module, budget["repeat"])
+        eager = sorted(set(entry["deferred"]) & profile.loaded)
+        if args.update:
+            entry["budget_ms"] = round(profile.total_ms * budget["headroom"], 1)
+
+        status = "ok"
+        if profile.total_ms > entry["budget_ms"]:
+            status = "OVER BUDGET"
+        if eager:
+            status = f"EAGER {', '.join(eager)}"
+        if status != "ok":
+            failures.append(module)
+        print(
+            f"{module:<32}"
+            f"{profile.total_ms:>8.1f}ms"
+            f"{profile.package_ms:>8.1f}ms"
+            f"{entry['budget_ms']:>8.1f}ms"
+            f"  {status}"
+        )
+
+    if args.update:
+        BUDGET_PATH.write_text(json.dumps(budget, indent=2) + "\n")
+        print(f"updated {BUDGET_PATH.name}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
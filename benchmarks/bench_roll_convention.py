@@ -0,0 +1,71 @@
+"""Benchmark roll convention date generation on 50 year monthly schedules.
+
+Compares the duration based path (``adjust(dt + tenor)``) against the integer
+fast path of ``RollConventions.next`` and the array ``RollConventions.sequence``.
+
+Run with ``uv run python benchmarks/bench_roll_convention.py``.
+"""
+
+import timeit
+from typing import TYPE_CHECKING
+
+from pendulum.date import Date
+from pendulum.duration import Duration
+
+from quant_py.scheduling.roll_convention import Bom, DayOfMonth, Eom
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import date
+
+    from quant_py.scheduling.roll_convention import RollConventions
+
+START = Date(2025, 1, 31)
+TENOR = Duration(months=1)
+N_PERIODS = 50 * 12
+
+
+def duration_path(roll_conv: RollConventions) -> None:
+    dt: date = START
+    for _ in range(N_PERIODS):
+        dt = roll_conv.adjust(dt + TENOR)
+
+
+def next_path(roll_conv: RollConventions) -> None:
+    dt = START
+    for _ in range(N_PERIODS):
+        dt = roll_conv.next(dt, TENOR)
+
+
+def sequence_path(roll_conv: RollConventions) -> None:
+    roll_conv.sequence(START, TENOR, N_PERIODS)
+
+
+def best_of(
+    func: Callable[[RollConventions], None],
+    roll_conv: RollConventions,
+    number: int = 20,
+) -> float:
+    timer = timeit.Timer(lambda: func(roll_conv))
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main() -> None:
+    print(
+        f"{'roll conv':<16}{'duration':>12}{'next':>12}{'sequence':>12}{'speedup':>10}"
+    )
+    for roll_conv in (DayOfMonth(31), Eom(), Bom()):
+        duration = best_of(duration_path, roll_conv)
+        fast = best_of(next_path, roll_conv)
+        sequence = best_of(sequence_path, roll_conv)
+        print(
+            f"{type(roll_conv).__name__:<16}"
+            f"{duration * 1e3:>10.2f}ms"
+            f"{fast * 1e3:>10.2f}ms"
+            f"{sequence * 1e3:>10.3f}ms"
+            f"{duration / sequence:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""Benchmark throughput of scheduling, calendars and daycounting on book workloads.
+
+The workloads are a book of 100k mixed-tenor schedules with front and back stubs,
+10M business day adjustments over the SIFMA calendar of ``tests/conftest.py`` and
+year fraction sweeps over every period of the book. Each workload is timed best of
+several runs and reported as items per second.
+
+Run with ``uv run python benchmarks/bench_suite.py``; the throughputs are compared
+to the baseline in ``suite_baseline.json`` and the exit code is non-zero if any
+workload is slower than the baseline by more than the tolerance. Pass ``--update``
+to re-baseline from the current run, ``--output`` to also write the results as JSON
+and ``--filter`` to only run workloads whose name contains a substring.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import UTC, date, datetime
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TypedDict
+
+import numpy as np
+from pendulum.date import Date
+from pendulum.duration import Duration
+
+from quant_py.buscal import as_business_calendar
+from quant_py.dates import add_tenor, from_dates, to_dates
+from quant_py.daycounters.act360 import Act360
+from quant_py.daycounters.act365f import Act365F
+from quant_py.daycounters.actact import ActActIsda
+from quant_py.daycounters.thirty360 import Thirty360, Thirty360E, Thirty360EIsda
+from quant_py.scheduling.adjuster import Adjuster, BusdayConvention
+from quant_py.scheduling.batch import ScheduleBatch
+from quant_py.scheduling.schedule import Schedule
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from numpy.typing import NDArray
+
+    from quant_py.daycounter import Daycounter
+
+BASELINE_PATH = Path(__file__).with_name("suite_baseline.json")
+
+N_TRADES = 100_000
+N_SCALAR_TRADES = 2_000
+N_ADJUSTMENTS = 10_000_000
+N_SCALAR_ADJUSTMENTS = 100_000
+N_SCALAR_PERIODS = 100_000
+TENORS = (
+    Duration(months=1),
+    Duration(months=3),
+    Duration(months=6),
+    Duration(years=1),
+)
+# same calendar as the sifma fixture in tests/conftest.py
+SIFMA = np.busdaycalendar(
+    weekmask="1111100",
+    holidays=np.array(
+        [
+            "2025-01-01",
+            "2025-01-20",
+            "2025-02-17",
+            "2025-04-18",
+            "2025-05-26",
+            "2025-06-19",
+            "2025-07-04",
+            "2025-09-01",
+            "2025-10-13",
+            "2025-11-11",
+            "2025-11-27",
+            "2025-12-25",
+        ],
+        dtype="M8[D]",
+    ),
+)
+BUSDAY_CONV = BusdayConvention.MODIFIEDFOLLOWING
+
+
+class Book(NamedTuple):
+    effective: NDArray[np.datetime64]
+    termination: NDArray[np.datetime64]
+    tenors: list[Duration]
+    front_stub: NDArray[np.datetime64]
+    back_stub: NDArray[np.datetime64]
+    eom: NDArray[np.bool_]
+
+
+class Workload(NamedTuple):
+    name: str
+    unit: str
+    items: int
+    run: Callable[[], object]
+
+
+class Result(TypedDict):
+    unit: str
+    items: int
+    seconds: float
+    throughput: float
+
+
+class Report(TypedDict):
+    environment: dict[str, str]
+    results: dict[str, Result]
+
+
+def make_book(n_trades: int, seed: int = 0) -> Book:
+    """Draw a book of 1-10y trades with 1m/3m/6m/1y tenors traded during 2025.
+
+    A quarter of the trades have a short front stub and another quarter a short
+    back stub; a tenth roll on month ends.
+    """
+    rng = np.random.default_rng(seed)
+    effective = np.datetime64("2025-01-01") + rng.integers(0, 365, n_trades)
+    years = rng.integers(1, 11, n_trades)
+    termination = from_dates(
+        add_tenor(dt, Duration(years=int(n)))
+        for dt, n in zip(effective.tolist(), years.tolist(), strict=True)
+    )
+    tenors = [TENORS[i] for i in rng.integers(0, len(TENORS), n_trades)]
+
+    stub = rng.integers(0, 4, n_trades)
+    stub_days = rng.integers(5, 26, n_trades)
+    nat = np.datetime64("NaT", "D")
+    front_stub = np.where(stub == 0, effective + stub_days, nat)
+    back_stub = np.where(stub == 1, termination - stub_days, nat)
+    eom = (stub > 1) & (rng.random(n_trades) < 0.1)  # noqa: PLR2004
+    return Book(effective, termination, tenors, front_stub, back_stub, eom)
+
+
+def optional_dates(dates: NDArray[np.datetime64]) -> list[Date | None]:
+    return [
+        None if dt is None else Date(dt.year, dt.month, dt.day) for dt in dates.tolist()
+    ]
+
+
+def batch_of(book: Book) -> ScheduleBatch:
+    return ScheduleBatch.of(
+        book.effective,
+        book.termination,
+        book.tenors,
+        SIFMA,
+        BUSDAY_CONV,
+        book.front_stub,
+        book.back_stub,
+        eom=book.eom,
+    )
+
+
+def adjust_each(adjuster: Adjuster, dates: list[Date]) -> list[date]:
+    return [adjuster.adjust(dt) for dt in dates]
+
+
+def count_each(daycounter: Daycounter, periods: list[tuple[Date, Date]]) -> list[float]:
+    return [daycounter.count(start, end) for start, end in periods]
+
+
+def schedule_workloads(book: Book) -> Iterator[Workload]:
+    yield Workload("schedule_batch.of", "schedules", N_TRADES, lambda: batch_of(book))
+
+    n = N_SCALAR_TRADES
+    trades = list(
+        zip(
+            to_dates(book.effective[:n]),
+            to_dates(book.termination[:n]),
+            book.tenors[:n],
+            optional_dates(book.front_stub[:n]),
+            optional_dates(book.back_stub[:n]),
+            book.eom[:n].tolist(),
+            strict=True,
+        )
+    )
+
+    def schedules() -> None:
+        for effective, termination, tenor, front, back, eom in trades:
+            Schedule.of(
+                effective, termination, tenor, SIFMA, BUSDAY_CONV, front, back, eom=eom
+            )
+
+    yield Workload("schedule.of", "schedules", N_SCALAR_TRADES, schedules)
+
+
+def adjuster_workloads(seed: int = 0) -> Iterator[Workload]:
+    rng = np.random.default_rng(seed)
+    dates = np.datetime64("2025-01-01") + rng.integers(0, 365, N_ADJUSTMENTS)
+    for name, calendar in (
+        ("busdaycalendar", SIFMA),
+        ("business_calendar", as_business_calendar(SIFMA)),
+    ):
+        adjuster = Adjuster(calendar, BUSDAY_CONV)
+        yield Workload(
+            f"adjuster.adjust_many[{name}]",
+            "dates",
+            N_ADJUSTMENTS,
+            partial(adjuster.adjust_many, dates),
+        )
+
+        scalar_dates = to_dates(dates[:N_SCALAR_ADJUSTMENTS])
+        yield Workload(
+            f"adjuster.adjust[{name}]",
+            "dates",
+            N_SCALAR_ADJUSTMENTS,
+            partial(adjust_each, adjuster, scalar_dates),
+        )
+
+
+def daycounter_workloads(batch: ScheduleBatch) -> Iterator[Workload]:
+    start, end = batch.start, batch.end
+    scalar_periods = list(
+        zip(
+            to_dates(start[:N_SCALAR_PERIODS]),
+            to_dates(end[:N_SCALAR_PERIODS]),
+            strict=True,
+        )
+    )
+    for daycounter in (
+        Act360(),
+        Act365F(),
+        ActActIsda(),
+        Thirty360(),
+        Thirty360E(),
+        Thirty360EIsda(),
+    ):
+        name = type(daycounter).__name__
+        yield Workload(
+            f"{name}.count_many",
+            "periods",
+            start.size,
+            partial(daycounter.count_many, start, end),
+        )
+        yield Workload(
+            f"{name}.count",
+            "periods",
+            N_SCALAR_PERIODS,
+            partial(count_each, daycounter, scalar_periods),
+        )
+
+
+def workloads() -> Iterator[Workload]:
+    book = make_book(N_TRADES)
+    yield from schedule_workloads(book)
+    yield from adjuster_workloads()
+    yield from daycounter_workloads(batch_of(book))
+
+
+def best_of(run: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - begin)
+    return min(timings)
+
+
+def environment() -> dict[str, str]:
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per workload")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative throughput loss vs the baseline",
+    )
+    parser.add_argument("--filter", default="", help="only run matching workloads")
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument(
+        "--update", action="store_true", help="re-baseline from this run"
+    )
+    args = parser.parse_args()
+
+    baseline: dict[str, Result] = (
+        json.loads(BASELINE_PATH.read_text())["results"]
+        if BASELINE_PATH.exists()
+        else {}
+    )
+    results: dict[str, Result] = {}
+    failures: list[str] = []
+    print(f"{'workload':<40}{'seconds':>10}{'items/s':>14}{'baseline':>14}  status")
+    for workload in workloads():
+        if args.filter not in workload.name:
+            continue
+
+        seconds = best_of(workload.run, args.repeat)
+        throughput = workload.items / seconds
+        results[workload.name] = Result(
+            unit=workload.unit,
+            items=workload.items,
+            seconds=seconds,
+            throughput=throughput,
+        )
+
+        status = "new"
+        reference_text = "-"
+        if workload.name in baseline:
+            reference = baseline[workload.name]["throughput"]
+            reference_text = f"{reference:,.0f}"
+            change = throughput / reference - 1
+            status = f"{change:+.1%}"
+            if change < -args.tolerance:
+                status += " REGRESSION"
+                failures.append(workload.name)
+        print(
+            f"{workload.name:<40}"
+            f"{seconds:>10.4f}"
+            f"{throughput:>14,.0f}"
+            f"{reference_text:>14}"
+            f"  {status}"
+        )
+
+    report = Report(environment=environment(), results=results)
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"wrote {args.output}")
+    if args.update:
+        report["results"] = baseline | results
+        BASELINE_PATH.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"updated {BASELINE_PATH.name}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
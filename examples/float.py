@@ -1,8 +1,14 @@
 import numpy as np
+from pendulum.date import Date
+from pendulum.duration import Duration
 
+from quant_py.curves.discount_curve import DiscountCurve
 from quant_py.daycounters.act360 import Act360
+from quant_py.daycounters.act365f import Act365F
 from quant_py.indices.ois_index import OisRateIndexMetadata
+from quant_py.products.floating_leg import FloatingLeg
 from quant_py.scheduling.adjuster import BusdayConvention
+from quant_py.scheduling.schedule import Schedule
 
 
 def usgs() -> np.busdaycalendar:
@@ -38,6 +44,23 @@ def main() -> None:
     )
     print(metadata)
 
+    curve = DiscountCurve.from_zero_rates(
+        ref_dt=np.datetime64("2025-08-15"),
+        pillars=np.array(["2026-08-17", "2027-08-16", "2030-08-15"], dtype="M8[D]"),
+        zero_rates=[0.04, 0.038, 0.037],
+        daycounter=Act365F(),
+    )
+    schedule = Schedule.of(
+        effective=Date(2025, 8, 19),
+        termination=Date(2030, 8, 19),
+        tenor=Duration(years=1),
+        pay_cal=metadata.pay_cal,
+        busday_conv=metadata.busday_conv,
+    )
+    leg = FloatingLeg(schedule, metadata, notional=10_000_000.0)
+    print(leg.coupons(curve))
+    print(leg.pv(curve))
+
 
 if __name__ == "__main__":
     main()
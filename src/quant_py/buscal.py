@@ -1,29 +1,195 @@
 """Business calendar."""
 
-from typing import TYPE_CHECKING, Self
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from hashlib import blake2b
+from threading import Lock
+from typing import TYPE_CHECKING, NamedTuple, Self
 
 import numpy as np
 
 if TYPE_CHECKING:
-    from numpy.typing import NDArray
-    from pendulum.date import Date
+    from collections.abc import Callable, Hashable
+    from datetime import date
 
+    from numpy.typing import ArrayLike, NDArray
 
-# TODO(jkitzlr): implementation
+    from quant_py.scheduling.adjuster import BusdayConvention
+
+
+_DEFAULT_START = np.datetime64("1950-01-01", "D")
+_DEFAULT_END = np.datetime64("2101-01-01", "D")
+
+
+class JointCalendarRule(Enum):
+    """Enumerate the rules for combining business calendars."""
+
+    UNION = "union"
+    INTERSECTION = "intersection"
+
+
+class CalendarTables(NamedTuple):
+    """Precomputed business day tables of a ``BusinessCalendar``.
+
+    Attributes:
+        bitmap: Whether each day of the calendar range is a business day.
+        busdays: The business days of the calendar range.
+        cum_count: Number of business days strictly before each day of the calendar
+            range, plus one entry past its end.
+        busday_ordinals: Proleptic Gregorian ordinal of each business day.
+    """
+
+    bitmap: NDArray[np.bool_]
+    busdays: NDArray[np.datetime64]
+    cum_count: NDArray[np.int64]
+    busday_ordinals: NDArray[np.int64]
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=True,
+    eq=False,
+)
 class BusinessCalendar:
-    """WIP."""
+    """Business calendar backed by a precomputed business day index.
 
-    def __init__(  # noqa: D107
-        self: Self,
-        holidays: NDArray[np.datetime64] | None = None,
-        weekmask: str = "1111100",
-    ) -> None:
-        self.holidays: NDArray[np.datetime64] = (
-            np.array([], dtype="M8[D]") if holidays is None else holidays
+    On construction the calendar tabulates, for every day in ``[start, end)``, whether
+    it is a business day and how many business days precede it. Every query is then
+    an O(1) array lookup rather than a search through the holiday array.
+
+    Attributes:
+        holidays: The holidays of the calendar. Defaults to no holidays.
+        weekmask: Seven character mask of the weekdays (Mon-Sun) that are busdays.
+            Defaults to "1111100".
+        start: First date covered by the calendar. Defaults to 1950-01-01.
+        end: First date past the end of the calendar. Defaults to 2101-01-01.
+        key: Hashable identity of the calendar's business days and date range.
+            Calendars with equal keys treat every date identically.
+    """
+
+    holidays: NDArray[np.datetime64] = field(
+        default_factory=lambda: np.array([], dtype="M8[D]")
+    )
+    weekmask: str = "1111100"
+    start: np.datetime64 = _DEFAULT_START
+    end: np.datetime64 = _DEFAULT_END
+    key: tuple[np.datetime64, np.datetime64, bytes] = field(init=False)
+    _bitmap: NDArray[np.bool_] = field(init=False, repr=False)
+    _busdays: NDArray[np.datetime64] = field(init=False, repr=False)
+    _cum_count: NDArray[np.int64] = field(init=False, repr=False)
+    _start_ordinal: int = field(init=False, repr=False)
+    _busday_ordinals: NDArray[np.int64] = field(init=False, repr=False)
+    _busdaycalendar: np.busdaycalendar | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self: Self) -> None:
+        """Tabulate the business days of the calendar over ``[start, end)``."""
+        start = np.datetime64(self.start, "D")
+        end = np.datetime64(self.end, "D")
+        if end <= start:
+            msg = "Calendar end must be after its start!"
+            raise ValueError(msg)
+
+        days = np.arange(start, end, dtype="M8[D]")
+        bitmap = np.is_busday(days, weekmask=self.weekmask, holidays=self.holidays)
+        busdays = days[bitmap]
+        # number of busdays strictly before each day (plus one past the end)
+        cum_count = np.zeros(days.size + 1, dtype=np.int64)
+        np.cumsum(bitmap, out=cum_count[1:])
+        busday_ordinals = (busdays - start).astype(np.int64) + start.item().toordinal()
+        self._set_tables(
+            start, end, CalendarTables(bitmap, busdays, cum_count, busday_ordinals)
         )
-        self.weekmask = weekmask
 
-    def is_busday(self: Self, dt: Date) -> bool:
+    @classmethod
+    def _from_tables(
+        cls: type[Self],
+        holidays: NDArray[np.datetime64],
+        weekmask: str,
+        start: np.datetime64,
+        end: np.datetime64,
+        tables: CalendarTables,
+    ) -> Self:
+        """Construct a calendar from the tables of an equal calendar.
+
+        The tables aren't copied or checked against the holidays, so calendars can be
+        rebuilt cheaply on top of shared (e.g. shared memory) tables.
+
+        Args:
+            holidays: The holidays of the calendar.
+            weekmask: Seven character mask of the weekdays (Mon-Sun) that are busdays.
+            start: First date covered by the calendar.
+            end: First date past the end of the calendar.
+            tables: The precomputed tables of the calendar over ``[start, end)``.
+
+        Returns:
+            The calendar.
+        """
+        calendar = cls.__new__(cls)
+        object.__setattr__(calendar, "holidays", holidays)
+        object.__setattr__(calendar, "weekmask", weekmask)
+        object.__setattr__(calendar, "_busdaycalendar", None)
+        cls._set_tables(
+            calendar, np.datetime64(start, "D"), np.datetime64(end, "D"), tables
+        )
+        return calendar
+
+    @property
+    def tables(self: Self) -> CalendarTables:
+        """Get the precomputed business day tables of the calendar."""
+        return CalendarTables(
+            self._bitmap, self._busdays, self._cum_count, self._busday_ordinals
+        )
+
+    @classmethod
+    def join(
+        cls: type[Self],
+        *calendars: BusinessCalendar,
+        rule: JointCalendarRule = JointCalendarRule.UNION,
+    ) -> BusinessCalendar:
+        """Combine calendars into a joint calendar.
+
+        Under ``UNION`` a day is a holiday if it is a holiday in any of the calendars
+        (i.e. busdays must be busdays everywhere); under ``INTERSECTION`` only if it
+        is a holiday in all of them. The joint calendar covers the date range common
+        to all the calendars.
+
+        Joint calendars are kept in a small LRU cache keyed on the ``key`` of their
+        constituents, so callers combining equal calendars share one precomputed
+        calendar.
+
+        Args:
+            calendars: The calendars to combine.
+            rule: How to combine the holidays. Defaults to ``UNION``.
+
+        Returns:
+            The joint calendar.
+        """
+        unique = {calendar.key: calendar for calendar in calendars}
+        if len(unique) == 1:
+            return calendars[0]
+
+        keys = tuple(sorted(unique))
+        return _cached(
+            _joined,
+            (keys, rule),
+            lambda: _join(cls, [unique[key] for key in keys], rule),
+        )
+
+    @property
+    def busdaycalendar(self: Self) -> np.busdaycalendar:
+        """Get the equivalent numpy ``busdaycalendar``."""
+        if self._busdaycalendar is None:
+            calendar = np.busdaycalendar(weekmask=self.weekmask, holidays=self.holidays)
+            object.__setattr__(self, "_busdaycalendar", calendar)
+            return calendar
+        return self._busdaycalendar
+
+    def is_busday(self: Self, dt: date) -> bool:
         """Check whether the input date ``dt`` is a business day.
 
         Args:
@@ -32,6 +198,298 @@ class BusinessCalendar:
         Returns:
             Whether ``dt`` is a busday.
         """
-        return np.is_busday(
-            dates=dt, weekmask=self.weekmask, holidays=self.holidays
-        ).item()
+        return bool(self._bitmap[self._date_index(dt)])
+
+    def is_busday_many(self: Self, dts: ArrayLike) -> NDArray[np.bool_]:
+        """Check whether each of the input dates is a business day.
+
+        Args:
+            dts: The dates to check, convertible to ``datetime64[D]``.
+
+        Returns:
+            Whether each date is a busday.
+        """
+        return self._bitmap[self._index(dts)]
+
+    def roll(
+        self: Self, dts: ArrayLike, busday_conv: BusdayConvention
+    ) -> NDArray[np.datetime64]:
+        """Roll the input dates to business days.
+
+        Args:
+            dts: The dates to roll, convertible to ``datetime64[D]``.
+            busday_conv: The busday adjust convention.
+
+        Returns:
+            The rolled dates as a ``datetime64[D]`` array.
+        """
+        dts = np.asarray(dts, dtype="M8[D]")
+        match busday_conv.value:
+            case "following":
+                return self._following(self._index(dts))
+            case "preceding":
+                return self._preceding(self._index(dts))
+            case "modifiedfollowing":
+                idx = self._index(dts)
+                rolled = self._following(idx)
+                crossed = rolled.astype("M8[M]") != dts.astype("M8[M]")
+                return np.where(crossed, self._preceding(idx), rolled)
+            case "modifiedpreceding":
+                idx = self._index(dts)
+                rolled = self._preceding(idx)
+                crossed = rolled.astype("M8[M]") != dts.astype("M8[M]")
+                return np.where(crossed, self._following(idx), rolled)
+            case _:  # BusdayConvention.NONE
+                return dts.copy()
+
+    def roll_date(self: Self, dt: date, busday_conv: BusdayConvention) -> date:
+        """Roll a single date to a business day.
+
+        Scalar counterpart of ``roll`` working on date ordinals, which avoids the
+        overhead of array operations on single dates.
+
+        Args:
+            dt: The date to roll.
+            busday_conv: The busday adjust convention.
+
+        Returns:
+            The rolled date, of the same type as ``dt``.
+        """
+        idx = self._date_index(dt)
+        following = self._cum_count[idx]
+        preceding = self._cum_count[idx + 1] - 1
+        match busday_conv.value:
+            case "following" | "modifiedfollowing":
+                ordinal, fallback = following, preceding
+            case "preceding" | "modifiedpreceding":
+                ordinal, fallback = preceding, following
+            case _:  # BusdayConvention.NONE
+                return dt
+
+        rolled = self._busday_date(dt, ordinal)
+        if busday_conv.value.startswith("modified") and rolled.month != dt.month:
+            return self._busday_date(dt, fallback)
+        return rolled
+
+    def add_busdays(self: Self, dts: ArrayLike, n: ArrayLike) -> NDArray[np.datetime64]:
+        """Offset the input dates by a number of business days.
+
+        Dates which aren't business days are first rolled to the following business
+        day, as with ``np.busday_offset(..., roll="following")``.
+
+        Args:
+            dts: The dates to offset, convertible to ``datetime64[D]``.
+            n: Number of business days to offset by; may be negative.
+
+        Returns:
+            The offset dates as a ``datetime64[D]`` array.
+        """
+        ordinal = self._cum_count[self._index(dts)] + np.asarray(n, dtype=np.int64)
+        return self._busday(ordinal)
+
+    def busday_count(
+        self: Self, starts: ArrayLike, ends: ArrayLike
+    ) -> NDArray[np.int64]:
+        """Count the business days in ``[start, end)``.
+
+        As with ``np.busday_count``, when ``end`` precedes ``start`` the business days
+        in ``(end, start]`` are counted negatively.
+
+        Args:
+            starts: Start dates, convertible to ``datetime64[D]``.
+            ends: End dates, convertible to ``datetime64[D]``.
+
+        Returns:
+            Number of business days between each start and end.
+        """
+        start_idx = self._index(starts)
+        end_idx = self._index(ends)
+        shift = end_idx < start_idx
+        return self._cum_count[end_idx + shift] - self._cum_count[start_idx + shift]
+
+    def ordinal(self: Self, dts: ArrayLike) -> NDArray[np.int64]:
+        """Get the business day ordinal of each of the input dates.
+
+        The ordinal is the number of business days in the calendar before the date,
+        which is also the ordinal of the first business day on or after it.
+        Together with ``from_ordinal`` this allows business day arithmetic on plain
+        integer arrays.
+
+        Args:
+            dts: The dates, convertible to ``datetime64[D]``.
+
+        Returns:
+            Business day ordinal of each date.
+        """
+        return self._cum_count[self._index(dts)]
+
+    def from_ordinal(self: Self, ordinals: ArrayLike) -> NDArray[np.datetime64]:
+        """Get the business days with the input ordinals.
+
+        Args:
+            ordinals: Business day ordinals.
+
+        Returns:
+            The business days as a ``datetime64[D]`` array.
+        """
+        return self._busday(np.asarray(ordinals, dtype=np.int64))
+
+    def _set_tables(
+        self: Self, start: np.datetime64, end: np.datetime64, tables: CalendarTables
+    ) -> None:
+        digest = blake2b(np.packbits(tables.bitmap).tobytes(), digest_size=16)
+        object.__setattr__(self, "start", start)
+        object.__setattr__(self, "end", end)
+        object.__setattr__(self, "key", (start, end, digest.digest()))
+        object.__setattr__(self, "_bitmap", tables.bitmap)
+        object.__setattr__(self, "_busdays", tables.busdays)
+        object.__setattr__(self, "_cum_count", tables.cum_count)
+        object.__setattr__(self, "_start_ordinal", start.item().toordinal())
+        object.__setattr__(self, "_busday_ordinals", tables.busday_ordinals)
+
+    def _index(self: Self, dts: ArrayLike) -> NDArray[np.int64]:
+        idx = (np.asarray(dts, dtype="M8[D]") - self.start).astype(np.int64)
+        if np.any((idx < 0) | (idx >= self._bitmap.size)):
+            msg = f"Dates are outside of the calendar range [{self.start}, {self.end})!"
+            raise ValueError(msg)
+
+        return idx
+
+    def _date_index(self: Self, dt: date) -> int:
+        idx = dt.toordinal() - self._start_ordinal
+        if not 0 <= idx < self._bitmap.size:
+            msg = f"{dt} is outside of the calendar range [{self.start}, {self.end})!"
+            raise ValueError(msg)
+
+        return idx
+
+    def _busday_date(self: Self, dt: date, ordinal: int) -> date:
+        if not 0 <= ordinal < self._busday_ordinals.size:
+            msg = f"Result is outside of the calendar range [{self.start}, {self.end})!"
+            raise ValueError(msg)
+
+        return type(dt).fromordinal(int(self._busday_ordinals[ordinal]))
+
+    def _busday(self: Self, ordinal: NDArray[np.int64]) -> NDArray[np.datetime64]:
+        if np.any((ordinal < 0) | (ordinal >= self._busdays.size)):
+            msg = f"Result is outside of the calendar range [{self.start}, {self.end})!"
+            raise ValueError(msg)
+
+        return self._busdays[ordinal]
+
+    def _following(self: Self, idx: NDArray[np.int64]) -> NDArray[np.datetime64]:
+        return self._busday(self._cum_count[idx])
+
+    def _preceding(self: Self, idx: NDArray[np.int64]) -> NDArray[np.datetime64]:
+        return self._busday(self._cum_count[idx + 1] - 1)
+
+
+def _join(
+    cls: type[BusinessCalendar],
+    calendars: list[BusinessCalendar],
+    rule: JointCalendarRule,
+) -> BusinessCalendar:
+    if not calendars:
+        msg = "Need at least one calendar to join!"
+        raise ValueError(msg)
+
+    start = max(calendar.start for calendar in calendars)
+    end = min(calendar.end for calendar in calendars)
+    if end <= start:
+        msg = "Calendars to join do not have overlapping date ranges!"
+        raise ValueError(msg)
+
+    days = np.arange(start, end, dtype="M8[D]")
+    # a monday-sunday week to read each weekmask off of
+    week = np.arange("1970-01-05", "1970-01-12", dtype="M8[D]")
+    busdays = np.array([calendar.is_busday_many(days) for calendar in calendars])
+    weekmasks = np.array(
+        [np.is_busday(week, weekmask=calendar.weekmask) for calendar in calendars]
+    )
+    if rule == JointCalendarRule.UNION:
+        is_busday = busdays.all(axis=0)
+        weekmask = weekmasks.all(axis=0)
+    else:
+        is_busday = busdays.any(axis=0)
+        weekmask = weekmasks.any(axis=0)
+
+    weekmask_str = "".join("1" if bit else "0" for bit in weekmask)
+    on_weekmask = np.is_busday(days, weekmask=weekmask_str)
+    return cls(
+        holidays=days[on_weekmask & ~is_busday],
+        weekmask=weekmask_str,
+        start=start,
+        end=end,
+    )
+
+
+# number of converted and of joint calendars kept; each holds ~1 MB of tables
+_CACHE_SIZE = 16
+_cache_lock = Lock()
+_converted: OrderedDict[Hashable, BusinessCalendar] = OrderedDict()
+_joined: OrderedDict[Hashable, BusinessCalendar] = OrderedDict()
+
+
+def calendar_key(calendar: np.busdaycalendar | BusinessCalendar) -> Hashable:
+    """Get a hashable identity for a business day calendar.
+
+    Equal keys mean the calendars agree on every business day, even if they are
+    different objects.
+
+    Args:
+        calendar: The calendar to identify.
+
+    Returns:
+        Hashable key of the calendar.
+    """
+    if isinstance(calendar, BusinessCalendar):
+        return calendar.key
+
+    return (calendar.weekmask.tobytes(), calendar.holidays.tobytes())
+
+
+def as_business_calendar(
+    calendar: np.busdaycalendar | BusinessCalendar,
+) -> BusinessCalendar:
+    """Get the input calendar as a ``BusinessCalendar``.
+
+    Conversions of numpy calendars are kept in a small LRU cache keyed on the
+    calendar's weekmask and holidays, so equal calendars share one conversion.
+
+    Args:
+        calendar: The calendar to convert.
+
+    Returns:
+        Equivalent ``BusinessCalendar``.
+    """
+    if isinstance(calendar, BusinessCalendar):
+        return calendar
+
+    weekmask = "".join("1" if bit else "0" for bit in calendar.weekmask)
+    holidays = calendar.holidays
+    return _cached(
+        _converted,
+        calendar_key(calendar),
+        lambda: BusinessCalendar(holidays, weekmask=weekmask),
+    )
+
+
+def _cached(
+    calendars: OrderedDict[Hashable, BusinessCalendar],
+    key: Hashable,
+    build: Callable[[], BusinessCalendar],
+) -> BusinessCalendar:
+    """Get a calendar from a bounded LRU cache, building it on a miss."""
+    with _cache_lock:
+        calendar = calendars.get(key)
+        if calendar is not None:
+            calendars.move_to_end(key)
+            return calendar
+
+    calendar = build()
+    with _cache_lock:
+        calendar = calendars.setdefault(key, calendar)
+        calendars.move_to_end(key)
+        if len(calendars) > _CACHE_SIZE:
+            calendars.popitem(last=False)
+    return calendar
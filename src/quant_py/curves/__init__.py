@@ -0,0 +1 @@
+"""Interest rate curves."""
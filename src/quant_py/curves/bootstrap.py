@@ -0,0 +1,223 @@
+"""Bootstrapping of discount curves from par OIS quotes."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, NamedTuple, Self
+
+import numpy as np
+
+from quant_py.buscal import as_business_calendar
+from quant_py.curves.discount_curve import DiscountCurve
+from quant_py.curves.interpolation import Interpolation, LogDfInterpolator
+from quant_py.dates import add_tenor, roll_months, tenor_in_months
+from quant_py.daycounters.act365f import Act365F
+from quant_py.lazy import lazy_import
+from quant_py.scheduling.batch import ScheduleBatch
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import ArrayLike, NDArray
+    from pendulum.duration import Duration
+
+    from quant_py.daycounter import Daycounter
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+
+pendulum = lazy_import("pendulum")
+
+
+class BootstrapResult(NamedTuple):
+    """Bootstrapped curve along with the state of the solver at the solution.
+
+    Attributes:
+        curve: The bootstrapped curve.
+        iterations: Number of Newton steps taken.
+        max_residual: Largest absolute PV of the quoted swaps on the curve.
+        jacobian: Derivatives of the quoted swap PVs w.r.t. the pillar log dfs.
+        annuities: Fixed leg annuity of each quoted swap.
+    """
+
+    curve: DiscountCurve
+    iterations: int
+    max_residual: float
+    jacobian: NDArray[np.float64]
+    annuities: NDArray[np.float64]
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class OisBootstrapper:
+    """Bootstrap a discount curve from par OIS quotes with Newton's method.
+
+    The swaps' schedules, year fractions and curve times are computed once on
+    construction, so each solve only re-evaluates the curve. Discounting and
+    projection use the same curve, so the floating leg of each swap is worth the
+    discount factor at its start less the one at its maturity. The pillars are the
+    swaps' adjusted maturities, and each Newton step uses the analytic Jacobian of
+    the interpolation.
+
+    Attributes:
+        ref_dt: Reference date of the curve.
+        tenors: Increasing maturity of each quoted swap, from spot.
+        metadata: Metadata of the overnight index the swaps reference.
+        spot_lag: Business days from ``ref_dt`` to the swaps' start. Defaults to 2.
+        fixed_tenor: Tenor of the swaps' fixed periods, rolled back from maturity
+            with a short front stub. Defaults to 1y.
+        daycounter: Daycounter of the curve's time. Defaults to ACT/365F.
+        interpolation: Interpolation method of the curve. Defaults to
+            ``LINEAR_LOG_DF``.
+        schedules: Fixed leg schedules of the swaps.
+    """
+
+    ref_dt: np.datetime64
+    tenors: Sequence[Duration]
+    metadata: OisRateIndexMetadata
+    spot_lag: int = 2
+    fixed_tenor: Duration = field(default_factory=lambda: pendulum.Duration(years=1))
+    daycounter: Daycounter = field(default=Act365F())
+    interpolation: Interpolation = Interpolation.LINEAR_LOG_DF
+    schedules: ScheduleBatch = field(init=False, repr=False)
+    _offsets: NDArray[np.int64] = field(init=False, repr=False)
+    _times: NDArray[np.float64] = field(init=False, repr=False)
+    _year_fracs: NDArray[np.float64] = field(init=False, repr=False)
+    _signs: NDArray[np.float64] = field(init=False, repr=False)
+
+    def __post_init__(self: Self) -> None:
+        """Build the swaps' schedules and tabulate their cashflow dates."""
+        ref_dt = np.datetime64(self.ref_dt, "D")
+        months = tenor_in_months(self.fixed_tenor)
+        if not months:
+            msg = "Fixed tenor must be month or year based!"
+            raise ValueError(msg)
+
+        cal = as_business_calendar(self.metadata.pay_cal)
+        spot = cal.add_busdays(ref_dt, self.spot_lag)[()].item()
+        maturities = [add_tenor(spot, tenor) for tenor in self.tenors]
+        # number of whole fixed periods which fit in each swap
+        periods = [(tenor_in_months(tenor) or 0) // months for tenor in self.tenors]
+        front_stubs = [
+            np.datetime64("NaT", "D")
+            if n * months == tenor_in_months(tenor)
+            else np.datetime64(roll_months(maturity, -n * months, maturity.day))
+            for n, tenor, maturity in zip(periods, self.tenors, maturities, strict=True)
+        ]
+        schedules = ScheduleBatch.of(
+            effective=np.full(len(self.tenors), np.datetime64(spot), dtype="M8[D]"),
+            termination=np.array(maturities, dtype="M8[D]"),
+            tenors=[self.fixed_tenor] * len(self.tenors),
+            pay_cal=self.metadata.pay_cal,
+            busday_conv=self.metadata.busday_conv,
+            front_stub=np.array(front_stubs, dtype="M8[D]"),
+        )
+
+        # the swap start followed by the end of each fixed period, per swap
+        n_swaps = len(schedules)
+        offsets = schedules.offsets + np.arange(n_swaps + 1)
+        start_rows = offsets[:-1]
+        end_rows = np.ones(offsets[-1], dtype=np.bool_)
+        end_rows[start_rows] = False
+        dates = np.empty(offsets[-1], dtype="M8[D]")
+        dates[start_rows] = schedules.start[schedules.offsets[:-1]]
+        dates[end_rows] = schedules.end
+        year_fracs = np.zeros(offsets[-1])
+        year_fracs[end_rows] = schedules.year_fracs(self.metadata.daycounter)
+        signs = np.zeros(offsets[-1])
+        signs[start_rows] = -1.0
+        signs[offsets[1:] - 1] += 1.0
+
+        pillars = dates[offsets[1:] - 1]
+        if np.any(pillars[1:] <= pillars[:-1]):
+            msg = "Swap maturities must be strictly increasing!"
+            raise ValueError(msg)
+
+        object.__setattr__(self, "ref_dt", ref_dt)
+        object.__setattr__(self, "schedules", schedules)
+        object.__setattr__(self, "_offsets", offsets)
+        object.__setattr__(self, "_times", self.daycounter.count_many(ref_dt, dates))
+        object.__setattr__(self, "_year_fracs", year_fracs)
+        object.__setattr__(self, "_signs", signs)
+
+    @property
+    def pillars(self: Self) -> NDArray[np.datetime64]:
+        """Get the adjusted maturity of each swap."""
+        return self.schedules.end[self.schedules.offsets[1:] - 1]
+
+    def solve(
+        self: Self,
+        quotes: ArrayLike,
+        guess: DiscountCurve | None = None,
+        *,
+        tol: float = 1e-12,
+        max_iter: int = 20,
+    ) -> BootstrapResult:
+        """Bootstrap the curve on which every swap prices at par.
+
+        Args:
+            quotes: Par fixed rate of each swap.
+            guess: Curve to start the solver from, e.g. the curve of the previous
+                tick. Defaults to None (flat at each swap's quote).
+            tol: Absolute tolerance on the swap PVs (per unit notional).
+                Defaults to 1e-12.
+            max_iter: Maximum number of Newton steps. Defaults to 20.
+
+        Returns:
+            The bootstrapped curve and final solver state.
+
+        Raises:
+            RuntimeError: If the solver does not converge within ``max_iter`` steps.
+        """
+        quotes = np.asarray(quotes, dtype=np.float64)
+        if quotes.shape != (len(self.schedules),):
+            msg = "Need exactly one quote per swap!"
+            raise ValueError(msg)
+
+        last_rows = self._offsets[1:] - 1
+        node_times = np.concatenate(([0.0], self._times[last_rows]))
+        start_log_dfs: NDArray[np.float64] = (
+            -quotes * node_times[1:]
+            if guess is None
+            else np.log(guess.df(self.pillars))
+        )
+        log_dfs = np.concatenate(([0.0], start_log_dfs))
+
+        counts = np.diff(self._offsets)
+        coefs = np.repeat(quotes, counts) * self._year_fracs + self._signs
+        iterations = 0
+        while True:
+            interpolator = LogDfInterpolator(node_times, log_dfs, self.interpolation)
+            dfs = np.exp(interpolator(self._times))
+            residuals: NDArray[np.float64] = np.add.reduceat(
+                coefs * dfs, self._offsets[:-1]
+            )
+            max_residual = float(np.max(np.abs(residuals)))
+            weighted = (coefs * dfs)[:, np.newaxis]
+            jacobian: NDArray[np.float64] = np.add.reduceat(
+                weighted * interpolator.jacobian(self._times).dense(),
+                self._offsets[:-1],
+            )
+            if max_residual < tol:
+                break
+
+            if iterations >= max_iter:
+                msg = f"Bootstrap did not converge in {max_iter} iterations!"
+                raise RuntimeError(msg)
+
+            log_dfs[1:] -= np.linalg.solve(jacobian, residuals)
+            iterations += 1
+
+        return BootstrapResult(
+            curve=DiscountCurve(
+                ref_dt=self.ref_dt,
+                pillars=self.pillars,
+                dfs=np.exp(log_dfs[1:]),
+                daycounter=self.daycounter,
+                interpolation=self.interpolation,
+            ),
+            iterations=iterations,
+            max_residual=max_residual,
+            jacobian=jacobian,
+            annuities=np.add.reduceat(self._year_fracs * dfs, self._offsets[:-1]),
+        )
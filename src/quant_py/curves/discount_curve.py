@@ -0,0 +1,220 @@
+"""Zero coupon discount curve."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from quant_py.curves.interpolation import Interpolation, LogDfInterpolator
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from quant_py.curves.interpolation import LogDfJacobian
+    from quant_py.daycounter import Daycounter
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class DiscountCurve:
+    """Discount curve interpolated between discount factors at pillar dates.
+
+    Time is measured in year fractions from the reference date under the curve's
+    daycounter. Every evaluation takes whole arrays of dates.
+
+    Attributes:
+        ref_dt: Reference date of the curve, on which the discount factor is 1.
+        pillars: Strictly increasing ``datetime64[D]`` pillar dates after ``ref_dt``.
+        dfs: Discount factor at each pillar.
+        daycounter: Daycounter measuring time along the curve.
+        interpolation: The interpolation method. Defaults to ``LINEAR_LOG_DF``.
+        interpolator: Interpolator of the log dfs in curve time.
+    """
+
+    ref_dt: np.datetime64
+    pillars: NDArray[np.datetime64]
+    dfs: NDArray[np.float64]
+    daycounter: Daycounter
+    interpolation: Interpolation = Interpolation.LINEAR_LOG_DF
+    interpolator: LogDfInterpolator = field(init=False, repr=False)
+
+    def __post_init__(self: Self) -> None:
+        """Validate the pillars and build the interpolator."""
+        ref_dt = np.datetime64(self.ref_dt, "D")
+        pillars = np.asarray(self.pillars, dtype="M8[D]")
+        dfs = np.asarray(self.dfs, dtype=np.float64)
+        if pillars.shape != dfs.shape or pillars.ndim != 1 or pillars.size == 0:
+            msg = "Pillars and dfs must be non-empty 1-d arrays of equal length!"
+            raise ValueError(msg)
+
+        if pillars[0] <= ref_dt or np.any(pillars[1:] <= pillars[:-1]):
+            msg = "Pillars must be strictly increasing and after the reference date!"
+            raise ValueError(msg)
+
+        if np.any(dfs <= 0.0):
+            msg = "Discount factors must be positive!"
+            raise ValueError(msg)
+
+        object.__setattr__(self, "ref_dt", ref_dt)
+        object.__setattr__(self, "pillars", pillars)
+        object.__setattr__(self, "dfs", dfs)
+        object.__setattr__(
+            self,
+            "interpolator",
+            LogDfInterpolator(
+                times=np.concatenate(
+                    ([0.0], self.daycounter.count_many(ref_dt, pillars))
+                ),
+                log_dfs=np.concatenate(([0.0], np.log(dfs))),
+                method=self.interpolation,
+            ),
+        )
+
+    @classmethod
+    def from_zero_rates(
+        cls: type[Self],
+        ref_dt: np.datetime64,
+        pillars: ArrayLike,
+        zero_rates: ArrayLike,
+        daycounter: Daycounter,
+        interpolation: Interpolation = Interpolation.LINEAR_LOG_DF,
+    ) -> Self:
+        """Construct a curve from continuously compounded zero rates at its pillars.
+
+        Args:
+            ref_dt: Reference date of the curve.
+            pillars: Pillar dates.
+            zero_rates: Zero rate at each pillar.
+            daycounter: Daycounter measuring time along the curve.
+            interpolation: The interpolation method. Defaults to ``LINEAR_LOG_DF``.
+
+        Returns:
+            DiscountCurve.
+        """
+        times = daycounter.count_many(ref_dt, pillars)
+        return cls(
+            ref_dt=ref_dt,
+            pillars=np.asarray(pillars, dtype="M8[D]"),
+            dfs=np.exp(-np.asarray(zero_rates, dtype=np.float64) * times),
+            daycounter=daycounter,
+            interpolation=interpolation,
+        )
+
+    @property
+    def pillar_times(self: Self) -> NDArray[np.float64]:
+        """Get the curve time of each pillar."""
+        return self.interpolator.times[1:]
+
+    def times(self: Self, dts: ArrayLike) -> NDArray[np.float64]:
+        """Get the curve time of each of the input dates.
+
+        Args:
+            dts: Dates on or after the reference date.
+
+        Returns:
+            Year fraction from the reference date to each date.
+        """
+        dts = np.asarray(dts, dtype="M8[D]")
+        if np.any(dts < self.ref_dt):
+            msg = f"Cannot evaluate the curve before its reference date {self.ref_dt}!"
+            raise ValueError(msg)
+
+        return self.daycounter.count_many(self.ref_dt, dts)
+
+    def df(self: Self, dts: ArrayLike) -> NDArray[np.float64]:
+        """Get the discount factors of the input dates.
+
+        Args:
+            dts: Dates on or after the reference date.
+
+        Returns:
+            Discount factor of each date.
+        """
+        dts = np.asarray(dts, dtype="M8[D]")
+        grid = _day_grid(dts)
+        if grid is not None:
+            days, first, n_days = grid
+            dates = first + np.arange(n_days).astype("m8[D]")
+            return np.exp(self.interpolator(self.times(dates)))[days]
+
+        return np.exp(self.interpolator(self.times(dts)))
+
+    def jacobian(self: Self, dts: ArrayLike) -> LogDfJacobian:
+        """Differentiate the log discount factors of the input dates.
+
+        Args:
+            dts: Dates on or after the reference date.
+
+        Returns:
+            Jacobian of the log dfs of ``dts`` w.r.t. the pillar log dfs.
+        """
+        dts = np.asarray(dts, dtype="M8[D]").ravel()
+        grid = _day_grid(dts)
+        if grid is not None:
+            days, first, n_days = grid
+            dates = first + np.arange(n_days).astype("m8[D]")
+            return self.interpolator.jacobian(self.times(dates)).take(days)
+
+        return self.interpolator.jacobian(self.times(dts))
+
+    def zero_rates(self: Self, dts: ArrayLike) -> NDArray[np.float64]:
+        """Get the continuously compounded zero rates of the input dates.
+
+        Args:
+            dts: Dates on or after the reference date; the zero rate of the
+                reference date itself is the short rate.
+
+        Returns:
+            Zero rate of each date.
+        """
+        times = self.times(dts)
+        return np.divide(
+            -self.interpolator(times),
+            times,
+            out=np.full(times.shape, self.interpolator.short_rate),
+            where=times > 0.0,
+        )
+
+    def forward_rates(
+        self: Self, starts: ArrayLike, ends: ArrayLike
+    ) -> NDArray[np.float64]:
+        """Get the simply compounded forward rates of periods.
+
+        Args:
+            starts: Start dates of the periods.
+            ends: End dates of the periods.
+
+        Returns:
+            Forward rate of each period, accruing under the curve's daycounter.
+        """
+        growth = np.exp(
+            self.interpolator(self.times(starts)) - self.interpolator(self.times(ends))
+        )
+        return (growth - 1.0) / self.daycounter.count_many(starts, ends)
+
+
+def _day_grid(
+    dts: NDArray[np.datetime64],
+) -> tuple[NDArray[np.int64], np.datetime64, int] | None:
+    """Day offsets of dates from the first of them, if there are fewer days than dates.
+
+    Cashflow dates of a large book repeat heavily, in which case evaluating the curve
+    once per day of the range and looking the dates up is much cheaper.
+    """
+    if dts.size <= 1:
+        return None
+
+    first = dts.min()
+    if np.isnat(first):
+        return None
+
+    days = (dts - first).astype(np.int64)
+    n_days = int(days.max()) + 1
+    if n_days >= dts.size:
+        return None
+
+    return days, first, n_days
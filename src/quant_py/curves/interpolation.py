@@ -0,0 +1,383 @@
+"""Interpolation of log discount factors between curve nodes."""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+class Interpolation(Enum):
+    """Enumerate the interpolation methods of discount curves."""
+
+    LINEAR_LOG_DF = "linear_log_df"
+    MONOTONE_CONVEX = "monotone_convex"
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class LogDfInterpolator:
+    """Interpolate log discount factors between curve nodes.
+
+    Both methods are expressed through the discrete forward rate ``fd_i`` of each
+    node interval and, for monotone convex, the instantaneous forward ``f_i`` at each
+    node (Hagan & West, without the positivity collar). The interpolated log df is
+    then ``log_df[i - 1] - width * (x * fd_i + G(x))`` where ``x`` is the position
+    within the interval and ``G`` integrates the forward's deviation from ``fd_i``.
+    ``G`` vanishes under linear on log df interpolation. Past the last node log dfs
+    are extrapolated with the last discrete forward rate.
+
+    Attributes:
+        times: Strictly increasing node times, starting at 0.
+        log_dfs: Log discount factor at each node, starting at 0.
+        method: The interpolation method. Defaults to ``LINEAR_LOG_DF``.
+    """
+
+    times: NDArray[np.float64]
+    log_dfs: NDArray[np.float64]
+    method: Interpolation = Interpolation.LINEAR_LOG_DF
+    _fd_map: NDArray[np.float64] = field(init=False, repr=False)
+    _f_map: NDArray[np.float64] = field(init=False, repr=False)
+    _fd: NDArray[np.float64] = field(init=False, repr=False)
+    _f: NDArray[np.float64] = field(init=False, repr=False)
+
+    def __post_init__(self: Self) -> None:
+        """Validate the nodes and tabulate the node forward rates."""
+        times = np.asarray(self.times, dtype=np.float64)
+        log_dfs = np.asarray(self.log_dfs, dtype=np.float64)
+        if times.ndim != 1 or times.shape != log_dfs.shape or times.size < 2:  # noqa: PLR2004
+            msg = "Need matching node times and log dfs for at least one pillar!"
+            raise ValueError(msg)
+
+        if times[0] != 0.0 or log_dfs[0] != 0.0 or np.any(np.diff(times) <= 0.0):
+            msg = "Node times must be strictly increasing from 0 with log df 0!"
+            raise ValueError(msg)
+
+        # row i maps the node log dfs to fd_i (row 0 is unused) and to f_i
+        n = times.size - 1
+        widths = np.diff(times)
+        rows = np.arange(1, n + 1)
+        fd_map = np.zeros((n + 1, n + 1))
+        fd_map[rows, rows] = -1.0 / widths
+        fd_map[rows, rows - 1] = 1.0 / widths
+
+        fd_to_f = np.zeros((n + 1, n + 1))
+        if n == 1:
+            fd_to_f[:, 1] = 1.0
+        else:
+            inner = np.arange(1, n)
+            span = times[inner + 1] - times[inner - 1]
+            fd_to_f[inner, inner] = widths[inner] / span
+            fd_to_f[inner, inner + 1] = widths[inner - 1] / span
+            fd_to_f[0] = -0.5 * fd_to_f[1]
+            fd_to_f[0, 1] += 1.5
+            fd_to_f[n] = -0.5 * fd_to_f[n - 1]
+            fd_to_f[n, n] += 1.5
+        f_map = fd_to_f @ fd_map
+
+        object.__setattr__(self, "times", times)
+        object.__setattr__(self, "log_dfs", log_dfs)
+        object.__setattr__(self, "_fd_map", fd_map)
+        object.__setattr__(self, "_f_map", f_map)
+        object.__setattr__(self, "_fd", fd_map @ log_dfs)
+        object.__setattr__(self, "_f", f_map @ log_dfs)
+
+    @property
+    def short_rate(self: Self) -> float:
+        """Get the instantaneous forward rate at time 0."""
+        if self.method == Interpolation.MONOTONE_CONVEX:
+            return float(self._f[0])
+
+        return float(self._fd[1])
+
+    def __call__(self: Self, times: ArrayLike) -> NDArray[np.float64]:
+        """Interpolate the log discount factors at the input times.
+
+        Args:
+            times: Non-negative times to interpolate at.
+
+        Returns:
+            Log discount factor at each time.
+        """
+        idx, x, widths = self._locate(times)
+        convexity, _, _ = self._convexity(idx, x)
+        return self.log_dfs[idx - 1] - widths * (x * self._fd[idx] + convexity)
+
+    def interpolate_many(
+        self: Self, log_dfs: ArrayLike, times: ArrayLike
+    ) -> NDArray[np.float64]:
+        """Interpolate many sets of node log dfs on the same node times at once.
+
+        The interval each time falls in only depends on the node times, so it is
+        located once, and the forwards of every set come from one matrix product.
+
+        Args:
+            log_dfs: (sets x nodes) matrix of node log dfs, each starting at 0.
+            times: Non-negative times to interpolate at.
+
+        Returns:
+            (sets x times) matrix of log discount factors.
+        """
+        log_dfs = np.asarray(log_dfs, dtype=np.float64)
+        if log_dfs.ndim != 2 or log_dfs.shape[1] != self.times.size:  # noqa: PLR2004
+            msg = "Need a row of log dfs per set with one log df per node!"
+            raise ValueError(msg)
+
+        idx, x, widths = self._locate(times)
+        fd = (log_dfs @ self._fd_map.T)[:, idx]
+        convexity = np.zeros(fd.shape)
+        if self.method == Interpolation.MONOTONE_CONVEX:
+            f = log_dfs @ self._f_map.T
+            convexity, _, _ = _monotone_convex(
+                np.broadcast_to(np.minimum(x, 1.0), fd.shape),
+                f[:, idx - 1] - fd,
+                f[:, idx] - fd,
+            )
+        return log_dfs[:, idx - 1] - widths * (x * fd + convexity)
+
+    def jacobian(self: Self, times: ArrayLike) -> LogDfJacobian:
+        """Differentiate the interpolated log discount factors w.r.t. the nodes.
+
+        Args:
+            times: Non-negative times to interpolate at.
+
+        Returns:
+            Jacobian of the log dfs at ``times`` w.r.t. the node log dfs (excluding
+            the fixed node at time 0).
+        """
+        idx, x, widths = self._locate(times)
+        _, d_g0, d_g1 = self._convexity(idx, x)
+        return LogDfJacobian(
+            idx=idx,
+            fd_coefs=-widths * (x - d_g0 - d_g1),
+            f_left_coefs=-widths * d_g0,
+            f_right_coefs=-widths * d_g1,
+            fd_map=self._fd_map,
+            f_map=self._f_map,
+        )
+
+    def _locate(
+        self: Self, times: ArrayLike
+    ) -> tuple[NDArray[np.int64], NDArray[np.float64], NDArray[np.float64]]:
+        """Node interval, position within it and width of each time's interval."""
+        times = np.asarray(times, dtype=np.float64)
+        if np.any(times < 0.0):
+            msg = "Cannot interpolate before the first node!"
+            raise ValueError(msg)
+
+        idx = np.clip(np.searchsorted(self.times, times), 1, self.times.size - 1)
+        widths = self.times[idx] - self.times[idx - 1]
+        return idx, (times - self.times[idx - 1]) / widths, widths
+
+    def _convexity(
+        self: Self, idx: NDArray[np.int64], x: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """``G`` with its partials w.r.t. ``g0`` and ``g1`` of each interval."""
+        if self.method == Interpolation.LINEAR_LOG_DF:
+            zeros = np.zeros(x.shape)
+            return zeros, zeros, zeros
+
+        fd = self._fd[idx]
+        return _monotone_convex(
+            np.minimum(x, 1.0), self._f[idx - 1] - fd, self._f[idx] - fd
+        )
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class LogDfJacobian:
+    """Sparse Jacobian of interpolated log discount factors w.r.t. the nodes.
+
+    Each interpolated log df depends linearly on its interval's left node, the
+    interval's discrete forward and the forwards at the interval's two nodes, which
+    are themselves linear in the node log dfs.
+
+    Attributes:
+        idx: Node interval of each interpolated time.
+        fd_coefs: Partial w.r.t. the interval's discrete forward.
+        f_left_coefs: Partial w.r.t. the forward at the interval's left node.
+        f_right_coefs: Partial w.r.t. the forward at the interval's right node.
+        fd_map: Map from the node log dfs to the discrete forwards.
+        f_map: Map from the node log dfs to the node forwards.
+    """
+
+    idx: NDArray[np.int64]
+    fd_coefs: NDArray[np.float64]
+    f_left_coefs: NDArray[np.float64]
+    f_right_coefs: NDArray[np.float64]
+    fd_map: NDArray[np.float64]
+    f_map: NDArray[np.float64]
+
+    def dense(self: Self) -> NDArray[np.float64]:
+        """Get the Jacobian as a dense (times x pillars) matrix."""
+        jac = (
+            self.fd_coefs[:, np.newaxis] * self.fd_map[self.idx]
+            + self.f_left_coefs[:, np.newaxis] * self.f_map[self.idx - 1]
+            + self.f_right_coefs[:, np.newaxis] * self.f_map[self.idx]
+        )
+        jac[np.arange(self.idx.size), self.idx - 1] += 1.0
+        return jac[:, 1:]
+
+    def pullback(
+        self: Self,
+        grad: ArrayLike,
+        rows: ArrayLike | None = None,
+        n_rows: int | None = None,
+    ) -> NDArray[np.float64]:
+        """Pull a gradient back from the interpolated log dfs to the nodes.
+
+        Computes the transposed Jacobian product in a single reverse pass without
+        forming the dense Jacobian. With ``rows`` the interpolated log dfs are split
+        into groups, e.g. the cashflows of each trade, and each group is pulled back
+        separately.
+
+        Args:
+            grad: Gradient w.r.t. each interpolated log df.
+            rows: Group of each interpolated log df. Defaults to None (one group).
+            n_rows: Number of groups. Defaults to None (one more than the largest
+                group in ``rows``).
+
+        Returns:
+            Gradient w.r.t. each pillar log df, or a (groups x pillars) matrix of
+            them if ``rows`` is given.
+        """
+        grad = np.asarray(grad, dtype=np.float64)
+        n_nodes = self.fd_map.shape[0]
+        grouped = rows is not None
+        rows = np.zeros(grad.shape, np.int64) if rows is None else np.asarray(rows)
+        if n_rows is None:
+            n_rows = int(rows.max()) + 1 if rows.size else 0
+
+        def scatter(
+            nodes: NDArray[np.int64], weights: NDArray[np.float64]
+        ) -> NDArray[np.float64]:
+            sums = np.bincount(
+                rows * n_nodes + nodes, weights, minlength=n_rows * n_nodes
+            )
+            return sums.reshape(n_rows, n_nodes)
+
+        left = self.idx - 1
+        rslt = scatter(left, grad)
+        rslt += scatter(self.idx, self.fd_coefs * grad) @ self.fd_map
+        rslt += (
+            scatter(left, self.f_left_coefs * grad)
+            + scatter(self.idx, self.f_right_coefs * grad)
+        ) @ self.f_map
+        return rslt[:, 1:] if grouped else rslt[0, 1:]
+
+    def take(self: Self, indices: NDArray[np.int64]) -> LogDfJacobian:
+        """Get the Jacobian of a selection of the interpolated log dfs.
+
+        Args:
+            indices: Positions of the interpolated log dfs to select.
+
+        Returns:
+            LogDfJacobian of the selected log dfs.
+        """
+        return LogDfJacobian(
+            idx=self.idx[indices],
+            fd_coefs=self.fd_coefs[indices],
+            f_left_coefs=self.f_left_coefs[indices],
+            f_right_coefs=self.f_right_coefs[indices],
+            fd_map=self.fd_map,
+            f_map=self.f_map,
+        )
+
+
+def _monotone_convex(
+    x: NDArray[np.float64], g0: NDArray[np.float64], g1: NDArray[np.float64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Integrated forward deviation of Hagan & West's monotone convex method.
+
+    Returns ``G(x)`` and its partials w.r.t. ``g0`` and ``g1`` for each of the four
+    sectors of the ``(g0, g1)`` plane; ``G`` is zero where ``g0 = g1 = 0``.
+    """
+    rslt = np.zeros((3, *x.shape))
+    ii = ((g0 < 0.0) & (-0.5 * g0 <= g1) & (g1 <= -2.0 * g0)) | (
+        (g0 > 0.0) & (-0.5 * g0 >= g1) & (g1 >= -2.0 * g0)
+    )
+    iii = ~ii & (((g0 < 0.0) & (g1 > -2.0 * g0)) | ((g0 > 0.0) & (g1 < -2.0 * g0)))
+    iv = ~ii & ~iii & (g0 * g1 < 0.0)
+    v = ~ii & ~iii & ~iv & ((g0 != 0.0) | (g1 != 0.0))
+    for sector, fn in (
+        (ii, _sector_ii),
+        (iii, _sector_iii),
+        (iv, _sector_iv),
+        (v, _sector_v),
+    ):
+        rslt[:, sector] = fn(x[sector], g0[sector], g1[sector])
+    return rslt[0], rslt[1], rslt[2]
+
+
+def _sector_ii(
+    x: NDArray[np.float64], g0: NDArray[np.float64], g1: NDArray[np.float64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Quadratic forward deviation."""
+    a = x * (1.0 - x) ** 2
+    b = x**2 * (x - 1.0)
+    return g0 * a + g1 * b, a, b
+
+
+def _sector_iii(
+    x: NDArray[np.float64], g0: NDArray[np.float64], g1: NDArray[np.float64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Deviation flat at ``g0`` then quadratic up to ``g1``."""
+    eta = (g1 + 2.0 * g0) / (g1 - g0)
+    z = np.maximum(x - eta, 0.0) / (1.0 - eta)
+    d_g1 = -(z**2) * (1.0 - x)
+    return g0 * (x - z**3), x - z**3 - d_g1 * g1 / g0, d_g1
+
+
+def _sector_iv(
+    x: NDArray[np.float64], g0: NDArray[np.float64], g1: NDArray[np.float64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Deviation quadratic from ``g0`` then flat at ``g1``."""
+    eta = 3.0 * g1 / (g1 - g0)
+    w = np.maximum(eta - x, 0.0) / eta
+    d_g0 = w**2 * x
+    return g1 * (x - 1.0 + w**3), d_g0, x - 1.0 + w**3 - d_g0 * g0 / g1
+
+
+def _sector_v(
+    x: NDArray[np.float64], g0: NDArray[np.float64], g1: NDArray[np.float64]
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Deviation quadratic from ``g0`` down to ``A`` then up to ``g1``."""
+    total = g0 + g1
+    eta = g1 / total
+    a = -g0 * g1 / total
+    p = g0 * g1 / (3.0 * total**2)
+    alpha = g0 + 2.0 * g1
+    beta = g1 + 2.0 * g0
+    before = x < eta
+    after = x > eta
+    w = np.divide(eta - x, eta, out=np.zeros(x.shape), where=before)
+    z = np.divide(x - eta, 1.0 - eta, out=np.zeros(x.shape), where=after)
+    dw_deta = np.divide(x, eta**2, out=np.zeros(x.shape), where=before)
+    dz_deta = np.divide(x - 1.0, (1.0 - eta) ** 2, out=np.zeros(x.shape), where=after)
+
+    shape = alpha * (1.0 - w**3) + beta * z**3
+    d_shape_deta = -3.0 * alpha * w**2 * dw_deta + 3.0 * beta * z**2 * dz_deta
+    d_g0 = (
+        -(g1**2) / total**2 * x
+        + g1 * (g1 - g0) / (3.0 * total**3) * shape
+        + p * ((1.0 - w**3) + 2.0 * z**3)
+        + p * d_shape_deta * (-g1 / total**2)
+    )
+    d_g1 = (
+        -(g0**2) / total**2 * x
+        + g0 * (g0 - g1) / (3.0 * total**3) * shape
+        + p * (2.0 * (1.0 - w**3) + z**3)
+        + p * d_shape_deta * (g0 / total**2)
+    )
+    return a * x + p * shape, d_g0, d_g1
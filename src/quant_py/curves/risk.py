@@ -0,0 +1,142 @@
+"""Curve risk of books of products by reverse mode differentiation."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple, Self
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from quant_py.curves.bootstrap import BootstrapResult
+    from quant_py.curves.discount_curve import DiscountCurve
+
+_BP = 1e-4
+
+
+class Exposures(NamedTuple):
+    """PVs of a book of trades as linear functions of discount factors.
+
+    The PV of trade ``i`` is the sum of ``amounts * df(dates)`` over the rows with
+    ``trades == i``. Amounts must not depend on the discount factors, though they
+    may depend on fixings realized before the curve's reference date.
+
+    Attributes:
+        dates: Date of each exposure.
+        amounts: Amount exposed to the discount factor of each date.
+        trades: Trade of each exposure.
+        n_trades: Number of trades in the book.
+    """
+
+    dates: NDArray[np.datetime64]
+    amounts: NDArray[np.float64]
+    trades: NDArray[np.int64]
+    n_trades: int
+
+    @classmethod
+    def concat(cls: type[Self], *exposures: Exposures) -> Self:
+        """Combine the exposures of several parts of the same trades.
+
+        Args:
+            exposures: Exposures of the same book of trades, e.g. of each leg.
+
+        Returns:
+            The combined exposures.
+        """
+        n_trades = {exp.n_trades for exp in exposures}
+        if len(n_trades) != 1:
+            msg = "Can only combine exposures of the same number of trades!"
+            raise ValueError(msg)
+
+        return cls(
+            dates=np.concatenate([exp.dates for exp in exposures]),
+            amounts=np.concatenate([exp.amounts for exp in exposures]),
+            trades=np.concatenate([exp.trades for exp in exposures]),
+            n_trades=n_trades.pop(),
+        )
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class CurveRisk:
+    """PVs of a book of trades and their gradients w.r.t. a curve's pillars.
+
+    The gradients of every trade are computed together in one reverse pass, by
+    pulling the adjoints ``amount * df`` of the log dfs of the exposure dates back
+    through the curve interpolation. Bucketed risk then costs a valuation rather
+    than one revaluation per pillar.
+
+    Attributes:
+        curve: The curve the trades are risked on.
+        pvs: PV of each trade.
+        gradients: (trades x pillars) matrix of the derivatives of the PVs w.r.t.
+            the pillar log dfs.
+    """
+
+    curve: DiscountCurve
+    pvs: NDArray[np.float64]
+    gradients: NDArray[np.float64]
+
+    @classmethod
+    def of(cls: type[Self], curve: DiscountCurve, exposures: Exposures) -> Self:
+        """Value and differentiate a book of trades on a curve.
+
+        Args:
+            curve: The curve to risk the trades on.
+            exposures: Exposures of the trades to the curve's discount factors.
+
+        Returns:
+            CurveRisk.
+        """
+        adjoints = exposures.amounts * curve.df(exposures.dates)
+        return cls(
+            curve=curve,
+            pvs=np.bincount(exposures.trades, adjoints, minlength=exposures.n_trades),
+            gradients=curve.jacobian(exposures.dates).pullback(
+                adjoints, exposures.trades, exposures.n_trades
+            ),
+        )
+
+    def bucketed_dv01(self: Self) -> NDArray[np.float64]:
+        """Get the change in PV of each trade per bp rise in each pillar zero rate.
+
+        Returns:
+            (trades x pillars) matrix of zero rate DV01s.
+        """
+        return -_BP * self.gradients * self.curve.pillar_times
+
+    def key_rate_durations(self: Self) -> NDArray[np.float64]:
+        """Get the duration of each trade w.r.t. each pillar zero rate.
+
+        Returns:
+            (trades x pillars) matrix of key rate durations; summed over the pillars
+            they give each trade's duration to a parallel shift.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.gradients * self.curve.pillar_times / self.pvs[:, np.newaxis]
+
+    def quote_dv01(self: Self, result: BootstrapResult) -> NDArray[np.float64]:
+        """Get the change in PV of each trade per bp rise in each bootstrap quote.
+
+        The pillar log dfs move with the quotes so that the quoted swaps stay at
+        par; by the implicit function theorem their response is
+        ``-inv(J) @ diag(annuities)`` where ``J`` is the Jacobian of the quoted
+        swaps' PVs w.r.t. the pillar log dfs, so a single linear solve maps all the
+        gradients to quote risk.
+
+        Args:
+            result: Result of the bootstrap which built the curve.
+
+        Returns:
+            (trades x quotes) matrix of quote DV01s.
+        """
+        if not np.array_equal(result.curve.pillars, self.curve.pillars):
+            msg = "Bootstrap result does not match the pillars of the curve!"
+            raise ValueError(msg)
+
+        adjoints = np.linalg.solve(result.jacobian.T, self.gradients.T).T
+        return -_BP * adjoints * result.annuities
@@ -0,0 +1,100 @@
+"""Repricing of books of products under many curve scenarios at once."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from quant_py.products.ragged import segment_sums
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from quant_py.curves.discount_curve import DiscountCurve
+    from quant_py.curves.risk import Exposures
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class ScenarioEngine:
+    """Reprice a book of trades under shocks to a curve's pillar zero rates.
+
+    All the scenario independent work, i.e. the schedules, year fractions and
+    realized fixings behind the exposures, the curve times of the exposure dates
+    and the interval of the curve each falls in, is done once. Exposures of a
+    trade to the same date are merged. Each batch of scenarios then interpolates
+    the distinct dates for all its scenarios in one pass and sums the exposures of
+    every trade.
+
+    Attributes:
+        curve: The base curve the scenarios shock.
+        exposures: Exposures of the book to the curve's discount factors.
+        max_block: Maximum number of scenario exposures (scenarios times merged
+            exposures) held in memory at once. Defaults to 2**22.
+    """
+
+    curve: DiscountCurve
+    exposures: Exposures
+    max_block: int = 2**22
+    _times: NDArray[np.float64] = field(init=False, repr=False)
+    _date_idx: NDArray[np.int64] = field(init=False, repr=False)
+    _amounts: NDArray[np.float64] = field(init=False, repr=False)
+    _offsets: NDArray[np.int64] = field(init=False, repr=False)
+
+    def __post_init__(self: Self) -> None:
+        """Merge the exposures per trade and date and tabulate the dates' times."""
+        dates, date_idx = np.unique(self.exposures.dates, return_inverse=True)
+        keys, merged = np.unique(
+            self.exposures.trades * dates.size + date_idx, return_inverse=True
+        )
+        trades = keys // max(dates.size, 1)
+        offsets = np.searchsorted(trades, np.arange(self.exposures.n_trades + 1))
+        object.__setattr__(self, "_times", self.curve.times(dates))
+        object.__setattr__(self, "_date_idx", keys % max(dates.size, 1))
+        object.__setattr__(
+            self, "_amounts", np.bincount(merged, self.exposures.amounts)
+        )
+        object.__setattr__(self, "_offsets", offsets)
+
+    @property
+    def n_trades(self: Self) -> int:
+        """Get the number of trades in the book."""
+        return self.exposures.n_trades
+
+    def pvs(self: Self, shocks: ArrayLike) -> NDArray[np.float64]:
+        """Reprice the book under each scenario.
+
+        Each scenario shifts the continuously compounded zero rate of every pillar
+        of the curve, keeping its interpolation; a parallel shift of ``s`` is a
+        row of ``s``, and a scenario of zeros reprices on the base curve.
+
+        Args:
+            shocks: (scenarios x pillars) matrix of zero rate shifts.
+
+        Returns:
+            (scenarios x trades) matrix of PVs.
+        """
+        shocks = np.asarray(shocks, dtype=np.float64)
+        pillar_times = self.curve.pillar_times
+        if shocks.ndim != 2 or shocks.shape[1] != pillar_times.size:  # noqa: PLR2004
+            msg = "Need a row of shocks per scenario with one shock per pillar!"
+            raise ValueError(msg)
+
+        interpolator = self.curve.interpolator
+        log_dfs = np.zeros((shocks.shape[0], pillar_times.size + 1))
+        log_dfs[:, 1:] = interpolator.log_dfs[1:] - shocks * pillar_times
+
+        pvs = np.empty((shocks.shape[0], self.n_trades))
+        block = max(1, self.max_block // max(self._amounts.size, 1))
+        for start in range(0, shocks.shape[0], block):
+            rows = slice(start, start + block)
+            # (dates x scenarios) so each gathered exposure is a contiguous row
+            log_dfs_block = interpolator.interpolate_many(log_dfs[rows], self._times)
+            dfs = np.exp(np.ascontiguousarray(log_dfs_block.T))
+            values = dfs[self._date_idx] * self._amounts[:, np.newaxis]
+            pvs[rows] = segment_sums(values, self._offsets).T
+        return pvs
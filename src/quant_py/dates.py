@@ -0,0 +1,272 @@
+"""Calendar arithmetic on serial day numbers and ``datetime64[D]`` arrays.
+
+Internally dates are serial day numbers, i.e. the number of days since 1970-01-01,
+which is exactly the integer representation of a ``datetime64[D]``. Year, month
+and day are decoded from them with int32 arithmetic rather than numpy's datetime
+unit conversions. Single dates are handled as ``datetime.date`` (of which
+``pendulum.Date`` is a subclass) and keep the type they were given, so pendulum is
+only needed at the public API boundary, and is only imported once it is.
+"""
+
+from calendar import isleap
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from quant_py.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import ArrayLike, NDArray
+    from pendulum.date import Date
+    from pendulum.duration import Duration
+
+pendulum = lazy_import("pendulum")
+
+# serial day number of 0000-03-01, the start of the first 400 year era
+_ERA_START = -719_468
+_DAYS_PER_ERA = 146_097
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# serial day number NaT is stored as
+_NAT = np.iinfo(np.int64).min
+# number of dates decoded at once, small enough for the temporaries to stay in cache
+_BLOCK = 2**14
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def tenor_in_months(tenor: Duration) -> int | None:
+    """Get the number of months in a month/year based tenor.
+
+    Mirrors how ``pendulum.Date`` applies a ``Duration``: only the years, months,
+    weeks and remaining days components are used.
+
+    Args:
+        tenor: The tenor to convert.
+
+    Returns:
+        Total number of months, or None if the tenor has a week or day component.
+    """
+    if tenor.weeks or tenor.remaining_days:
+        return None
+
+    return 12 * tenor.years + tenor.months
+
+
+def add_tenor(dt: date, tenor: Duration, n: int = 1) -> date:
+    """Add a multiple of a tenor to a date.
+
+    Matches ``pendulum.Date`` arithmetic for any ``datetime.date``: the months are
+    added first, clamping to the end of shorter months, then the weeks and days.
+
+    Args:
+        dt: The date to shift.
+        tenor: The tenor to add.
+        n: Number of tenors to add; negative to subtract. Defaults to 1.
+
+    Returns:
+        The shifted date, of the same type as ``dt``.
+    """
+    months = n * (12 * tenor.years + tenor.months)
+    if months:
+        dt = roll_months(dt, months, dt.day)
+
+    days = n * (7 * tenor.weeks + tenor.remaining_days)
+    return dt + timedelta(days=days) if days else dt
+
+
+def roll_months(dt: date, months: int, roll_day: int) -> date:
+    """Shift a date by whole months and set its day of month.
+
+    Args:
+        dt: The date to shift.
+        months: Number of months to shift by; may be negative.
+        roll_day: Day of the month to roll to (1-31), clamped to the last day of
+            shorter months.
+
+    Returns:
+        The rolled date, of the same type as ``dt``.
+    """
+    year, month = divmod(12 * dt.year + dt.month - 1 + months, 12)
+    if roll_day > 28:  # noqa: PLR2004
+        roll_day = min(roll_day, _MONTH_DAYS[month] + (month == 1 and isleap(year)))
+    return type(dt)(year, month + 1, roll_day)
+
+
+def days_in_month(months: NDArray[np.datetime64]) -> NDArray[np.int32]:
+    """Get the number of calendar days in each month.
+
+    Args:
+        months: ``datetime64[M]`` array of months.
+
+    Returns:
+        Number of days in each month.
+    """
+    shifted = _shifted_months(months)
+    return _month_start(shifted + 1) - _month_start(shifted)
+
+
+def roll_to_day(
+    months: NDArray[np.datetime64], roll_day: ArrayLike
+) -> NDArray[np.datetime64]:
+    """Set the day of month, clamping to the last day of shorter months.
+
+    Args:
+        months: ``datetime64[M]`` array of months.
+        roll_day: Day(s) of the month to roll to (1-31).
+
+    Returns:
+        ``datetime64[D]`` array of rolled dates.
+    """
+    shifted = _shifted_months(months)
+    first = _month_start(shifted)
+    day = np.minimum(
+        np.asarray(roll_day, dtype=np.int32), _month_start(shifted + 1) - first
+    )
+    return (first + day - 1).astype(np.int64).view("M8[D]")
+
+
+def ymd(
+    dates: NDArray[np.datetime64],
+) -> tuple[NDArray[np.int32], NDArray[np.int32], NDArray[np.int32]]:
+    """Decompose dates into year, month and day components.
+
+    Args:
+        dates: ``datetime64[D]`` array of dates.
+
+    Returns:
+        Tuple of (year, month, day) integer arrays.
+
+    Raises:
+        ValueError: If any of the dates is NaT.
+    """
+    dates = np.asarray(dates, dtype="M8[D]")
+    if dates.size <= _BLOCK:
+        return _civil(dates.view(np.int64))
+
+    # decode in blocks so the intermediate arrays stay in cache
+    days = dates.reshape(-1).view(np.int64)
+    components = np.empty((3, days.size), dtype=np.int32)
+    for start in range(0, days.size, _BLOCK):
+        block = slice(start, start + _BLOCK)
+        components[:, block] = _civil(days[block])
+    year, month, day = components.reshape((3, *dates.shape))
+    return year, month, day
+
+
+def from_ymd(
+    year: ArrayLike, month: ArrayLike, day: ArrayLike
+) -> NDArray[np.datetime64]:
+    """Compose dates from year, month and day components; the inverse of ``ymd``.
+
+    Args:
+        year: Year of each date.
+        month: Month of each date (1-12).
+        day: Day of month of each date, which must exist in its month.
+
+    Returns:
+        ``datetime64[D]`` array of dates.
+    """
+    shifted = 12 * np.asarray(year, dtype=np.int32) + np.asarray(month, np.int32) - 3
+    days = _month_start(shifted) + np.asarray(day, dtype=np.int32) - 1
+    return days.astype(np.int64).view("M8[D]")
+
+
+def to_date(dt: np.datetime64) -> Date:
+    """Convert a ``datetime64`` scalar to a pendulum ``Date``.
+
+    Args:
+        dt: The date to convert.
+
+    Returns:
+        Equivalent pendulum date.
+
+    Raises:
+        ValueError: If the date is NaT.
+    """
+    value = dt.item()
+    if value is None:
+        msg = "Cannot convert NaT to a date!"
+        raise ValueError(msg)
+
+    return pendulum.Date(value.year, value.month, value.day)
+
+
+def to_dates(dates: NDArray[np.datetime64]) -> list[Date]:
+    """Convert a ``datetime64[D]`` array to a list of pendulum ``Date``.
+
+    Args:
+        dates: The dates to convert.
+
+    Returns:
+        Equivalent pendulum dates.
+    """
+    return [pendulum.Date(dt.year, dt.month, dt.day) for dt in dates.tolist()]
+
+
+def from_dates(dates: Iterable[date]) -> NDArray[np.datetime64]:
+    """Convert dates to a ``datetime64[D]`` array via their ordinals.
+
+    Much faster than letting numpy convert each ``datetime.date`` (or
+    ``pendulum.Date``) object itself.
+
+    Args:
+        dates: The dates to convert.
+
+    Returns:
+        ``datetime64[D]`` array of the dates.
+    """
+    ordinals = np.fromiter((dt.toordinal() for dt in dates), dtype=np.int64)
+    return (ordinals - _EPOCH_ORDINAL).view("M8[D]")
+
+
+def _civil(
+    days: NDArray[np.int64],
+) -> tuple[NDArray[np.int32], NDArray[np.int32], NDArray[np.int32]]:
+    """Hinnant's ``civil_from_days`` on serial day numbers.
+
+    Days are counted in 400 year eras of March based years, so the leap day is the
+    last day of a year.
+    """
+    # NaT would wrap around to a valid looking date in the int32 cast
+    if np.any(days == _NAT):
+        msg = "Cannot decompose NaT into year, month and day!"
+        raise ValueError(msg)
+
+    era_days = days.astype(np.int32) - _ERA_START
+    era = era_days // _DAYS_PER_ERA
+    day_of_era = era_days - era * _DAYS_PER_ERA
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = np.where(shifted_month < 10, shifted_month + 3, shifted_month - 9)  # noqa: PLR2004
+    year = year_of_era + 400 * era + (month <= 2)  # noqa: PLR2004
+    return year, month, day
+
+
+def _shifted_months(months: NDArray[np.datetime64]) -> NDArray[np.int32]:
+    """Count ``datetime64[M]`` months from 0000-03 instead of 1970-01."""
+    return months.view(np.int64).astype(np.int32) + (12 * 1970 - 2)
+
+
+def _month_start(shifted: NDArray[np.int32]) -> NDArray[np.int32]:
+    """Get the serial day number of the first day of each month.
+
+    Months are counted from 0000-03, so each year runs from March to February and
+    its leap day, if any, comes last.
+    """
+    year, month = np.divmod(shifted, 12)
+    return (
+        365 * year
+        + year // 4
+        - year // 100
+        + year // 400
+        + (153 * month + 2) // 5
+        + _ERA_START
+    )
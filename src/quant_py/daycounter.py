@@ -3,18 +3,29 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Self
 
+import numpy as np
+
 if TYPE_CHECKING:
-    from pendulum import Date
+    from datetime import date
+
+    from numpy.typing import ArrayLike, NDArray
 
 
 class Daycounter(ABC):
-    """Interface for daycounter classes."""
+    """Interface for daycounter classes.
+
+    Implementations are frozen dataclasses, so daycounters compare equal when they
+    are the same convention with the same parameters and can be used as cache keys.
+    Single periods take any ``datetime.date`` (e.g. ``pendulum.Date``).
+    """
 
-    def __call__(self: Self, start: Date, end: Date) -> float:  # noqa: D102
+    __slots__ = ()
+
+    def __call__(self: Self, start: date, end: date) -> float:  # noqa: D102
         return self.count(start, end)
 
     @abstractmethod
-    def count(self: Self, start: Date, end: Date) -> float:
+    def count(self: Self, start: date, end: date) -> float:
         """Compute the year fraction between start an end under this convention.
 
         Args:
@@ -24,3 +35,33 @@ class Daycounter(ABC):
         Returns:
             Year fraction.
         """
+
+    def count_many(
+        self: Self, starts: ArrayLike, ends: ArrayLike
+    ) -> NDArray[np.float64]:
+        """Compute the year fractions of many periods under this convention.
+
+        Implementations should override this with a vectorized calculation; the
+        default applies ``count`` to each period.
+
+        Args:
+            starts: Start dates of the periods, convertible to ``datetime64[D]``.
+            ends: End dates of the periods, convertible to ``datetime64[D]``.
+
+        Returns:
+            Year fractions.
+        """
+        starts, ends = np.broadcast_arrays(
+            np.asarray(starts, dtype="M8[D]"), np.asarray(ends, dtype="M8[D]")
+        )
+        year_fracs = np.fromiter(
+            (
+                self.count(start, end)
+                for start, end in zip(
+                    starts.ravel().tolist(), ends.ravel().tolist(), strict=True
+                )
+            ),
+            dtype=np.float64,
+            count=starts.size,
+        )
+        return year_fracs.reshape(starts.shape)
@@ -0,0 +1,35 @@
+"""Act/365 Fixed daycount implementation."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self, override
+
+import numpy as np
+
+from quant_py.daycounter import Daycounter
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class Act365F(Daycounter):
+    """ACT/365F impl."""
+
+    @override
+    def count(self: Self, start: date, end: date) -> float:
+        days = end.toordinal() - start.toordinal()
+        return float(days) / 365.0
+
+    @override
+    def count_many(
+        self: Self, starts: ArrayLike, ends: ArrayLike
+    ) -> NDArray[np.float64]:
+        days = np.asarray(ends, dtype="M8[D]") - np.asarray(starts, dtype="M8[D]")
+        return days.astype(np.float64) / 365.0
@@ -0,0 +1,72 @@
+"""Act/Act daycount implementations."""
+
+from calendar import isleap
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Self, override
+
+import numpy as np
+
+from quant_py.daycounter import Daycounter
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class ActActIsda(Daycounter):
+    """ACT/ACT (ISDA) impl.
+
+    Days falling in leap years are counted over 366, all other days over 365.
+    """
+
+    @override
+    def count(self: Self, start: date, end: date) -> float:
+        if end < start:
+            return -self.count(end, start)
+
+        if start.year == end.year:
+            days = end.toordinal() - start.toordinal()
+            return float(days) / _days_in_year(start.year)
+
+        first = date(start.year + 1, 1, 1).toordinal() - start.toordinal()
+        last = end.toordinal() - date(end.year, 1, 1).toordinal()
+        return (
+            float(first) / _days_in_year(start.year)
+            + float(end.year - start.year - 1)
+            + float(last) / _days_in_year(end.year)
+        )
+
+    @override
+    def count_many(
+        self: Self, starts: ArrayLike, ends: ArrayLike
+    ) -> NDArray[np.float64]:
+        starts = np.asarray(starts, dtype="M8[D]")
+        ends = np.asarray(ends, dtype="M8[D]")
+        sign = np.where(ends < starts, -1.0, 1.0)
+        starts, ends = np.minimum(starts, ends), np.maximum(starts, ends)
+
+        start_year = starts.astype("M8[Y]")
+        end_year = ends.astype("M8[Y]")
+        start_next = (start_year + np.timedelta64(1, "Y")).astype("M8[D]")
+        end_first = end_year.astype("M8[D]")
+        start_denom = (start_next - start_year.astype("M8[D]")).astype(np.float64)
+        end_denom = (
+            (end_year + np.timedelta64(1, "Y")).astype("M8[D]") - end_first
+        ).astype(np.float64)
+
+        same_year = (ends - starts).astype(np.float64) / start_denom
+        first = (start_next - starts).astype(np.float64) / start_denom
+        whole = (end_year - start_year).astype(np.float64) - 1.0
+        last = (ends - end_first).astype(np.float64) / end_denom
+        year_fracs = np.where(start_year == end_year, same_year, first + whole + last)
+        return sign * year_fracs
+
+
+def _days_in_year(year: int) -> float:
+    return 366.0 if isleap(year) else 365.0
@@ -0,0 +1,160 @@
+"""30/360 family of daycount implementations."""
+
+from abc import abstractmethod
+from calendar import monthrange
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self, override
+
+import numpy as np
+
+from quant_py.dates import days_in_month, ymd
+from quant_py.daycounter import Daycounter
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from numpy.typing import ArrayLike, NDArray
+
+
+class Thirty360Base(Daycounter):
+    """Common logic for the 30/360 conventions.
+
+    The conventions only differ in how they adjust the day of month of the start
+    (D1) and end (D2) dates before computing
+    ``(360 * (Y2 - Y1) + 30 * (M2 - M1) + (D2 - D1)) / 360``.
+    """
+
+    __slots__ = ()
+
+    @override
+    def count(self: Self, start: date, end: date) -> float:
+        d1, d2 = self._adjust_days(start, end)
+        days = 360 * (end.year - start.year) + 30 * (end.month - start.month) + d2 - d1
+        return float(days) / 360.0
+
+    @override
+    def count_many(
+        self: Self, starts: ArrayLike, ends: ArrayLike
+    ) -> NDArray[np.float64]:
+        starts = np.asarray(starts, dtype="M8[D]")
+        ends = np.asarray(ends, dtype="M8[D]")
+        y1, m1, d1 = ymd(starts)
+        y2, m2, d2 = ymd(ends)
+        d1, d2 = self._adjust_days_many(starts, ends, d1, d2)
+        days = 360 * (y2 - y1) + 30 * (m2 - m1) + d2 - d1
+        return days.astype(np.float64) / 360.0
+
+    @abstractmethod
+    def _adjust_days(self: Self, start: date, end: date) -> tuple[int, int]:
+        """Adjust the days of month of a single period."""
+
+    @abstractmethod
+    def _adjust_days_many(
+        self: Self,
+        starts: NDArray[np.datetime64],
+        ends: NDArray[np.datetime64],
+        d1: NDArray[np.int32],
+        d2: NDArray[np.int32],
+    ) -> tuple[NDArray[np.int32], NDArray[np.int32]]:
+        """Adjust the days of month of many periods."""
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class Thirty360(Thirty360Base):
+    """30/360 (Bond Basis) impl.
+
+    D1 = min(D1, 30); D2 = 30 if D2 is 31 and D1 is 30.
+    """
+
+    @override
+    def _adjust_days(self: Self, start: date, end: date) -> tuple[int, int]:
+        d1 = min(start.day, 30)
+        d2 = 30 if d1 == 30 and end.day == 31 else end.day  # noqa: PLR2004
+        return d1, d2
+
+    @override
+    def _adjust_days_many(
+        self: Self,
+        starts: NDArray[np.datetime64],
+        ends: NDArray[np.datetime64],
+        d1: NDArray[np.int32],
+        d2: NDArray[np.int32],
+    ) -> tuple[NDArray[np.int32], NDArray[np.int32]]:
+        d1 = np.minimum(d1, 30)
+        return d1, np.where((d1 == 30) & (d2 == 31), 30, d2)  # noqa: PLR2004
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class Thirty360E(Thirty360Base):
+    """30E/360 (Eurobond Basis) impl.
+
+    D1 = min(D1, 30); D2 = min(D2, 30).
+    """
+
+    @override
+    def _adjust_days(self: Self, start: date, end: date) -> tuple[int, int]:
+        return min(start.day, 30), min(end.day, 30)
+
+    @override
+    def _adjust_days_many(
+        self: Self,
+        starts: NDArray[np.datetime64],
+        ends: NDArray[np.datetime64],
+        d1: NDArray[np.int32],
+        d2: NDArray[np.int32],
+    ) -> tuple[NDArray[np.int32], NDArray[np.int32]]:
+        return np.minimum(d1, 30), np.minimum(d2, 30)
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class Thirty360EIsda(Thirty360Base):
+    """30E/360 (ISDA) impl.
+
+    D1 = 30 if the start is the last day of its month; D2 = 30 if the end is the last
+    day of its month, unless the end is the maturity date and falls in February.
+
+    Attributes:
+        maturity: Maturity date of the instrument. Defaults to None.
+    """
+
+    maturity: date | None = None
+
+    @override
+    def _adjust_days(self: Self, start: date, end: date) -> tuple[int, int]:
+        d1 = 30 if start.day == monthrange(start.year, start.month)[1] else start.day
+        d2 = end.day
+        is_feb_maturity = end == self.maturity and end.month == 2  # noqa: PLR2004
+        if d2 == monthrange(end.year, end.month)[1] and not is_feb_maturity:
+            d2 = 30
+        return d1, d2
+
+    @override
+    def _adjust_days_many(
+        self: Self,
+        starts: NDArray[np.datetime64],
+        ends: NDArray[np.datetime64],
+        d1: NDArray[np.int32],
+        d2: NDArray[np.int32],
+    ) -> tuple[NDArray[np.int32], NDArray[np.int32]]:
+        end_months = ends.astype("M8[M]")
+        d1 = np.where(d1 == days_in_month(starts.astype("M8[M]")), 30, d1)
+        is_eom = d2 == days_in_month(end_months)
+        if self.maturity is not None:
+            is_feb = (end_months.astype(np.int64) % 12) == 1
+            is_eom &= ~(is_feb & (ends == np.datetime64(self.maturity, "D")))
+        return d1, np.where(is_eom, 30, d2)
@@ -0,0 +1,162 @@
+"""Historical index fixings."""
+
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class Fixings:
+    """Time series of index fixings stored as parallel columns.
+
+    Attributes:
+        dates: Strictly increasing ``datetime64[D]`` observation dates.
+        values: Fixing on each observation date.
+    """
+
+    dates: NDArray[np.datetime64]
+    values: NDArray[np.float64]
+
+    def __post_init__(self: Self) -> None:
+        """Validate the series and store read-only views of the columns."""
+        dates = np.asarray(self.dates, dtype="M8[D]").view()
+        values = np.asarray(self.values, dtype=np.float64).view()
+        if dates.shape != values.shape or dates.ndim != 1:
+            msg = "Fixing dates and values must be 1-d arrays of equal length!"
+            raise ValueError(msg)
+
+        if np.any(dates[1:] <= dates[:-1]):
+            msg = "Fixing dates must be strictly increasing!"
+            raise ValueError(msg)
+
+        dates.flags.writeable = False
+        values.flags.writeable = False
+        object.__setattr__(self, "dates", dates)
+        object.__setattr__(self, "values", values)
+
+    def __len__(self: Self) -> int:  # noqa: D105
+        return self.dates.size
+
+    def lookup(self: Self, dts: ArrayLike) -> NDArray[np.float64]:
+        """Get the fixings observed on each of the input dates.
+
+        Args:
+            dts: Observation dates, convertible to ``datetime64[D]``.
+
+        Returns:
+            The fixing on each date.
+
+        Raises:
+            ValueError: If any of the dates has no fixing.
+        """
+        dts = np.asarray(dts, dtype="M8[D]")
+        idx = np.minimum(np.searchsorted(self.dates, dts), max(self.dates.size - 1, 0))
+        found = self.dates[idx] == dts if self.dates.size else np.zeros(dts.shape, bool)
+        if not np.all(found):
+            msg = f"Missing fixing for {dts[~found].flat[0]}!"
+            raise ValueError(msg)
+
+        return self.values[idx]
+
+
+class FixingsStore:
+    """Directory of index fixings keyed by ``RateIndexMetadata.name``.
+
+    Each index is stored as a single ``<name>.npy`` record holding its dates and
+    values as contiguous columns, which is memory-mapped read-only on load. Processes
+    on one host loading the same index therefore share its pages instead of each
+    holding a parsed copy.
+
+    Attributes:
+        root: Directory holding the fixings.
+    """
+
+    def __init__(self: Self, root: str | os.PathLike[str]) -> None:
+        """Open a fixings store, creating its directory if needed.
+
+        Args:
+            root: Directory holding the fixings.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._loaded: dict[str, Fixings] = {}
+
+    def __contains__(self: Self, name: str) -> bool:  # noqa: D105
+        return self._path(name).exists()
+
+    def __getitem__(self: Self, name: str) -> Fixings:  # noqa: D105
+        return self.load(name)
+
+    def names(self: Self) -> list[str]:
+        """Get the names of the indices in the store."""
+        return sorted(
+            path.name.removesuffix(".npy") for path in self.root.glob("*.npy")
+        )
+
+    def save(self: Self, name: str, fixings: Fixings) -> None:
+        """Save the fixings of an index, replacing any already stored.
+
+        Both columns are written to one temporary file which is moved into place, so
+        readers never map a partially written file or pair the dates of one save with
+        the values of another.
+
+        Args:
+            name: Name of the index.
+            fixings: The fixings to save.
+        """
+        path = self._path(name)
+        self._loaded.pop(name, None)
+        shape = (len(fixings),)
+        record = np.empty(
+            (), dtype=[("dates", "M8[D]", shape), ("values", np.float64, shape)]
+        )
+        record["dates"] = fixings.dates
+        record["values"] = fixings.values
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=f".{name}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, record)
+        Path(tmp).replace(path)
+
+    def load(self: Self, name: str) -> Fixings:
+        """Load the fixings of an index as read-only memory maps.
+
+        Repeat loads in a process return the same ``Fixings``.
+
+        Args:
+            name: Name of the index.
+
+        Returns:
+            The fixings of the index.
+
+        Raises:
+            KeyError: If the store has no fixings for the index.
+        """
+        fixings = self._loaded.get(name)
+        if fixings is None:
+            if name not in self:
+                msg = f"No fixings stored for {name}!"
+                raise KeyError(msg)
+
+            record = np.load(self._path(name), mmap_mode="r")
+            fixings = Fixings(record["dates"], record["values"])
+            self._loaded[name] = fixings
+        return fixings
+
+    def _path(self: Self, name: str) -> Path:
+        if not name or Path(name).name != name:
+            msg = f"Invalid index name {name!r}!"
+            raise ValueError(msg)
+
+        return self.root / f"{name}.npy"
@@ -1,10 +1,24 @@
 """OIS indices."""
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self, override
 
-from pendulum.duration import Duration
+import numpy as np
 
-from quant_py.rate_index import RateIndexMetadata
+from quant_py.buscal import as_business_calendar
+from quant_py.dates import to_date
+from quant_py.lazy import lazy_import
+from quant_py.rate_index import RateIndex, RateIndexMetadata
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+    from pendulum.date import Date
+    from pendulum.duration import Duration
+
+    from quant_py.buscal import BusinessCalendar
+    from quant_py.fixings import Fixings
+
+pendulum = lazy_import("pendulum")
 
 
 @dataclass(
@@ -17,4 +31,304 @@ class OisRateIndexMetadata(RateIndexMetadata):
     """Metadata for an OIS rate index."""
 
     publish_lag: int
-    tenor: Duration = field(default=Duration(days=1), init=False)
+    tenor: Duration = field(
+        default_factory=lambda: pendulum.Duration(days=1), init=False
+    )
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class OisRateIndex(RateIndex[OisRateIndexMetadata]):
+    """Overnight index compounded in arrears over accrual periods.
+
+    Fixings are keyed by observation date, i.e. the business day the overnight rate
+    applies to, and each fixing accrues until the next business day of the index
+    ``pay_cal``. Subclasses implement the market conventions which observe the
+    fixings earlier so the coupon is known ahead of payment.
+    """
+
+    @override
+    def calc_fixing_dt(self: Self, dt: Date) -> Date:
+        """Calculate the observation date of the fixing accruing on ``dt``.
+
+        Args:
+            dt: Business day of the accrual period.
+
+        Returns:
+            Fixing date.
+        """
+        fixing_dts, _ = self.observations([np.datetime64(dt, "D")])
+        return to_date(fixing_dts[0])
+
+    def observations(
+        self: Self,
+        dts: ArrayLike,
+        ends: ArrayLike | None = None,  # noqa: ARG002
+    ) -> tuple[NDArray[np.datetime64], NDArray[np.float64]]:
+        """Map accrual business days to their fixing dates and compounding weights.
+
+        Args:
+            dts: Business days accruing interest.
+            ends: Accrual end date of the period each day belongs to; only used by
+                conventions which depend on it. Defaults to None.
+
+        Returns:
+            Tuple of the fixing date and the compounding weight of each day.
+        """
+        cal = as_business_calendar(self.metadata.pay_cal)
+        ordinals = cal.ordinal(dts)
+        return cal.from_ordinal(ordinals), self._weights(cal, ordinals)
+
+    def compound(
+        self: Self, fixings: Fixings, starts: ArrayLike, ends: ArrayLike
+    ) -> NDArray[np.float64]:
+        """Compute the compounded rate of many accrual periods at once.
+
+        The daily growth factors ``1 + r * d`` of every business day spanned by the
+        periods are cumulated once, so the compounded rate of each period is the
+        ratio of the cumulative products at its end and start.
+
+        Args:
+            fixings: Fixings of the index.
+            starts: Accrual start dates; must be business days of the index calendar.
+            ends: Accrual end dates; must be business days of the index calendar.
+
+        Returns:
+            Compounded rate of each period.
+        """
+        factors, year_fracs = self._compound(fixings, starts, ends)
+        return (factors - 1.0) / year_fracs
+
+    def growth(
+        self: Self, fixings: Fixings, starts: ArrayLike, ends: ArrayLike
+    ) -> NDArray[np.float64]:
+        """Compute the compounded growth factor of many accrual periods at once.
+
+        Args:
+            fixings: Fixings of the index.
+            starts: Accrual start dates; must be business days of the index calendar.
+            ends: Accrual end dates; must be business days of the index calendar.
+
+        Returns:
+            Growth factor of each period, i.e. one plus its compounded interest.
+        """
+        factors, _ = self._compound(fixings, starts, ends)
+        return factors
+
+    def _compound(
+        self: Self, fixings: Fixings, starts: ArrayLike, ends: ArrayLike
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Growth factor and total compounding weight of each period."""
+        starts = np.asarray(starts, dtype="M8[D]")
+        ends = np.asarray(ends, dtype="M8[D]")
+        if starts.size == 0:
+            return np.empty(starts.shape), np.empty(starts.shape)
+
+        cal = as_business_calendar(self.metadata.pay_cal)
+        start_ordinals = cal.ordinal(starts)
+        end_ordinals = cal.ordinal(ends)
+        first = start_ordinals.min()
+        timeline = cal.from_ordinal(np.arange(first, end_ordinals.max()))
+        fixing_dts, weights = self.observations(timeline)
+
+        growth = np.ones(timeline.size + 1, dtype=np.float64)
+        np.cumprod(1.0 + fixings.lookup(fixing_dts) * weights, out=growth[1:])
+        cum_weights = np.zeros(timeline.size + 1, dtype=np.float64)
+        np.cumsum(weights, out=cum_weights[1:])
+
+        start_idx = start_ordinals - first
+        end_idx = end_ordinals - first
+        return (
+            growth[end_idx] / growth[start_idx],
+            cum_weights[end_idx] - cum_weights[start_idx],
+        )
+
+    def _weights(
+        self: Self, cal: BusinessCalendar, ordinals: NDArray[np.int64]
+    ) -> NDArray[np.float64]:
+        """Year fraction from each business day to the next."""
+        return self.metadata.daycounter.count_many(
+            cal.from_ordinal(ordinals), cal.from_ordinal(ordinals + 1)
+        )
+
+    def _days(self: Self, days: int | None) -> int:
+        """Number of business days of a convention, defaulting to the publish lag."""
+        return self.metadata.publish_lag if days is None else days
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class LookbackOisRateIndex(OisRateIndex):
+    """Overnight index compounded with a lookback.
+
+    Each accrual day observes the fixing ``lookback`` business days earlier, but is
+    weighted by its own accrual days.
+
+    Attributes:
+        lookback: Business days to look back. Defaults to None (the publish lag).
+    """
+
+    lookback: int | None = None
+
+    @override
+    def observations(
+        self: Self, dts: ArrayLike, ends: ArrayLike | None = None
+    ) -> tuple[NDArray[np.datetime64], NDArray[np.float64]]:
+        cal = as_business_calendar(self.metadata.pay_cal)
+        ordinals = cal.ordinal(dts)
+        fixing_dts = cal.from_ordinal(ordinals - self._days(self.lookback))
+        return fixing_dts, self._weights(cal, ordinals)
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class ObservationShiftOisRateIndex(OisRateIndex):
+    """Overnight index compounded with an observation shift.
+
+    The whole observation period is shifted ``shift`` business days earlier, so
+    each fixing is weighted by the days of the shifted period it applies to.
+
+    Attributes:
+        shift: Business days to shift by. Defaults to None (the publish lag).
+    """
+
+    shift: int | None = None
+
+    @override
+    def observations(
+        self: Self, dts: ArrayLike, ends: ArrayLike | None = None
+    ) -> tuple[NDArray[np.datetime64], NDArray[np.float64]]:
+        cal = as_business_calendar(self.metadata.pay_cal)
+        ordinals = cal.ordinal(dts) - self._days(self.shift)
+        return cal.from_ordinal(ordinals), self._weights(cal, ordinals)
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class LockoutOisRateIndex(OisRateIndex):
+    """Overnight index compounded with a lockout.
+
+    The last ``lockout`` business days of each period reuse the fixing of the
+    business day before the lockout starts.
+
+    Attributes:
+        lockout: Business days locked out. Defaults to None (the publish lag).
+    """
+
+    lockout: int | None = None
+
+    @override
+    def observations(
+        self: Self, dts: ArrayLike, ends: ArrayLike | None = None
+    ) -> tuple[NDArray[np.datetime64], NDArray[np.float64]]:
+        """Map accrual business days to their fixing dates and compounding weights.
+
+        Args:
+            dts: Business days accruing interest.
+            ends: Accrual end date of the period each day belongs to. Defaults to
+                None, in which case no day is locked out.
+
+        Returns:
+            Tuple of the fixing date and the compounding weight of each day.
+        """
+        cal = as_business_calendar(self.metadata.pay_cal)
+        ordinals = cal.ordinal(dts)
+        fixing_ordinals = ordinals
+        if ends is not None:
+            cutoffs = cal.ordinal(ends) - self._days(self.lockout) - 1
+            fixing_ordinals = np.minimum(ordinals, cutoffs)
+        return cal.from_ordinal(fixing_ordinals), self._weights(cal, ordinals)
+
+    @override
+    def _compound(
+        self: Self, fixings: Fixings, starts: ArrayLike, ends: ArrayLike
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Growth factor and total compounding weight of each period.
+
+        The days before each lockout compound off the shared cumulative product as
+        for an index in arrears; the at most ``lockout`` locked out days of every
+        period are compounded together as one 2-d block.
+        """
+        starts = np.asarray(starts, dtype="M8[D]")
+        ends = np.asarray(ends, dtype="M8[D]")
+        if starts.size == 0:
+            return np.empty(starts.shape), np.empty(starts.shape)
+
+        cal = as_business_calendar(self.metadata.pay_cal)
+        lockout = self._days(self.lockout)
+        start_ordinals = cal.ordinal(starts)
+        end_ordinals = cal.ordinal(ends)
+        cutoffs = end_ordinals - lockout - 1
+        first = start_ordinals.min()
+        weights = self._weights(cal, np.arange(first, end_ordinals.max()))
+        # days up to the last cutoff observe their own fixing
+        n_free = int(np.clip(cutoffs.max() - first + 1, 0, weights.size))
+        rates = fixings.lookup(cal.from_ordinal(np.arange(first, first + n_free)))
+        growth = np.ones(n_free + 1, dtype=np.float64)
+        np.cumprod(1.0 + rates * weights[:n_free], out=growth[1:])
+
+        start_idx = start_ordinals - first
+        end_idx = end_ordinals - first
+        lock_idx = np.clip(cutoffs - first + 1, start_idx, end_idx)
+        factors = (
+            growth[np.minimum(lock_idx, n_free)] / growth[np.minimum(start_idx, n_free)]
+        )
+
+        if lockout and weights.size:
+            locked = lock_idx[:, np.newaxis] + np.arange(lockout)
+            in_period = locked < end_idx[:, np.newaxis]
+            locked_rates = fixings.lookup(cal.from_ordinal(cutoffs))[:, np.newaxis]
+            locked_weights = weights[np.where(in_period, locked, 0)]
+            locked_growth = np.where(
+                in_period, 1.0 + locked_rates * locked_weights, 1.0
+            )
+            factors *= locked_growth.prod(axis=1)
+
+        cum_weights = np.zeros(weights.size + 1, dtype=np.float64)
+        np.cumsum(weights, out=cum_weights[1:])
+        return factors, cum_weights[end_idx] - cum_weights[start_idx]
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class PaymentDelayOisRateIndex(OisRateIndex):
+    """Overnight index compounded in arrears and paid after a delay.
+
+    Attributes:
+        payment_delay: Business days between the end of each period and its payment.
+            Defaults to None (the publish lag).
+    """
+
+    payment_delay: int | None = None
+
+    def calc_payment_dts(self: Self, ends: ArrayLike) -> NDArray[np.datetime64]:
+        """Calculate the payment date of accrual periods.
+
+        Args:
+            ends: Accrual end dates.
+
+        Returns:
+            Payment date of each period.
+        """
+        cal = as_business_calendar(self.metadata.pay_cal)
+        return cal.add_busdays(ends, self._days(self.payment_delay))
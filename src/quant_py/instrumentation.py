@@ -0,0 +1,265 @@
+"""Opt-in instrumentation of the scheduling and daycounting hot paths.
+
+Calls to business day adjustment, roll convention stepping, daycounting and
+schedule construction are counted and their wall time accumulated, keyed by the
+class of the receiver (e.g. ``"Eom.next"``). Timings are inclusive, so
+``Schedule.of`` includes the roll and adjustment calls it makes; an override
+calling the method it overrides through ``super()`` is recorded once.
+
+Timed wrappers are swapped in for the methods only while instrumentation is in
+use, between ``enable`` and ``disable`` or inside an ``instrumented`` block, so it
+costs nothing otherwise. Subclasses defined while the wrappers are in place are
+wrapped as they are created. ``enable`` records the calls of every thread of the
+process; ``instrumented`` only those made from the block's own context.
+"""
+
+import importlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from threading import RLock
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# (module, class, methods) of the instrumented classes, imported on first use
+_TARGETS = (
+    ("quant_py.scheduling.adjuster", "Adjuster", ("adjust", "adjust_many")),
+    ("quant_py.scheduling.roll_convention", "RollConventions", ("next", "previous")),
+    ("quant_py.daycounter", "Daycounter", ("count", "count_many")),
+    ("quant_py.scheduling.schedule", "Schedule", ("of", "from_periods")),
+    ("quant_py.scheduling.batch", "ScheduleBatch", ("of",)),
+)
+
+type _Stats = dict[tuple[type, str], list[int]]
+
+# reentrant, as wrapping a subclass can happen while the wrappers are installed
+_lock = RLock()
+_installs = 0
+# (class, method name, original attribute) of every swapped in wrapper
+_patched: list[tuple[type, str, Any]] = []
+# (base class, its own __init_subclass__ if any) of every subclass hook
+_hooked: list[tuple[type, classmethod[Any, ..., None] | None]] = []
+
+_recording = False
+# (receiver class, method name) -> [number of calls, total nanoseconds]
+_stats: _Stats = {}
+_scopes: ContextVar[tuple[_Stats, ...]] = ContextVar(
+    "instrumentation_scopes", default=()
+)
+# (receiver id, method name) of the instrumented calls in progress
+_running: ContextVar[frozenset[tuple[int, str]]] = ContextVar(
+    "instrumented_calls", default=frozenset()
+)
+
+
+class CallStats(NamedTuple):
+    """Call statistics of an instrumented method.
+
+    Attributes:
+        calls: Number of calls.
+        seconds: Total wall time spent in the calls.
+    """
+
+    calls: int
+    seconds: float
+
+
+def enable() -> None:
+    """Start recording the calls of every thread to the instrumented methods.
+
+    Does nothing if already enabled.
+    """
+    global _recording  # noqa: PLW0603
+    with _lock:
+        if not _recording:
+            _recording = True
+            _install()
+
+
+def disable() -> None:
+    """Stop recording calls process wide.
+
+    The original methods are restored unless an ``instrumented`` block is still
+    running. The stats recorded so far are kept until ``reset``.
+    """
+    global _recording  # noqa: PLW0603
+    with _lock:
+        if _recording:
+            _recording = False
+            _uninstall()
+
+
+def is_enabled() -> bool:
+    """Check whether calls are being recorded process wide."""
+    return _recording
+
+
+def reset() -> None:
+    """Discard the process wide stats recorded so far."""
+    with _lock:
+        _stats.clear()
+
+
+def snapshot() -> dict[str, CallStats]:
+    """Get the process wide stats recorded so far.
+
+    Returns:
+        Stats of each method called at least once, keyed by "Class.method".
+    """
+    return _format(_stats)
+
+
+@contextmanager
+def instrumented() -> Iterator[dict[str, CallStats]]:
+    """Record the calls made by a block of code.
+
+    Only calls made from the block's context are recorded, i.e. by the thread
+    running it and not by other threads running meanwhile. Blocks nest; the calls
+    of an inner block are recorded by the outer block too.
+
+    Yields:
+        Dict which is filled on exit with the stats of the calls made in the block,
+        keyed as in ``snapshot``.
+    """
+    stats: _Stats = {}
+    result: dict[str, CallStats] = {}
+    _install()
+    token = _scopes.set((*_scopes.get(), stats))
+    try:
+        yield result
+    finally:
+        _scopes.reset(token)
+        _uninstall()
+        result.update(_format(stats))
+
+
+def _install() -> None:
+    """Swap in the wrappers, unless they already are."""
+    global _installs  # noqa: PLW0603
+    with _lock:
+        _installs += 1
+        if _installs > 1:
+            return
+
+        for module, name, methods in _TARGETS:
+            base = getattr(importlib.import_module(module), name)
+            _hook_subclasses(base, methods)
+            for cls in _class_tree(base):
+                _wrap_methods(cls, methods)
+
+
+def _uninstall() -> None:
+    """Restore the original methods once the last user is done with them."""
+    global _installs  # noqa: PLW0603
+    with _lock:
+        _installs -= 1
+        if _installs:
+            return
+
+        while _hooked:
+            base, original = _hooked.pop()
+            if original is None:
+                delattr(base, "__init_subclass__")
+            else:
+                setattr(base, "__init_subclass__", original)  # noqa: B010
+        while _patched:
+            cls, name, attr = _patched.pop()
+            setattr(cls, name, attr)
+
+
+def _hook_subclasses(base: type, methods: tuple[str, ...]) -> None:
+    """Wrap the methods of subclasses of ``base`` as they are created."""
+    original: classmethod[Any, ..., None] | None = base.__dict__.get(
+        "__init_subclass__"
+    )
+
+    def init_subclass(cls: type, **kwargs: Any) -> None:  # noqa: ANN401
+        init = original
+        if init is None:
+            # what super(base, cls) resolves to, as base has no hook of its own
+            mro = cls.__mro__
+            init = next(
+                klass.__dict__["__init_subclass__"]
+                for klass in mro[mro.index(base) + 1 :]
+                if "__init_subclass__" in klass.__dict__
+            )
+        init.__get__(None, cls)(**kwargs)
+        with _lock:
+            _wrap_methods(cls, methods)
+
+    _hooked.append((base, original))
+    setattr(base, "__init_subclass__", classmethod(init_subclass))  # noqa: B010
+
+
+def _wrap_methods(cls: type, methods: tuple[str, ...]) -> None:
+    for name in methods:
+        attr = cls.__dict__.get(name)
+        if attr is None or getattr(attr, "__isabstractmethod__", False):
+            continue
+
+        # classes rebuilt from wrapped ones (e.g. by dataclass slots) copy wrappers
+        attr = getattr(getattr(attr, "__func__", attr), "_original", attr)
+        _patched.append((cls, name, attr))
+        setattr(cls, name, _instrument(attr, name))
+
+
+def _class_tree(base: type) -> list[type]:
+    """Get a class and all its (transitive) subclasses, each once."""
+    classes = [base]
+    for cls in classes:
+        classes.extend(sub for sub in cls.__subclasses__() if sub not in classes)
+    return classes
+
+
+def _instrument(attr: Any, name: str) -> Any:  # noqa: ANN401
+    """Wrap a method (plain or ``classmethod``) to record its calls."""
+    if isinstance(attr, classmethod):
+        wrapper = _timed(attr.__func__, name, receiver_is_class=True)
+        wrapper._original = attr  # type: ignore[attr-defined]  # noqa: SLF001
+        return classmethod(wrapper)
+
+    wrapper = _timed(attr, name, receiver_is_class=False)
+    wrapper._original = attr  # type: ignore[attr-defined]  # noqa: SLF001
+    return wrapper
+
+
+def _timed(
+    func: Callable[..., Any], name: str, *, receiver_is_class: bool
+) -> Callable[..., Any]:
+    @wraps(func)
+    def timed(receiver: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        scopes = _scopes.get()
+        if not (scopes or _recording):
+            return func(receiver, *args, **kwargs)
+
+        call = (id(receiver), name)
+        running = _running.get()
+        if call in running:
+            return func(receiver, *args, **kwargs)
+
+        token = _running.set(running | {call})
+        begin = perf_counter_ns()
+        try:
+            return func(receiver, *args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - begin
+            _running.reset(token)
+            key = (receiver if receiver_is_class else type(receiver), name)
+            with _lock:
+                for stats in (*scopes, _stats) if _recording else scopes:
+                    counter = stats.setdefault(key, [0, 0])
+                    counter[0] += 1
+                    counter[1] += elapsed
+
+    return timed
+
+
+def _format(stats: _Stats) -> dict[str, CallStats]:
+    with _lock:
+        return {
+            f"{cls.__qualname__}.{name}": CallStats(calls, nanos / 1e9)
+            for (cls, name), (calls, nanos) in stats.items()
+        }
@@ -0,0 +1,46 @@
+"""Deferred imports of heavy dependencies.
+
+Importing pendulum (and the dateutil parser it pulls in) or the multiprocessing
+machinery costs more than the rest of the package on top of numpy. Modules which
+only need them on some code paths bind them with ``lazy_import`` instead, so the
+cost is paid on first use rather than by every process importing the package.
+"""
+
+import importlib.util
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Get a module which is only executed on first attribute access.
+
+    Parent packages of submodules are imported eagerly, as with ``importlib``; the
+    module itself is only loaded once one of its attributes is used.
+
+    Args:
+        name: Absolute name of the module, e.g. "pendulum".
+
+    Returns:
+        The (possibly not yet loaded) module.
+
+    Raises:
+        ModuleNotFoundError: If the module cannot be found.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        msg = f"No module named {name!r}"
+        raise ModuleNotFoundError(msg, name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
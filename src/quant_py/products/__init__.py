@@ -0,0 +1 @@
+"""Financial products."""
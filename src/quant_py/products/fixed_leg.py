@@ -0,0 +1,172 @@
+"""Fixed rate legs."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from quant_py.curves.risk import Exposures
+from quant_py.products.ragged import segment_sums
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from quant_py.curves.discount_curve import DiscountCurve
+    from quant_py.daycounter import Daycounter
+    from quant_py.scheduling.batch import ScheduleBatch
+    from quant_py.scheduling.schedule import Schedule
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class FixedLeg:
+    """Leg paying a fixed rate over each period.
+
+    Coupons are paid on the adjusted end date of each period.
+
+    Attributes:
+        schedule: Accrual schedule of the leg.
+        daycounter: Daycounter of the fixed rate.
+        rate: The fixed rate.
+        notional: Notional of the leg. Defaults to 1.
+    """
+
+    schedule: Schedule
+    daycounter: Daycounter
+    rate: float
+    notional: float = 1.0
+
+    def annuity(self: Self, curve: DiscountCurve) -> float:
+        """Compute the PV of a unit rate paid on the leg's periods yet to be paid.
+
+        Args:
+            curve: Curve to discount off.
+
+        Returns:
+            Annuity of the leg per unit notional.
+        """
+        return float(
+            _discounted_year_fracs(
+                self.schedule.end, self.schedule.year_fracs(self.daycounter), curve
+            ).sum()
+        )
+
+    def pv(self: Self, curve: DiscountCurve) -> float:
+        """Compute the present value of the leg.
+
+        Args:
+            curve: Curve to discount off.
+
+        Returns:
+            PV of the coupons yet to be paid.
+        """
+        return self.notional * self.rate * self.annuity(curve)
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class FixedLegBatch:
+    """Many fixed legs valued together.
+
+    Attributes:
+        schedules: Accrual schedules of the legs.
+        daycounter: Daycounter of the fixed rates.
+        rates: Fixed rate of each leg.
+        notionals: Notional of each leg.
+    """
+
+    schedules: ScheduleBatch
+    daycounter: Daycounter
+    rates: NDArray[np.float64]
+    notionals: NDArray[np.float64]
+
+    def __post_init__(self: Self) -> None:
+        """Broadcast the rates and notionals to one per leg."""
+        n_legs = (len(self.schedules),)
+        rates = np.broadcast_to(np.asarray(self.rates, np.float64), n_legs)
+        notionals = np.broadcast_to(np.asarray(self.notionals, np.float64), n_legs)
+        object.__setattr__(self, "rates", rates)
+        object.__setattr__(self, "notionals", notionals)
+
+    def __len__(self: Self) -> int:  # noqa: D105
+        return len(self.schedules)
+
+    def __getitem__(self: Self, idx: int) -> FixedLeg:
+        """Get a single leg of the batch.
+
+        Args:
+            idx: Index of the leg in the batch.
+
+        Returns:
+            FixedLeg.
+        """
+        return FixedLeg(
+            schedule=self.schedules[idx],
+            daycounter=self.daycounter,
+            rate=float(self.rates[idx]),
+            notional=float(self.notionals[idx]),
+        )
+
+    def annuities(self: Self, curve: DiscountCurve) -> NDArray[np.float64]:
+        """Compute the annuity of each leg.
+
+        Args:
+            curve: Curve to discount off.
+
+        Returns:
+            Annuity of each leg per unit notional.
+        """
+        discounted = _discounted_year_fracs(
+            self.schedules.end, self.schedules.year_fracs(self.daycounter), curve
+        )
+        return segment_sums(discounted, self.schedules.offsets)
+
+    def pvs(self: Self, curve: DiscountCurve) -> NDArray[np.float64]:
+        """Compute the present value of each leg.
+
+        Args:
+            curve: Curve to discount off.
+
+        Returns:
+            PV of each leg.
+        """
+        return self.notionals * self.rates * self.annuities(curve)
+
+    def exposures(self: Self, curve: DiscountCurve) -> Exposures:
+        """Get the exposures of the legs to the discount factors of a curve.
+
+        Args:
+            curve: Curve the legs are risked on.
+
+        Returns:
+            Exposures of the coupons yet to be paid.
+        """
+        counts = self.schedules.counts
+        live = self.schedules.end > curve.ref_dt
+        coupons = np.repeat(
+            self.notionals * self.rates, counts
+        ) * self.schedules.year_fracs(self.daycounter)
+        return Exposures(
+            dates=self.schedules.end[live],
+            amounts=coupons[live],
+            trades=np.repeat(np.arange(len(self)), counts)[live],
+            n_trades=len(self),
+        )
+
+
+def _discounted_year_fracs(
+    ends: NDArray[np.datetime64], year_fracs: NDArray[np.float64], curve: DiscountCurve
+) -> NDArray[np.float64]:
+    """Year fraction times discount factor of each period; zero once paid."""
+    live = ends > curve.ref_dt
+    discounted = np.zeros(ends.shape)
+    discounted[live] = year_fracs[live] * curve.df(ends[live])
+    return discounted
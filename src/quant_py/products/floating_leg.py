@@ -0,0 +1,295 @@
+"""Floating legs paying a compounded overnight index."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from quant_py.curves.risk import Exposures
+from quant_py.indices.ois_index import OisRateIndex
+from quant_py.products.ragged import segment_sums
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from quant_py.curves.discount_curve import DiscountCurve
+    from quant_py.fixings import Fixings
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+    from quant_py.scheduling.batch import ScheduleBatch
+    from quant_py.scheduling.schedule import Schedule
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class FloatingLeg:
+    """Leg paying an overnight index compounded in arrears over each period.
+
+    Coupons are paid on the adjusted end date of each period and accrue under the
+    index daycounter.
+
+    Attributes:
+        schedule: Accrual schedule of the leg.
+        metadata: Metadata of the overnight index.
+        notional: Notional of the leg. Defaults to 1.
+        spread: Spread over the compounded rate. Defaults to 0.
+    """
+
+    schedule: Schedule
+    metadata: OisRateIndexMetadata
+    notional: float = 1.0
+    spread: float = 0.0
+
+    def coupons(
+        self: Self, curve: DiscountCurve, fixings: Fixings | None = None
+    ) -> NDArray[np.float64]:
+        """Project the coupon of each period off a curve.
+
+        Args:
+            curve: Curve to project forward rates off.
+            fixings: Fixings of the index, needed if a period started before the
+                curve's reference date. Defaults to None.
+
+        Returns:
+            Coupon amount of each period; zero for periods already paid.
+        """
+        coupons, _ = self._cashflows(curve, fixings)
+        return coupons
+
+    def pv(self: Self, curve: DiscountCurve, fixings: Fixings | None = None) -> float:
+        """Compute the present value of the leg.
+
+        Args:
+            curve: Curve to project and discount off.
+            fixings: Fixings of the index, needed if a period started before the
+                curve's reference date. Defaults to None.
+
+        Returns:
+            PV of the coupons yet to be paid.
+        """
+        _, pvs = self._cashflows(curve, fixings)
+        return float(pvs.sum())
+
+    def _cashflows(
+        self: Self, curve: DiscountCurve, fixings: Fixings | None
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        return _cashflows(
+            self.metadata,
+            self.schedule.start,
+            self.schedule.end,
+            self.schedule.year_fracs(self.metadata.daycounter),
+            self.notional,
+            self.spread,
+            curve,
+            fixings,
+        )
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class FloatingLegBatch:
+    """Many floating legs on the same index valued together.
+
+    The periods of every leg are the flat columns of a ``ScheduleBatch``, so
+    projecting and discounting the whole book takes a fixed number of array
+    operations.
+
+    Attributes:
+        schedules: Accrual schedules of the legs.
+        metadata: Metadata of the overnight index.
+        notionals: Notional of each leg.
+        spreads: Spread of each leg. Defaults to zero (no spreads).
+    """
+
+    schedules: ScheduleBatch
+    metadata: OisRateIndexMetadata
+    notionals: NDArray[np.float64]
+    spreads: NDArray[np.float64] = field(default_factory=lambda: np.zeros(1))
+
+    def __post_init__(self: Self) -> None:
+        """Broadcast the notionals and spreads to one per leg."""
+        n_legs = (len(self.schedules),)
+        notionals = np.broadcast_to(np.asarray(self.notionals, np.float64), n_legs)
+        spreads = np.broadcast_to(np.asarray(self.spreads, np.float64), n_legs)
+        object.__setattr__(self, "notionals", notionals)
+        object.__setattr__(self, "spreads", spreads)
+
+    def __len__(self: Self) -> int:  # noqa: D105
+        return len(self.schedules)
+
+    def __getitem__(self: Self, idx: int) -> FloatingLeg:
+        """Get a single leg of the batch.
+
+        Args:
+            idx: Index of the leg in the batch.
+
+        Returns:
+            FloatingLeg.
+        """
+        return FloatingLeg(
+            schedule=self.schedules[idx],
+            metadata=self.metadata,
+            notional=float(self.notionals[idx]),
+            spread=float(self.spreads[idx]),
+        )
+
+    def coupons(
+        self: Self, curve: DiscountCurve, fixings: Fixings | None = None
+    ) -> NDArray[np.float64]:
+        """Project the coupon of every period of every leg off a curve.
+
+        Args:
+            curve: Curve to project forward rates off.
+            fixings: Fixings of the index, needed if a period started before the
+                curve's reference date. Defaults to None.
+
+        Returns:
+            Flat column of coupon amounts, zero for periods already paid.
+        """
+        coupons, _ = self._cashflows(curve, fixings)
+        return coupons
+
+    def pvs(
+        self: Self, curve: DiscountCurve, fixings: Fixings | None = None
+    ) -> NDArray[np.float64]:
+        """Compute the present value of each leg.
+
+        Args:
+            curve: Curve to project and discount off.
+            fixings: Fixings of the index, needed if a period started before the
+                curve's reference date. Defaults to None.
+
+        Returns:
+            PV of each leg.
+        """
+        _, pvs = self._cashflows(curve, fixings)
+        return segment_sums(pvs, self.schedules.offsets)
+
+    def pv(self: Self, curve: DiscountCurve, fixings: Fixings | None = None) -> float:
+        """Compute the present value of the whole batch.
+
+        Args:
+            curve: Curve to project and discount off.
+            fixings: Fixings of the index, needed if a period started before the
+                curve's reference date. Defaults to None.
+
+        Returns:
+            Total PV of the legs.
+        """
+        _, pvs = self._cashflows(curve, fixings)
+        return float(pvs.sum())
+
+    def exposures(
+        self: Self, curve: DiscountCurve, fixings: Fixings | None = None
+    ) -> Exposures:
+        """Get the exposures of the legs to the discount factors of a curve.
+
+        Projecting off the discounting curve, each coupon yet to be paid is worth
+        the discount factor at its period's start (or the growth realized up to the
+        curve date) less the one at its end, plus the discounted spread.
+
+        Args:
+            curve: Curve the legs are risked on.
+            fixings: Fixings of the index, needed if a period started before the
+                curve's reference date. Defaults to None.
+
+        Returns:
+            Exposures of the coupons yet to be paid.
+        """
+        ref_dt = curve.ref_dt
+        counts = self.schedules.counts
+        live = self.schedules.end > ref_dt
+        starts = self.schedules.start[live]
+        seasoned = starts < ref_dt
+        realized = np.ones(starts.shape)
+        if np.any(seasoned):
+            realized[seasoned] = _realized_growth(
+                self.metadata, starts[seasoned], ref_dt, fixings
+            )
+
+        notionals = np.repeat(self.notionals, counts)[live]
+        spreads = np.repeat(self.spreads, counts)[live]
+        year_fracs = self.schedules.year_fracs(self.metadata.daycounter)[live]
+        trades = np.repeat(np.arange(len(self)), counts)[live]
+        return Exposures(
+            dates=np.concatenate(
+                (np.where(seasoned, ref_dt, starts), self.schedules.end[live])
+            ),
+            amounts=np.concatenate(
+                (notionals * realized, notionals * (spreads * year_fracs - 1.0))
+            ),
+            trades=np.concatenate((trades, trades)),
+            n_trades=len(self),
+        )
+
+    def _cashflows(
+        self: Self, curve: DiscountCurve, fixings: Fixings | None
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        counts = self.schedules.counts
+        return _cashflows(
+            self.metadata,
+            self.schedules.start,
+            self.schedules.end,
+            self.schedules.year_fracs(self.metadata.daycounter),
+            np.repeat(self.notionals, counts),
+            np.repeat(self.spreads, counts),
+            curve,
+            fixings,
+        )
+
+
+def _cashflows(
+    metadata: OisRateIndexMetadata,
+    starts: NDArray[np.datetime64],
+    ends: NDArray[np.datetime64],
+    year_fracs: NDArray[np.float64],
+    notionals: ArrayLike,
+    spreads: ArrayLike,
+    curve: DiscountCurve,
+    fixings: Fixings | None,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Coupon and PV of each period; both are zero for periods already paid.
+
+    The compounded rate of a period is projected off the curve as the ratio of the
+    discount factors at its start and end; periods which started before the curve
+    date compound the fixings up to it.
+    """
+    ref_dt = curve.ref_dt
+    live = ends > ref_dt
+    seasoned = starts[live] < ref_dt
+    live_ends = ends[live]
+    end_dfs = curve.df(live_ends)
+    growth = curve.df(np.where(seasoned, ref_dt, starts[live])) / end_dfs
+    if np.any(seasoned):
+        growth[seasoned] *= _realized_growth(
+            metadata, starts[live][seasoned], ref_dt, fixings
+        )
+
+    notionals = np.broadcast_to(notionals, starts.shape)[live]
+    spreads = np.broadcast_to(spreads, starts.shape)[live]
+    coupons = np.zeros(starts.shape)
+    coupons[live] = notionals * (growth - 1.0 + spreads * year_fracs[live])
+    pvs = np.zeros(starts.shape)
+    pvs[live] = coupons[live] * end_dfs
+    return coupons, pvs
+
+
+def _realized_growth(
+    metadata: OisRateIndexMetadata,
+    starts: NDArray[np.datetime64],
+    ref_dt: np.datetime64,
+    fixings: Fixings | None,
+) -> NDArray[np.float64]:
+    """Growth factor of periods which started before the curve date up to it."""
+    if fixings is None:
+        msg = "Fixings are needed for periods which started before the curve date!"
+        raise ValueError(msg)
+
+    return OisRateIndex(metadata).growth(fixings, starts, np.full(starts.size, ref_dt))
@@ -0,0 +1,30 @@
+"""Reductions over ragged columns of many products' cashflows."""
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+def segment_sums(
+    values: NDArray[np.float64], offsets: NDArray[np.int64]
+) -> NDArray[np.float64]:
+    """Sum each segment ``values[offsets[i]:offsets[i + 1]]`` of a ragged column.
+
+    Unlike a bare ``np.add.reduceat`` empty segments sum to zero.
+
+    Args:
+        values: Flat column, or 2-d array whose rows are reduced.
+        offsets: Row offsets of each segment; has one more entry than segments.
+
+    Returns:
+        Sum of each segment.
+    """
+    counts = np.diff(offsets)
+    sums = np.zeros(counts.shape + values.shape[1:], dtype=values.dtype)
+    nonempty = counts > 0
+    if np.any(nonempty):
+        sums[nonempty] = np.add.reduceat(values, offsets[:-1][nonempty], axis=0)
+    return sums
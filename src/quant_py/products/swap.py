@@ -0,0 +1,237 @@
+"""Vanilla OIS swaps."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from quant_py.curves.risk import Exposures
+from quant_py.lazy import lazy_import
+from quant_py.products.fixed_leg import FixedLeg, FixedLegBatch
+from quant_py.products.floating_leg import FloatingLeg, FloatingLegBatch
+from quant_py.scheduling.batch import ScheduleBatch
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import ArrayLike, NDArray
+    from pendulum.duration import Duration
+
+    from quant_py.curves.discount_curve import DiscountCurve
+    from quant_py.daycounter import Daycounter
+    from quant_py.fixings import Fixings
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+
+pendulum = lazy_import("pendulum")
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class OisSwap:
+    """Swap of a fixed leg against a compounded overnight leg.
+
+    Attributes:
+        fixed: The fixed leg.
+        floating: The floating leg.
+        payer: Whether the fixed leg is paid (else received). Defaults to True.
+    """
+
+    fixed: FixedLeg
+    floating: FloatingLeg
+    payer: bool = True
+
+    def pv(self: Self, curve: DiscountCurve, fixings: Fixings | None = None) -> float:
+        """Compute the present value of the swap.
+
+        Args:
+            curve: Curve to project and discount off.
+            fixings: Fixings of the index, needed if a floating period started
+                before the curve's reference date. Defaults to None.
+
+        Returns:
+            PV of the swap to its holder.
+        """
+        pv = self.floating.pv(curve, fixings) - self.fixed.pv(curve)
+        return pv if self.payer else -pv
+
+    def par_rate(
+        self: Self, curve: DiscountCurve, fixings: Fixings | None = None
+    ) -> float:
+        """Compute the fixed rate at which the swap is worth zero.
+
+        Args:
+            curve: Curve to project and discount off.
+            fixings: Fixings of the index, needed if a floating period started
+                before the curve's reference date. Defaults to None.
+
+        Returns:
+            Par fixed rate.
+        """
+        annuity = self.fixed.notional * self.fixed.annuity(curve)
+        return self.floating.pv(curve, fixings) / annuity
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class OisSwapBatch:
+    """Portfolio of OIS swaps on the same index valued together.
+
+    Each leg type is stacked into ragged columns, so valuing the portfolio is a
+    handful of array operations and per-swap reductions.
+
+    Attributes:
+        fixed: The fixed legs.
+        floating: The floating legs.
+        payer: Whether each swap pays the fixed leg.
+    """
+
+    fixed: FixedLegBatch
+    floating: FloatingLegBatch
+    payer: NDArray[np.bool_]
+
+    def __post_init__(self: Self) -> None:
+        """Check the legs line up and broadcast the payer flags."""
+        if len(self.fixed) != len(self.floating):
+            msg = "Need the same number of fixed and floating legs!"
+            raise ValueError(msg)
+
+        payer = np.broadcast_to(np.asarray(self.payer, np.bool_), (len(self.fixed),))
+        object.__setattr__(self, "payer", payer)
+
+    def __len__(self: Self) -> int:  # noqa: D105
+        return len(self.fixed)
+
+    def __getitem__(self: Self, idx: int) -> OisSwap:
+        """Get a single swap of the portfolio.
+
+        Args:
+            idx: Index of the swap in the portfolio.
+
+        Returns:
+            OisSwap.
+        """
+        return OisSwap(
+            fixed=self.fixed[idx],
+            floating=self.floating[idx],
+            payer=bool(self.payer[idx]),
+        )
+
+    @classmethod
+    def of(
+        cls: type[Self],
+        effective: ArrayLike,
+        termination: ArrayLike,
+        rates: ArrayLike,
+        notionals: ArrayLike,
+        metadata: OisRateIndexMetadata,
+        fixed_tenors: Duration | Sequence[Duration],
+        float_tenors: Duration | Sequence[Duration],
+        fixed_daycounter: Daycounter,
+        *,
+        payer: ArrayLike = True,
+    ) -> Self:
+        """Construct a portfolio of swaps from their terms.
+
+        Both legs are scheduled on the index calendar and busday convention.
+
+        Args:
+            effective: Start date of each swap.
+            termination: End date of each swap.
+            rates: Fixed rate of each swap.
+            notionals: Notional of each swap.
+            metadata: Metadata of the overnight index.
+            fixed_tenors: Fixed leg tenor, shared or of each swap.
+            float_tenors: Floating leg tenor, shared or of each swap.
+            fixed_daycounter: Daycounter of the fixed rates.
+            payer: Whether each swap pays the fixed leg. Defaults to True.
+
+        Returns:
+            OisSwapBatch.
+        """
+        effective = np.asarray(effective, dtype="M8[D]")
+        termination = np.asarray(termination, dtype="M8[D]")
+        rates = np.asarray(rates, dtype=np.float64)
+        notionals = np.asarray(notionals, dtype=np.float64)
+
+        def schedules(tenors: Duration | Sequence[Duration]) -> ScheduleBatch:
+            return ScheduleBatch.of(
+                effective=effective,
+                termination=termination,
+                tenors=[tenors] * effective.size
+                if isinstance(tenors, pendulum.Duration)
+                else tenors,
+                pay_cal=metadata.pay_cal,
+                busday_conv=metadata.busday_conv,
+            )
+
+        fixed_schedules = schedules(fixed_tenors)
+        # legs with the same tenors share their schedules
+        float_schedules = (
+            fixed_schedules if float_tenors is fixed_tenors else schedules(float_tenors)
+        )
+        return cls(
+            fixed=FixedLegBatch(fixed_schedules, fixed_daycounter, rates, notionals),
+            floating=FloatingLegBatch(float_schedules, metadata, notionals),
+            payer=np.asarray(payer, dtype=np.bool_),
+        )
+
+    def pvs(
+        self: Self, curve: DiscountCurve, fixings: Fixings | None = None
+    ) -> NDArray[np.float64]:
+        """Compute the present value of each swap.
+
+        Args:
+            curve: Curve to project and discount off.
+            fixings: Fixings of the index, needed if a floating period started
+                before the curve's reference date. Defaults to None.
+
+        Returns:
+            PV of each swap to its holder.
+        """
+        pvs = self.floating.pvs(curve, fixings) - self.fixed.pvs(curve)
+        return np.where(self.payer, pvs, -pvs)
+
+    def par_rates(
+        self: Self, curve: DiscountCurve, fixings: Fixings | None = None
+    ) -> NDArray[np.float64]:
+        """Compute the fixed rate at which each swap is worth zero.
+
+        Args:
+            curve: Curve to project and discount off.
+            fixings: Fixings of the index, needed if a floating period started
+                before the curve's reference date. Defaults to None.
+
+        Returns:
+            Par fixed rate of each swap.
+        """
+        annuities = self.fixed.notionals * self.fixed.annuities(curve)
+        return self.floating.pvs(curve, fixings) / annuities
+
+    def exposures(
+        self: Self, curve: DiscountCurve, fixings: Fixings | None = None
+    ) -> Exposures:
+        """Get the exposures of the swaps to the discount factors of a curve.
+
+        Args:
+            curve: Curve the swaps are risked on.
+            fixings: Fixings of the index, needed if a floating period started
+                before the curve's reference date. Defaults to None.
+
+        Returns:
+            Exposures of the swaps to their holder.
+        """
+        signs = np.where(self.payer, 1.0, -1.0)
+        floating = self.floating.exposures(curve, fixings)
+        fixed = self.fixed.exposures(curve)
+        return Exposures.concat(
+            floating._replace(amounts=floating.amounts * signs[floating.trades]),
+            fixed._replace(amounts=-fixed.amounts * signs[fixed.trades]),
+        )
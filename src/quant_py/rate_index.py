@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from pendulum.date import Date
     from pendulum.duration import Duration
 
+    from quant_py.buscal import BusinessCalendar
     from quant_py.daycounter import Daycounter
     from quant_py.scheduling.adjuster import BusdayConvention
 
@@ -27,7 +28,7 @@ class RateIndexMetadata:
     name: str
     currency: str
     tenor: Duration
-    pay_cal: np.busdaycalendar
+    pay_cal: np.busdaycalendar | BusinessCalendar
     busday_conv: BusdayConvention
     daycounter: Daycounter
 
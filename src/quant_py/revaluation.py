@@ -0,0 +1,531 @@
+"""Multi-process revaluation of books of OIS swaps."""
+
+import heapq
+import os
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field, fields
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+import numpy as np
+
+from quant_py.buscal import BusinessCalendar, CalendarTables, calendar_key
+from quant_py.curves.discount_curve import DiscountCurve
+from quant_py.fixings import FixingsStore
+from quant_py.lazy import lazy_import
+from quant_py.products.swap import OisSwapBatch
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+    from multiprocessing.shared_memory import SharedMemory
+
+    from numpy.typing import NDArray
+
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+
+# only needed by the runner's workers, so not loaded until a book is revalued
+pendulum = lazy_import("pendulum")
+futures = lazy_import("concurrent.futures")
+shared_memory = lazy_import("multiprocessing.shared_memory")
+
+_BOOK_COLUMNS = (
+    "index",
+    "tenor_months",
+    "effective",
+    "termination",
+    "rates",
+    "notionals",
+    "payer",
+)
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class SwapBook:
+    """Book of vanilla OIS swaps stored as columns.
+
+    Both legs of a swap share its tenor and roll on the calendar and busday
+    convention of its index; the fixed leg accrues under the index daycounter.
+
+    Attributes:
+        index: Position of each swap's index in the runner's indices.
+        tenor_months: Leg tenor of each swap in months.
+        effective: Start date of each swap.
+        termination: End date of each swap.
+        rates: Fixed rate of each swap.
+        notionals: Notional of each swap.
+        payer: Whether each swap pays the fixed leg.
+    """
+
+    index: NDArray[np.int64]
+    tenor_months: NDArray[np.int64]
+    effective: NDArray[np.datetime64]
+    termination: NDArray[np.datetime64]
+    rates: NDArray[np.float64]
+    notionals: NDArray[np.float64]
+    payer: NDArray[np.bool_]
+
+    def __post_init__(self: Self) -> None:
+        """Convert the columns to their dtypes and check they line up."""
+        dtypes = (np.int64, np.int64, "M8[D]", "M8[D]", np.float64, np.float64, bool)
+        columns = [
+            np.asarray(getattr(self, name), dtype=dtype)
+            for name, dtype in zip(_BOOK_COLUMNS, dtypes, strict=True)
+        ]
+        if columns[0].ndim != 1 or any(
+            column.shape != columns[0].shape for column in columns
+        ):
+            msg = "Book columns must be 1-d arrays of equal length!"
+            raise ValueError(msg)
+
+        if np.any(columns[1] <= 0):
+            msg = "Swap tenors must be a positive number of months!"
+            raise ValueError(msg)
+
+        for name, column in zip(_BOOK_COLUMNS, columns, strict=True):
+            object.__setattr__(self, name, column)
+
+    def __len__(self: Self) -> int:  # noqa: D105
+        return self.index.size
+
+
+class RevaluationChunk(NamedTuple):
+    """PVs of a chunk of a book valued by one worker.
+
+    Attributes:
+        rows: Rows of the book valued.
+        pvs: PV of each row.
+        worker: Process id of the worker.
+        seconds: Time the worker spent valuing the chunk.
+    """
+
+    rows: NDArray[np.int64]
+    pvs: NDArray[np.float64]
+    worker: int
+    seconds: float
+
+
+class WorkerStats(NamedTuple):
+    """Work done by one worker over a revaluation.
+
+    Attributes:
+        chunks: Number of chunks valued.
+        trades: Number of trades valued.
+        seconds: Time spent valuing.
+    """
+
+    chunks: int
+    trades: int
+    seconds: float
+
+    @property
+    def throughput(self: Self) -> float:
+        """Get the trades valued per second of work."""
+        return self.trades / self.seconds if self.seconds else float("inf")
+
+
+class RevaluationResult(NamedTuple):
+    """PVs of a whole book along with the throughput of each worker.
+
+    Attributes:
+        pvs: PV of each swap of the book.
+        workers: Statistics of each worker, keyed by process id.
+        seconds: Wall clock time of the revaluation.
+    """
+
+    pvs: NDArray[np.float64]
+    workers: dict[int, WorkerStats]
+    seconds: float
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class RevaluationRunner:
+    """Revalue books of OIS swaps on a pool of worker processes.
+
+    The book is sorted by (calendar, index, tenor) and cut into chunks which each
+    fall in one partition, so every chunk builds its schedules in one
+    ``ScheduleBatch`` against a single calendar. Schedules are not cached across
+    chunks; the batch construction is what is shared.
+
+    Each partition is routed to a fixed worker, so its chunks run where its index's
+    converted calendar and fixings are already loaded. Partitions are assigned
+    largest first to the least loaded worker; one larger than a worker's fair share
+    of the book is split into consecutive runs of chunks so it cannot serialize the
+    revaluation. The book columns, curves and calendar tables are copied into shared
+    memory once per run; workers attach to it on startup and rebuild their curves
+    and calendars on top of it once, so tasks only carry the rows to value.
+
+    Attributes:
+        indices: Overnight indices the swaps of the books reference.
+        curves: Projection and discount curve of each index.
+        fixings: Store of the index fixings, needed for swaps which started before
+            the curve dates. Defaults to None.
+        max_workers: Number of worker processes. Defaults to None (one per CPU).
+        chunk_size: Maximum number of swaps valued per task. Defaults to 20,000.
+    """
+
+    indices: Sequence[OisRateIndexMetadata]
+    curves: Sequence[DiscountCurve]
+    fixings: FixingsStore | None = None
+    max_workers: int | None = None
+    chunk_size: int = 20_000
+    _calendar_codes: NDArray[np.int64] = field(init=False, repr=False)
+
+    def __post_init__(self: Self) -> None:
+        """Check the curves line up with the indices and tag their calendars."""
+        if len(self.indices) != len(self.curves):
+            msg = "Need exactly one curve per index!"
+            raise ValueError(msg)
+
+        if self.chunk_size <= 0:
+            msg = "Chunk size must be positive!"
+            raise ValueError(msg)
+
+        keys: dict[object, int] = {}
+        codes = [
+            keys.setdefault(calendar_key(metadata.pay_cal), len(keys))
+            for metadata in self.indices
+        ]
+        object.__setattr__(self, "_calendar_codes", np.array(codes, dtype=np.int64))
+
+    def partitions(self: Self, book: SwapBook) -> tuple[NDArray[np.int64], list[int]]:
+        """Group the swaps of a book by calendar, index and tenor.
+
+        Args:
+            book: The book to partition.
+
+        Returns:
+            Order of the book's rows grouped by partition, and the boundaries in
+            that order of the chunks to value, each within a single partition.
+        """
+        if np.any((book.index < 0) | (book.index >= len(self.indices))):
+            msg = "Book references an unknown index!"
+            raise ValueError(msg)
+
+        order = np.lexsort(
+            (book.tenor_months, book.index, self._calendar_codes[book.index])
+        )
+        index = book.index[order]
+        tenor_months = book.tenor_months[order]
+        breaks = np.flatnonzero(
+            (index[1:] != index[:-1]) | (tenor_months[1:] != tenor_months[:-1])
+        )
+        edges = [0, *(breaks + 1).tolist(), len(book)]
+        bounds = [0]
+        for start, stop in pairwise(edges):
+            bounds.extend(range(start + self.chunk_size, stop, self.chunk_size))
+            bounds.append(stop)
+        return order, bounds if len(book) else [0]
+
+    def stream(self: Self, book: SwapBook) -> Iterator[RevaluationChunk]:
+        """Revalue a book, yielding the PVs of each chunk as it completes.
+
+        Args:
+            book: The book to revalue.
+
+        Yields:
+            PVs of each chunk of the book, in order of completion.
+        """
+        order, bounds = self.partitions(book)
+        arrays: dict[str, NDArray[Any]] = {
+            name: getattr(book, name)[order] for name in _BOOK_COLUMNS
+        }
+        calendars: dict[int, _SharedCalendar] = {}
+        for code, metadata in zip(self._calendar_codes, self.indices, strict=True):
+            if int(code) not in calendars:
+                calendars[int(code)] = _share_calendar(
+                    metadata.pay_cal, f"calendar{code}", arrays
+                )
+        indices = [
+            _SharedIndex(
+                int(code), type(metadata), _fields(metadata, exclude={"pay_cal"})
+            )
+            for code, metadata in zip(self._calendar_codes, self.indices, strict=True)
+        ]
+        curves = []
+        for i, curve in enumerate(self.curves):
+            arrays[f"curve{i}_pillars"] = curve.pillars
+            arrays[f"curve{i}_dfs"] = curve.dfs
+            curves.append(_fields(curve, exclude={"pillars", "dfs"}))
+
+        starts = np.asarray(bounds[:-1], dtype=np.int64)
+        index = arrays["index"][starts]
+        tenor_months = arrays["tenor_months"][starts]
+        new_partition = np.ones(starts.size, dtype=bool)
+        new_partition[1:] = (index[1:] != index[:-1]) | (
+            tenor_months[1:] != tenor_months[:-1]
+        )
+        slots = _assign_workers(
+            np.diff(bounds).tolist(),
+            (np.cumsum(new_partition) - 1).tolist(),
+            self.max_workers or os.process_cpu_count() or 1,
+        )
+
+        shared = _SharedArrays(arrays)
+        initargs = (
+            shared.name,
+            shared.layout,
+            calendars,
+            indices,
+            curves,
+            None if self.fixings is None else self.fixings.root,
+        )
+        try:
+            with ExitStack() as stack:
+                # a pool hands each task to whichever of its processes is idle, so
+                # only a single process pool per worker pins a partition's chunks to
+                # the process with its calendar and fixings loaded; the pools can't
+                # outlive the call as their initializer attaches this run's memory
+                executors = {
+                    slot: stack.enter_context(
+                        futures.ProcessPoolExecutor(
+                            max_workers=1, initializer=_init_worker, initargs=initargs
+                        )
+                    )
+                    for slot in sorted(set(slots))
+                }
+                pending = [
+                    executors[slot].submit(_value_chunk, start, stop)
+                    for slot, (start, stop) in zip(slots, pairwise(bounds), strict=True)
+                ]
+                try:
+                    for future in futures.as_completed(pending):
+                        start, stop, pvs, worker, seconds = future.result()
+                        yield RevaluationChunk(order[start:stop], pvs, worker, seconds)
+                finally:
+                    for future in pending:
+                        future.cancel()
+        finally:
+            shared.close()
+
+    def run(self: Self, book: SwapBook) -> RevaluationResult:
+        """Revalue a book.
+
+        Args:
+            book: The book to revalue.
+
+        Returns:
+            PV of every swap of the book and the throughput of each worker.
+        """
+        start = time.perf_counter()
+        pvs = np.full(len(book), np.nan)
+        workers: dict[int, WorkerStats] = {}
+        for chunk in self.stream(book):
+            pvs[chunk.rows] = chunk.pvs
+            chunks, trades, seconds = workers.get(chunk.worker, (0, 0, 0.0))
+            workers[chunk.worker] = WorkerStats(
+                chunks + 1, trades + chunk.rows.size, seconds + chunk.seconds
+            )
+        return RevaluationResult(pvs, workers, time.perf_counter() - start)
+
+
+class _SharedArrays:
+    """Named arrays copied into one shared memory block."""
+
+    def __init__(self: Self, arrays: Mapping[str, NDArray[Any]]) -> None:
+        contiguous = [np.ascontiguousarray(array) for array in arrays.values()]
+        self.layout: list[tuple[str, str, tuple[int, ...], int]] = []
+        size = 0
+        for name, array in zip(arrays, contiguous, strict=True):
+            self.layout.append((name, array.dtype.str, array.shape, size))
+            # keep every array 8 byte aligned
+            size += -(-array.nbytes // 8) * 8
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.name = self._shm.name
+        for (_, _, _, offset), array in zip(self.layout, contiguous, strict=True):
+            view = np.ndarray(array.shape, array.dtype, self._shm.buf, offset)
+            view[...] = array
+
+    def close(self: Self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+
+class _SharedCalendar(NamedTuple):
+    """How to rebuild a calendar whose arrays are in shared memory."""
+
+    name: str
+    weekmask: str
+    # date range of a BusinessCalendar; None for a numpy busdaycalendar
+    bounds: tuple[np.datetime64, np.datetime64] | None
+
+
+class _SharedIndex(NamedTuple):
+    """How to rebuild an index metadata on a calendar in shared memory."""
+
+    calendar: int
+    cls: type[OisRateIndexMetadata]
+    kwargs: dict[str, Any]
+
+
+class _WorkerState(NamedTuple):
+    shm: SharedMemory
+    arrays: dict[str, NDArray[Any]]
+    indices: list[OisRateIndexMetadata]
+    curves: list[DiscountCurve]
+    fixings: FixingsStore | None
+
+
+_worker: _WorkerState | None = None
+
+
+def _init_worker(
+    name: str,
+    layout: list[tuple[str, str, tuple[int, ...], int]],
+    calendars: dict[int, _SharedCalendar],
+    indices: list[_SharedIndex],
+    curves: list[dict[str, Any]],
+    fixings_root: str | None,
+) -> None:
+    """Attach to the shared memory and rebuild the calendars, indices and curves."""
+    global _worker  # noqa: PLW0603
+    shm = shared_memory.SharedMemory(name=name, track=False)
+    arrays = {
+        array_name: np.ndarray(shape, np.dtype(dtype), shm.buf, offset)
+        for array_name, dtype, shape, offset in layout
+    }
+    for array in arrays.values():
+        array.flags.writeable = False
+
+    pay_cals = {
+        code: _rebuild_calendar(calendar, arrays)
+        for code, calendar in calendars.items()
+    }
+    _worker = _WorkerState(
+        shm=shm,
+        arrays=arrays,
+        indices=[
+            index.cls(pay_cal=pay_cals[index.calendar], **index.kwargs)
+            for index in indices
+        ],
+        curves=[
+            DiscountCurve(
+                pillars=arrays[f"curve{i}_pillars"],
+                dfs=arrays[f"curve{i}_dfs"],
+                **kwargs,
+            )
+            for i, kwargs in enumerate(curves)
+        ],
+        fixings=None if fixings_root is None else FixingsStore(fixings_root),
+    )
+
+
+def _value_chunk(
+    start: int, stop: int
+) -> tuple[int, int, NDArray[np.float64], int, float]:
+    """Value rows ``[start, stop)`` of the shared book, all in one partition."""
+    if _worker is None:
+        msg = "Worker was not initialized!"
+        raise RuntimeError(msg)
+
+    began = time.perf_counter()
+    rows = slice(start, stop)
+    columns = _worker.arrays
+    index = int(columns["index"][start])
+    metadata = _worker.indices[index]
+    tenor = pendulum.Duration(months=int(columns["tenor_months"][start]))
+    batch = OisSwapBatch.of(
+        effective=columns["effective"][rows],
+        termination=columns["termination"][rows],
+        rates=columns["rates"][rows],
+        notionals=columns["notionals"][rows],
+        metadata=metadata,
+        fixed_tenors=tenor,
+        float_tenors=tenor,
+        fixed_daycounter=metadata.daycounter,
+        payer=columns["payer"][rows],
+    )
+    store = _worker.fixings
+    fixings = (
+        store.load(metadata.name)
+        if store is not None and metadata.name in store
+        else None
+    )
+    pvs = batch.pvs(_worker.curves[index], fixings)
+    return start, stop, pvs, os.getpid(), time.perf_counter() - began
+
+
+def _assign_workers(
+    sizes: list[int], partitions: list[int], n_workers: int
+) -> list[int]:
+    """Assign chunks to workers, keeping the chunks of a partition together.
+
+    Consecutive chunks of a partition stay on one worker up to a fair share of the
+    book; the runs are then handed out largest first to the least loaded worker.
+
+    Returns:
+        Worker slot of each chunk.
+    """
+    share = -(-sum(sizes) // n_workers)
+    runs: list[list[int]] = []
+    run_sizes: list[int] = []
+    for chunk, (size, partition) in enumerate(zip(sizes, partitions, strict=True)):
+        same_partition = bool(runs) and partitions[runs[-1][0]] == partition
+        if same_partition and run_sizes[-1] + size <= share:
+            runs[-1].append(chunk)
+            run_sizes[-1] += size
+        else:
+            runs.append([chunk])
+            run_sizes.append(size)
+
+    slots = [0] * len(sizes)
+    loads = [(0, slot) for slot in range(n_workers)]
+    for size, chunks in sorted(
+        zip(run_sizes, runs, strict=True), key=lambda run: -run[0]
+    ):
+        load, slot = heapq.heappop(loads)
+        for chunk in chunks:
+            slots[chunk] = slot
+        heapq.heappush(loads, (load + size, slot))
+    return slots
+
+
+def _fields(obj: object, exclude: set[str]) -> dict[str, Any]:
+    """Constructor arguments of a dataclass instance, less ``exclude``."""
+    return {
+        f.name: getattr(obj, f.name)
+        for f in fields(obj)  # type: ignore[arg-type]
+        if f.init and f.name not in exclude
+    }
+
+
+def _share_calendar(
+    calendar: np.busdaycalendar | BusinessCalendar,
+    name: str,
+    arrays: dict[str, NDArray[Any]],
+) -> _SharedCalendar:
+    """Add a calendar's holidays and tables to the shared arrays."""
+    arrays[f"{name}_holidays"] = np.asarray(calendar.holidays, dtype="M8[D]")
+    if isinstance(calendar, BusinessCalendar):
+        for table, array in zip(CalendarTables._fields, calendar.tables, strict=True):
+            arrays[f"{name}_{table}"] = array
+        return _SharedCalendar(name, calendar.weekmask, (calendar.start, calendar.end))
+
+    weekmask = "".join("1" if bit else "0" for bit in calendar.weekmask)
+    return _SharedCalendar(name, weekmask, None)
+
+
+def _rebuild_calendar(
+    calendar: _SharedCalendar, arrays: dict[str, NDArray[Any]]
+) -> np.busdaycalendar | BusinessCalendar:
+    """Rebuild a calendar on top of its shared arrays."""
+    holidays = arrays[f"{calendar.name}_holidays"]
+    if calendar.bounds is None:
+        return np.busdaycalendar(weekmask=calendar.weekmask, holidays=holidays)
+
+    tables = CalendarTables(
+        *(arrays[f"{calendar.name}_{table}"] for table in CalendarTables._fields)
+    )
+    return BusinessCalendar._from_tables(  # noqa: SLF001
+        holidays, calendar.weekmask, *calendar.bounds, tables
+    )
@@ -2,10 +2,16 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 import numpy as np
-from pendulum.date import Date
+
+from quant_py.buscal import BusinessCalendar
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from numpy.typing import ArrayLike, NDArray
 
 
 class BusdayConvention(Enum):
@@ -27,22 +33,43 @@ class BusdayConvention(Enum):
 class Adjuster:
     """Contain business day adjuster logic."""
 
-    calendar: np.busdaycalendar
+    calendar: np.busdaycalendar | BusinessCalendar
     busday_conv: BusdayConvention
 
-    def adjust(self: Self, dt: Date) -> Date:
+    def adjust(self: Self, dt: date) -> date:
         """Apply these business day adjustments to ``date``.
 
         Args:
             dt: The date to adjust.
 
         Returns:
-            The adjusted date.
+            The adjusted date, of the same type as ``dt``.
         """
         if self.busday_conv == BusdayConvention.NONE:
             return dt
 
-        adjusted = np.busday_offset(  # type: ignore[no-matching-overload]
-            dt, offsets=0, roll=self.busday_conv.value, busdaycal=self.calendar
+        if isinstance(self.calendar, BusinessCalendar):
+            return self.calendar.roll_date(dt, self.busday_conv)
+
+        adjusted = self.adjust_many(np.datetime64(dt, "D"))[()]
+        return type(dt).fromordinal(adjusted.item().toordinal())
+
+    def adjust_many(self: Self, dts: ArrayLike) -> NDArray[np.datetime64]:
+        """Apply these business day adjustments to an array of dates.
+
+        Args:
+            dts: The dates to adjust, convertible to ``datetime64[D]``.
+
+        Returns:
+            The adjusted dates as a ``datetime64[D]`` array.
+        """
+        dts = np.asarray(dts, dtype="M8[D]")
+        if self.busday_conv == BusdayConvention.NONE:
+            return dts.copy()
+
+        if isinstance(self.calendar, BusinessCalendar):
+            return self.calendar.roll(dts, self.busday_conv)
+
+        return np.busday_offset(  # type: ignore[no-matching-overload]
+            dts, offsets=0, roll=self.busday_conv.value, busdaycal=self.calendar
         )
-        return adjusted.astype(Date)
@@ -0,0 +1,340 @@
+"""Vectorized construction of schedules for many trades at once."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from quant_py.dates import roll_to_day, tenor_in_months, ymd
+from quant_py.scheduling.adjuster import Adjuster
+from quant_py.scheduling.period import PeriodType
+from quant_py.scheduling.roll_convention import Bom, DayOfMonth, Eom
+from quant_py.scheduling.schedule import Schedule
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from numpy.typing import ArrayLike, NDArray
+    from pendulum.duration import Duration
+
+    from quant_py.buscal import BusinessCalendar
+    from quant_py.daycounter import Daycounter
+    from quant_py.scheduling.adjuster import BusdayConvention
+    from quant_py.scheduling.roll_convention import RollConventions
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class ScheduleBatch:
+    """Schedules for many trades stored as flat ``datetime64[D]`` columns.
+
+    The periods of trade ``i`` are the rows ``offsets[i]:offsets[i + 1]`` of each
+    date column. Indexing the batch returns the trade's ``Schedule`` as column views.
+
+    Attributes:
+        offsets: Row offsets of each trade's periods; has one more entry than trades.
+        start: Adjusted period start dates.
+        end: Adjusted period end dates.
+        unadj_start: Unadjusted period start dates.
+        unadj_end: Unadjusted period end dates.
+        period_types: ``PeriodType`` of each period as an int8 column.
+        roll_days: Day of month each trade rolls on (31 for eom, 1 for bom).
+        eom: Whether each trade rolls to the end of the month.
+        bom: Whether each trade rolls to the beginning of the month.
+        tenors: Tenor of each trade.
+        adjuster: Business day adjuster shared by all trades.
+    """
+
+    offsets: NDArray[np.int64]
+    start: NDArray[np.datetime64]
+    end: NDArray[np.datetime64]
+    unadj_start: NDArray[np.datetime64]
+    unadj_end: NDArray[np.datetime64]
+    period_types: NDArray[np.int8]
+    roll_days: NDArray[np.int64]
+    eom: NDArray[np.bool_]
+    bom: NDArray[np.bool_]
+    tenors: Sequence[Duration]
+    adjuster: Adjuster
+    _year_fracs: dict[tuple[Daycounter, bool], NDArray[np.float64]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __len__(self: Self) -> int:  # noqa: D105
+        return self.offsets.size - 1
+
+    def __getitem__(self: Self, idx: int) -> Schedule:
+        """Get the schedule of a single trade.
+
+        Args:
+            idx: Index of the trade in the batch.
+
+        Returns:
+            Schedule identical to the one built by ``Schedule.of`` for the trade.
+        """
+        rows = slice(self.offsets[idx], self.offsets[idx + 1])
+        return Schedule(
+            start=self.start[rows],
+            end=self.end[rows],
+            unadj_start=self.unadj_start[rows],
+            unadj_end=self.unadj_end[rows],
+            period_types=self.period_types[rows],
+            roll_conv=self._roll_conv(idx),
+            adjuster=self.adjuster,
+            tenor=self.tenors[idx],
+        )
+
+    def __iter__(self: Self) -> Iterator[Schedule]:  # noqa: D105
+        return (self[idx] for idx in range(len(self)))
+
+    @property
+    def counts(self: Self) -> NDArray[np.int64]:
+        """Get the number of periods in each trade's schedule."""
+        return np.diff(self.offsets)
+
+    def year_fracs(
+        self: Self, daycounter: Daycounter, *, adjusted: bool = True
+    ) -> NDArray[np.float64]:
+        """Get the year fractions of the periods of all trades.
+
+        The year fractions are computed in bulk on first use and memoized, so repeat
+        calls for the same daycounter return the same read-only array.
+
+        Args:
+            daycounter: Daycounter with desired daycount convention.
+            adjusted: Whether to calc the year fracs on adjusted or unadjusted dates.
+            Defaults to True.
+
+        Returns:
+            Year fraction of each period.
+        """
+        key = (daycounter, adjusted)
+        year_fracs = self._year_fracs.get(key)
+        if year_fracs is None:
+            year_fracs = (
+                daycounter.count_many(self.start, self.end)
+                if adjusted
+                else daycounter.count_many(self.unadj_start, self.unadj_end)
+            )
+            year_fracs.flags.writeable = False
+            self._year_fracs[key] = year_fracs
+        return year_fracs
+
+    @classmethod
+    def of(
+        cls: type[Self],
+        effective: ArrayLike,
+        termination: ArrayLike,
+        tenors: Sequence[Duration],
+        pay_cal: np.busdaycalendar | BusinessCalendar,
+        busday_conv: BusdayConvention,
+        front_stub: ArrayLike | None = None,
+        back_stub: ArrayLike | None = None,
+        *,
+        eom: ArrayLike | None = None,
+        bom: ArrayLike | None = None,
+    ) -> Self:
+        """Construct the schedules of many trades from their conventions.
+
+        Each trade gets exactly the periods ``Schedule.of`` would generate for it.
+        Only month and year based tenors are supported.
+
+        Args:
+            effective: Start date of each schedule.
+            termination: End date of each schedule.
+            tenors: The time interval between successive dates of each schedule.
+            pay_cal: Busday calendar to use to adjust schedule dates to busdays.
+            busday_conv: The busday adjust convention.
+            front_stub: First reg payment date of each trade, NaT if there's no front
+                stub. Defaults to None (no front stubs).
+            back_stub: Last reg payment date of each trade, NaT if there's no back
+                stub. Defaults to None (no back stubs).
+            eom: Whether each trade rolls to last cal day of month. Defaults to None.
+            bom: Whether each trade rolls to first cal day of month. Defaults to None.
+
+        Returns:
+            ScheduleBatch.
+        """
+        effective = np.asarray(effective, dtype="M8[D]")
+        termination = np.asarray(termination, dtype="M8[D]")
+        n_trades = effective.size
+        front = _dates_or_nat(front_stub, n_trades)
+        back = _dates_or_nat(back_stub, n_trades)
+        eom_ = _flags(eom, n_trades)
+        bom_ = _flags(bom, n_trades)
+        if np.any(eom_ & bom_):
+            msg = "Schedule cannot roll both beginning and end of month!"
+            raise ValueError(msg)
+
+        months = _tenors_in_months(tenors)
+
+        has_front = ~np.isnat(front)
+        has_back = ~np.isnat(back)
+        start = np.where(has_front, front, effective)
+        end = np.where(has_back, back, termination)
+
+        _, _, start_day = ymd(start)
+        roll_days = np.where(eom_, 31, np.where(bom_, 1, start_day))
+        n_regular, regular_start, regular_end = _regular_periods(
+            start, end, months, roll_days
+        )
+
+        counts = has_front.astype(np.int64) + n_regular + has_back
+        offsets = np.zeros(n_trades + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+
+        unadj_start = np.empty(offsets[-1], dtype="M8[D]")
+        unadj_end = np.empty(offsets[-1], dtype="M8[D]")
+
+        front_rows = offsets[:-1][has_front]
+        unadj_start[front_rows] = effective[has_front]
+        unadj_end[front_rows] = front[has_front]
+
+        back_rows = offsets[1:][has_back] - 1
+        unadj_start[back_rows] = back[has_back]
+        unadj_end[back_rows] = termination[has_back]
+
+        period_trade = np.repeat(np.arange(n_trades), n_regular)
+        j = np.arange(period_trade.size) - np.repeat(
+            np.cumsum(n_regular) - n_regular, n_regular
+        )
+        regular_rows = offsets[period_trade] + has_front[period_trade] + j
+        unadj_start[regular_rows] = regular_start
+        unadj_end[regular_rows] = regular_end
+
+        row_trade = np.repeat(np.arange(n_trades), counts)
+        row_months = months[row_trade].astype("m8[M]")
+        next_end = roll_to_day(
+            unadj_start.astype("M8[M]") + row_months, roll_days[row_trade]
+        )
+        prev_start = roll_to_day(
+            unadj_end.astype("M8[M]") - row_months, roll_days[row_trade]
+        )
+        # front stubs and the first rolled period are classified as front stubs, any
+        # other irregular period (an overshooting last rolled period or a back stub)
+        # as a back stub, as in Schedule.of
+        front_mask = np.zeros(offsets[-1], dtype=np.bool_)
+        front_mask[front_rows] = True
+        front_mask[(offsets[:-1] + has_front)[n_regular > 0]] = True
+        period_types = _classify(
+            unadj_start, unadj_end, next_end, prev_start, front_mask
+        )
+
+        adjuster = Adjuster(calendar=pay_cal, busday_conv=busday_conv)
+        return cls(
+            offsets=offsets,
+            start=adjuster.adjust_many(unadj_start),
+            end=adjuster.adjust_many(unadj_end),
+            unadj_start=unadj_start,
+            unadj_end=unadj_end,
+            period_types=period_types,
+            roll_days=roll_days,
+            eom=eom_,
+            bom=bom_,
+            tenors=tenors,
+            adjuster=adjuster,
+        )
+
+    def _roll_conv(self: Self, idx: int) -> RollConventions:
+        if self.eom[idx]:
+            return Eom()
+
+        if self.bom[idx]:
+            return Bom()
+
+        return DayOfMonth(int(self.roll_days[idx]))
+
+
+def _regular_periods(
+    start: NDArray[np.datetime64],
+    end: NDArray[np.datetime64],
+    months: NDArray[np.int64],
+    roll_days: NDArray[np.int64],
+) -> tuple[NDArray[np.int64], NDArray[np.datetime64], NDArray[np.datetime64]]:
+    """Roll every trade from its start until on or after its end.
+
+    Returns the number of periods of each trade and the flattened period dates.
+    """
+    start_month = start.astype("M8[M]")
+
+    # smallest k >= 1 such that the k-th regular date is on or after the end
+    month_gap = (end.astype("M8[M]") - start_month).astype(np.int64)
+    n_regular = np.maximum(1, -(-month_gap // months))
+    last = roll_to_day(start_month + (n_regular * months).astype("m8[M]"), roll_days)
+    n_regular += last < end
+    n_regular[start >= end] = 0
+
+    # regular dates 0..k of every trade; date 0 is the (unrolled) start
+    n_dates = np.where(n_regular > 0, n_regular + 1, 0)
+    date_trade = np.repeat(np.arange(start.size), n_dates)
+    k = np.arange(date_trade.size) - np.repeat(np.cumsum(n_dates) - n_dates, n_dates)
+    dates = roll_to_day(
+        start_month[date_trade] + (k * months[date_trade]).astype("m8[M]"),
+        roll_days[date_trade],
+    )
+    dates = np.where(k == 0, start[date_trade], dates)
+    return n_regular, dates[k != n_regular[date_trade]], dates[k != 0]
+
+
+def _classify(
+    unadj_start: NDArray[np.datetime64],
+    unadj_end: NDArray[np.datetime64],
+    next_end: NDArray[np.datetime64],
+    prev_start: NDArray[np.datetime64],
+    front: NDArray[np.bool_],
+) -> NDArray[np.int8]:
+    """Classify every period like ``Schedule.of`` does, in bulk.
+
+    ``next_end``/``prev_start`` are the regular dates rolled forward from each start
+    and back from each end; ``front`` is whether each irregular period is a front
+    stub (else a back stub).
+    """
+    regular = (unadj_end == next_end) & (unadj_start == prev_start)
+    return np.select(
+        [regular, front & (prev_start > unadj_start), front, next_end < unadj_end],
+        [
+            np.int8(PeriodType.REGULAR),
+            np.int8(PeriodType.LONG_FRONT),
+            np.int8(PeriodType.SHORT_FRONT),
+            np.int8(PeriodType.LONG_BACK),
+        ],
+        default=np.int8(PeriodType.SHORT_BACK),
+    ).astype(np.int8)
+
+
+def _tenors_in_months(tenors: Sequence[Duration]) -> NDArray[np.int64]:
+    # books share a handful of tenor objects, so convert each object once
+    converted: dict[int, int] = {}
+    months = np.fromiter(
+        (
+            converted[id(tenor)]
+            if id(tenor) in converted
+            else converted.setdefault(id(tenor), tenor_in_months(tenor) or 0)
+            for tenor in tenors
+        ),
+        dtype=np.int64,
+        count=len(tenors),
+    )
+    if np.any(months <= 0):
+        msg = "Batch schedules require positive month or year based tenors!"
+        raise ValueError(msg)
+
+    return months
+
+
+def _dates_or_nat(dates: ArrayLike | None, size: int) -> NDArray[np.datetime64]:
+    if dates is None:
+        return np.full(size, np.datetime64("NaT", "D"), dtype="M8[D]")
+
+    return np.asarray(dates, dtype="M8[D]")
+
+
+def _flags(flags: ArrayLike | None, size: int) -> NDArray[np.bool_]:
+    if flags is None:
+        return np.zeros(size, dtype=np.bool_)
+
+    return np.broadcast_to(np.asarray(flags, dtype=np.bool_), (size,))
@@ -0,0 +1,143 @@
+"""LRU cache in front of schedule generation."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, NamedTuple, Self
+
+from quant_py.buscal import calendar_key
+from quant_py.scheduling.schedule import Schedule
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    import numpy as np
+    from pendulum.date import Date
+    from pendulum.duration import Duration
+
+    from quant_py.buscal import BusinessCalendar
+    from quant_py.scheduling.adjuster import BusdayConvention
+
+
+class CacheInfo(NamedTuple):
+    """Schedule cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ScheduleCache:
+    """Bounded LRU cache of schedules keyed on their generating conventions.
+
+    Trades with identical terms share a single immutable ``Schedule`` instead of
+    each regenerating it with ``Schedule.of``.
+    """
+
+    def __init__(self: Self, maxsize: int = 4096) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of schedules to keep. Defaults to 4096.
+        """
+        if maxsize <= 0:
+            msg = "Cache maxsize must be positive!"
+            raise ValueError(msg)
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._schedules: OrderedDict[Hashable, Schedule] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self: Self) -> int:  # noqa: D105
+        return len(self._schedules)
+
+    def of(
+        self: Self,
+        effective: Date,
+        termination: Date,
+        tenor: Duration,
+        pay_cal: np.busdaycalendar | BusinessCalendar,
+        busday_conv: BusdayConvention,
+        front_stub: Date | None = None,
+        back_stub: Date | None = None,
+        *,
+        eom: bool = False,
+        bom: bool = False,
+    ) -> Schedule:
+        """Get the schedule for these conventions, generating it on a cache miss.
+
+        Takes the same arguments as ``Schedule.of``.
+
+        Args:
+            effective: Start date of the schedule.
+            termination: End date of the schedule.
+            tenor: The time interval between successive dates in the schedule.
+            pay_cal: Busday calendar to use to adjust schedule dates to busdays.
+            busday_conv: The busday adjust convention.
+            front_stub: First reg payment date (e.g. front is stub). Defaults to None.
+            back_stub: The last reg payment date (e.g. back is stub). Defaults to None.
+            eom: Whether to roll dates to last cal day of month. Defaults to False.
+            bom: Whether to roll dates to first cal day of month. Defaults to False.
+
+        Returns:
+            Schedule, shared with every other caller using the same conventions.
+        """
+        key = (
+            effective,
+            termination,
+            # pendulum durations of 6 months and 180 days compare equal
+            (tenor.years, tenor.months, tenor.weeks, tenor.remaining_days),
+            calendar_key(pay_cal),
+            busday_conv,
+            front_stub,
+            back_stub,
+            eom,
+            bom,
+        )
+        with self._lock:
+            schedule = self._schedules.get(key)
+            if schedule is not None:
+                self.hits += 1
+                self._schedules.move_to_end(key)
+                return schedule
+
+            self.misses += 1
+
+        schedule = Schedule.of(
+            effective=effective,
+            termination=termination,
+            tenor=tenor,
+            pay_cal=pay_cal,
+            busday_conv=busday_conv,
+            front_stub=front_stub,
+            back_stub=back_stub,
+            eom=eom,
+            bom=bom,
+        )
+        with self._lock:
+            schedule = self._schedules.setdefault(key, schedule)
+            if len(self._schedules) > self.maxsize:
+                self._schedules.popitem(last=False)
+        return schedule
+
+    def cache_info(self: Self) -> CacheInfo:
+        """Get the cache hit/miss statistics.
+
+        Returns:
+            Hits, misses, maximum and current size of the cache.
+        """
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._schedules),
+        )
+
+    def clear(self: Self) -> None:
+        """Remove every schedule from the cache and reset its statistics."""
+        with self._lock:
+            self._schedules.clear()
+            self.hits = 0
+            self.misses = 0
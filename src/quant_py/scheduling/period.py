@@ -1,16 +1,31 @@
 """Schedule period."""
 
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import TYPE_CHECKING, Self
 
 if TYPE_CHECKING:
-    from pendulum.date import Date
+    from datetime import date
+
     from pendulum.duration import Duration
 
     from quant_py.daycounter import Daycounter
     from quant_py.scheduling.roll_convention import RollConventions
 
 
+class PeriodType(IntEnum):
+    """Enumerate the types of schedule periods.
+
+    Long/short stubs are longer/shorter than the regular period they replace.
+    """
+
+    REGULAR = 0
+    SHORT_FRONT = 1
+    LONG_FRONT = 2
+    SHORT_BACK = 3
+    LONG_BACK = 4
+
+
 # TODO(jkitzlr): should this store all the necessary conventions to generate the dates?
 @dataclass(
     init=True,
@@ -28,10 +43,10 @@ class Period:
         start: The adjusted end date of the schedule period.
     """
 
-    start: Date
-    end: Date
-    unadj_start: Date
-    unadj_end: Date
+    start: date
+    end: date
+    unadj_start: date
+    unadj_end: date
 
     def __len__(self: Self) -> int:  # noqa: D105
         return self.length_in_days
@@ -39,7 +54,7 @@ class Period:
     @property
     def length_in_days(self: Self) -> int:
         """Get the number of days in the period."""
-        return (self.end - self.start).days
+        return self.end.toordinal() - self.start.toordinal()
 
     def calc_year_frac(
         self: Self, daycounter: Daycounter, *, adjusted: bool = True
@@ -86,32 +101,83 @@ class Period:
         """
         return not self.is_regular(roll_conv, tenor)
 
-    def is_long_stub(self: Self, roll_conv: RollConventions, tenor: Duration) -> bool:
+    def is_long_stub(
+        self: Self, roll_conv: RollConventions, tenor: Duration, *, front: bool = False
+    ) -> bool:
         """Determine if this period represents a long stub period.
 
         Args:
             roll_conv: The roll conventions to generate regular dates.
             tenor: The tenor/period between successive regular dates.
+            front: Whether the period is a front stub, compared to the regular period
+                ending on its end date rather than the one starting on its start
+                date. Defaults to False.
 
         Returns:
-            Indicator for whether the period is a stub.
+            Indicator for whether the period is a long stub.
         """
-        if self.is_regular(roll_conv, tenor):
-            return False
+        return classify_period(
+            self.unadj_start, self.unadj_end, roll_conv, tenor, front=front
+        ) in {PeriodType.LONG_FRONT, PeriodType.LONG_BACK}
 
-        return roll_conv.next(self.unadj_start, tenor) < self.unadj_end
-
-    def is_short_stub(self: Self, roll_conv: RollConventions, tenor: Duration) -> bool:
+    def is_short_stub(
+        self: Self, roll_conv: RollConventions, tenor: Duration, *, front: bool = False
+    ) -> bool:
         """Determine if this period represents a short stub period.
 
         Args:
             roll_conv: The roll conventions to generate regular dates.
             tenor: The tenor/period between successive regular dates.
+            front: Whether the period is a front stub, compared to the regular period
+                ending on its end date rather than the one starting on its start
+                date. Defaults to False.
 
         Returns:
-            Indicator for whether the period is a stub.
+            Indicator for whether the period is a short stub.
         """
-        if self.is_regular(roll_conv, tenor):
-            return False
+        return classify_period(
+            self.unadj_start, self.unadj_end, roll_conv, tenor, front=front
+        ) in {PeriodType.SHORT_FRONT, PeriodType.SHORT_BACK}
+
+
+def classify_period(
+    unadj_start: date,
+    unadj_end: date,
+    roll_conv: RollConventions,
+    tenor: Duration,
+    *,
+    front: bool,
+) -> PeriodType:
+    """Classify a period, comparing stubs to the regular period they replace.
+
+    Front stubs are anchored on their end date and compared to the regular period
+    ending there; back stubs are anchored on their start date and compared to the
+    regular period starting there.
+
+    Args:
+        unadj_start: The unadjusted start date of the period.
+        unadj_end: The unadjusted end date of the period.
+        roll_conv: The roll conventions to generate regular dates.
+        tenor: The tenor/period between successive regular dates.
+        front: Whether an irregular period is a front stub (else a back stub).
+
+    Returns:
+        Whether the period is regular or a short/long front/back stub.
+    """
+    if unadj_end == roll_conv.next(unadj_start, tenor) and (
+        unadj_start == roll_conv.previous(unadj_end, tenor)
+    ):
+        return PeriodType.REGULAR
+
+    if front:
+        return (
+            PeriodType.LONG_FRONT
+            if roll_conv.previous(unadj_end, tenor) > unadj_start
+            else PeriodType.SHORT_FRONT
+        )
 
-        return roll_conv.next(self.unadj_start, tenor) > self.unadj_end
+    return (
+        PeriodType.LONG_BACK
+        if roll_conv.next(unadj_start, tenor) < unadj_end
+        else PeriodType.SHORT_BACK
+    )
@@ -7,10 +7,14 @@ need a way to adjust the resulting date to the desired day of the month.
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Self, override
 
-from dateutil.relativedelta import relativedelta
+import numpy as np
+
+from quant_py.dates import add_tenor, roll_months, roll_to_day, tenor_in_months
 
 if TYPE_CHECKING:
-    from pendulum.date import Date
+    from datetime import date
+
+    from numpy.typing import NDArray
     from pendulum.duration import Duration
 
 
@@ -18,9 +22,23 @@ class RollConventions(ABC):
     """Define the interface for roll conventions.
 
     These handle adjusting dates in a date sequence (e.g. an accrual schedule).
+    Dates may be any ``datetime.date`` (e.g. ``pendulum.Date``) and are returned
+    as the same type.
+
+    Conventions that always roll to a fixed day of the month expose it as
+    ``roll_day``, which lets month and year based tenors be rolled with plain
+    integer (year, month, day) arithmetic instead of duration arithmetic.
     """
 
-    def next(self: Self, dt: Date, tenor: Duration) -> Date:
+    @property
+    def roll_day(self: Self) -> int | None:
+        """Get the day of month dates roll to, if the convention has a fixed one.
+
+        Days past the end of a month roll to its last day, so 31 means end of month.
+        """
+        return None
+
+    def next(self: Self, dt: date, tenor: Duration) -> date:
         """Calculate the next date in a sequence after ``dt``.
 
         Args:
@@ -30,9 +48,13 @@ class RollConventions(ABC):
         Returns:
             The next date in the sequence, adjusted as appropriate.
         """
-        return self.adjust(dt + tenor)
+        months = tenor_in_months(tenor)
+        if months is None or self.roll_day is None:
+            return self.adjust(add_tenor(dt, tenor))
 
-    def previous(self: Self, dt: Date, tenor: Duration) -> Date:
+        return roll_months(dt, months, self.roll_day)
+
+    def previous(self: Self, dt: date, tenor: Duration) -> date:
         """Calculate the previous date in a sequence before ``dt``.
 
         Args:
@@ -42,10 +64,41 @@ class RollConventions(ABC):
         Returns:
             The previous date in the sequence, adjusted as appropriate.
         """
-        return self.adjust(dt - tenor)
+        months = tenor_in_months(tenor)
+        if months is None or self.roll_day is None:
+            return self.adjust(add_tenor(dt, tenor, -1))
+
+        return roll_months(dt, -months, self.roll_day)
+
+    def sequence(
+        self: Self, dt: date, tenor: Duration, n: int
+    ) -> NDArray[np.datetime64]:
+        """Calculate the next ``n`` dates in a sequence after ``dt`` in one call.
+
+        Equivalent to calling ``next`` repeatedly, starting from ``dt``.
+
+        Args:
+            dt: The date to start the sequence from (not included in the result).
+            tenor: The tenor/period between dates in the sequence.
+            n: Number of dates to generate.
+
+        Returns:
+            ``datetime64[D]`` array of the next ``n`` dates in the sequence.
+        """
+        months = tenor_in_months(tenor)
+        if months is None or self.roll_day is None:
+            dates = np.empty(n, dtype="M8[D]")
+            for i in range(n):
+                dt = self.next(dt, tenor)
+                dates[i] = np.datetime64(dt, "D")
+            return dates
+
+        steps = np.arange(1, n + 1, dtype=np.int64) * months
+        start_month = np.datetime64(12 * (dt.year - 1970) + dt.month - 1, "M")
+        return roll_to_day(start_month + steps.astype("m8[M]"), self.roll_day)
 
     @abstractmethod
-    def adjust(self: Self, dt: Date) -> Date:
+    def adjust(self: Self, dt: date) -> date:
         """Adjust the input date to this roll day.
 
         Args:
@@ -70,8 +123,13 @@ class DayOfMonth(RollConventions):
 
         return False
 
+    @property
     @override
-    def adjust(self: Self, dt: Date) -> Date:
+    def roll_day(self: Self) -> int:
+        return self.day
+
+    @override
+    def adjust(self: Self, dt: date) -> date:
         """Adjust the input date to this roll day.
 
         NOTE: will automatically handle date overflow, e.g., setting roll day to
@@ -95,7 +153,7 @@ class DayOfMonth(RollConventions):
             >>> roll_day31.adjust(dt)
             Date(2025, 11, 30)
         """
-        return dt + relativedelta(day=self.day)
+        return roll_months(dt, 0, self.day)
 
 
 class Eom(RollConventions):
@@ -104,8 +162,13 @@ class Eom(RollConventions):
     def __eq__(self: Self, other: object) -> bool:  # noqa: D105
         return isinstance(other, Eom)
 
+    @property
+    @override
+    def roll_day(self: Self) -> int:
+        return 31
+
     @override
-    def adjust(self: Self, dt: Date) -> Date:
+    def adjust(self: Self, dt: date) -> date:
         """Adjust the input date to the last calendar day of the month.
 
         Args:
@@ -122,7 +185,7 @@ class Eom(RollConventions):
             >>> roll_day.adjust(dt)
             Date(2025, 11, 30)
         """
-        return dt.end_of(unit="month")
+        return roll_months(dt, 0, 31)
 
 
 class Bom(RollConventions):
@@ -131,8 +194,13 @@ class Bom(RollConventions):
     def __eq__(self: Self, other: object) -> bool:  # noqa: D105
         return isinstance(other, Bom)
 
+    @property
+    @override
+    def roll_day(self: Self) -> int:
+        return 1
+
     @override
-    def adjust(self: Self, dt: Date) -> Date:
+    def adjust(self: Self, dt: date) -> date:
         """Adjust the input date to the first calendar day of the month.
 
         Args:
@@ -149,4 +217,4 @@ class Bom(RollConventions):
             >>> roll_day.adjust(dt)
             Date(2025, 11, 1)
         """
-        return dt.start_of("month")
+        return dt.replace(day=1)
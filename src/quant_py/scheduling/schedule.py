@@ -1,42 +1,205 @@
-"""Scheudle class."""
+"""Schedule class."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Self
 
+import numpy as np
+
+from quant_py.dates import from_dates, to_date, to_dates
 from quant_py.scheduling.adjuster import Adjuster, BusdayConvention
-from quant_py.scheduling.period import Period
+from quant_py.scheduling.period import Period, PeriodType, classify_period
 from quant_py.scheduling.roll_convention import Bom, DayOfMonth, Eom, RollConventions
 
 if TYPE_CHECKING:
-    import numpy as np
-    from pendulum.date import Date
+    from collections.abc import Iterator, Mapping, Sequence
+    from datetime import date
+
+    from numpy.typing import NDArray
     from pendulum.duration import Duration
 
+    from quant_py.buscal import BusinessCalendar
+    from quant_py.daycounter import Daycounter
+
+_COLUMNS = ("start", "end", "unadj_start", "unadj_end")
+
 
 @dataclass(
     init=True,
     frozen=True,
     slots=True,
     weakref_slot=False,
+    eq=False,
+    kw_only=True,
 )
 class Schedule:
-    """Schedule. WIP."""
+    """Schedule backed by contiguous ``datetime64[D]`` date columns.
 
-    periods: list[Period]
+    Row ``i`` of each column holds the corresponding date of the ``i``-th period.
+    ``Period`` objects are only built on demand when iterating or indexing.
+
+    Construct a schedule from a list of its periods with ``Schedule.from_periods``.
+    All arguments are keyword only.
+
+    Attributes:
+        start: The adjusted start dates of the schedule periods.
+        end: The adjusted end dates of the schedule periods.
+        unadj_start: The unadjusted start dates of the schedule periods.
+        unadj_end: The unadjusted end dates of the schedule periods.
+        roll_conv: Roll conventions used to generate the regular dates.
+        adjuster: Business day adjuster applied to the unadjusted dates.
+        tenor: The time interval between successive regular dates.
+        period_types: ``PeriodType`` of each period as an int8 column.
+    """
+
+    start: NDArray[np.datetime64]
+    end: NDArray[np.datetime64]
+    unadj_start: NDArray[np.datetime64]
+    unadj_end: NDArray[np.datetime64]
     roll_conv: RollConventions
     adjuster: Adjuster
     tenor: Duration
+    period_types: NDArray[np.int8]
+    _year_fracs: dict[tuple[Daycounter, bool], NDArray[np.float64]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self: Self) -> None:
+        """Store read-only views of the date and period type columns."""
+        for name in _COLUMNS:
+            column = np.asarray(getattr(self, name), dtype="M8[D]").view()
+            column.flags.writeable = False
+            object.__setattr__(self, name, column)
+
+        period_types = np.asarray(self.period_types, dtype=np.int8).view()
+        period_types.flags.writeable = False
+        object.__setattr__(self, "period_types", period_types)
+
+    def __len__(self: Self) -> int:  # noqa: D105
+        return self.start.size
+
+    def __iter__(self: Self) -> Iterator[Period]:  # noqa: D105
+        return (self[idx] for idx in range(len(self)))
+
+    def __getitem__(self: Self, idx: int) -> Period:  # noqa: D105
+        start, end, unadj_start, unadj_end = (
+            to_date(getattr(self, name)[idx]) for name in _COLUMNS
+        )
+        return Period(
+            start=start, end=end, unadj_start=unadj_start, unadj_end=unadj_end
+        )
+
+    def __eq__(self: Self, other: object) -> bool:  # noqa: D105
+        if not isinstance(other, Schedule):
+            return False
+
+        return (
+            all(
+                np.array_equal(getattr(self, name), getattr(other, name))
+                for name in _COLUMNS
+            )
+            and np.array_equal(self.period_types, other.period_types)
+            and self.roll_conv == other.roll_conv
+            and self.adjuster == other.adjuster
+            and self.tenor == other.tenor
+        )
+
+    @property
+    def periods(self: Self) -> list[Period]:
+        """Get the schedule periods, built from the date columns."""
+        return [
+            Period(start=start, end=end, unadj_start=unadj_start, unadj_end=unadj_end)
+            for start, end, unadj_start, unadj_end in zip(
+                *(to_dates(getattr(self, name)) for name in _COLUMNS), strict=True
+            )
+        ]
+
+    @property
+    def stub_mask(self: Self) -> NDArray[np.bool_]:
+        """Get a mask of the periods which are stubs."""
+        return self.period_types != PeriodType.REGULAR
+
+    def period_type(self: Self, idx: int) -> PeriodType:
+        """Get the type of a period.
+
+        Args:
+            idx: Index of the period.
+
+        Returns:
+            Whether the period is regular or a short/long front/back stub.
+        """
+        return PeriodType(self.period_types[idx])
+
+    def year_fracs(
+        self: Self, daycounter: Daycounter, *, adjusted: bool = True
+    ) -> NDArray[np.float64]:
+        """Get the year fractions of all the periods.
+
+        The year fractions are computed in bulk on first use and memoized, so repeat
+        calls for the same daycounter return the same read-only array.
+
+        Args:
+            daycounter: Daycounter with desired daycount convention.
+            adjusted: Whether to calc the year fracs on adjusted or unadjusted dates.
+            Defaults to True.
+
+        Returns:
+            Year fraction of each period.
+        """
+        key = (daycounter, adjusted)
+        year_fracs = self._year_fracs.get(key)
+        if year_fracs is None:
+            year_fracs = (
+                daycounter.count_many(self.start, self.end)
+                if adjusted
+                else daycounter.count_many(self.unadj_start, self.unadj_end)
+            )
+            year_fracs.flags.writeable = False
+            self._year_fracs[key] = year_fracs
+        return year_fracs
+
+    @classmethod
+    def from_periods(
+        cls: type[Self],
+        periods: Sequence[Period],
+        roll_conv: RollConventions,
+        adjuster: Adjuster,
+        tenor: Duration,
+    ) -> Self:
+        """Construct the Schedule object from a sequence of periods.
+
+        Args:
+            periods: The schedule periods.
+            roll_conv: Roll conventions used to generate the regular dates.
+            adjuster: Business day adjuster applied to the unadjusted dates.
+            tenor: The time interval between successive regular dates.
+
+        Returns:
+            Schedule.
+        """
+        start, end, unadj_start, unadj_end = (
+            from_dates(getattr(period, name) for period in periods) for name in _COLUMNS
+        )
+        return cls(
+            start=start,
+            end=end,
+            unadj_start=unadj_start,
+            unadj_end=unadj_end,
+            roll_conv=roll_conv,
+            adjuster=adjuster,
+            tenor=tenor,
+            period_types=_classify(unadj_start, unadj_end, roll_conv, tenor),
+        )
 
     @classmethod
     def of(
         cls: type[Self],
-        effective: Date,
-        termination: Date,
+        effective: date,
+        termination: date,
         tenor: Duration,
-        pay_cal: np.busdaycalendar,
+        pay_cal: np.busdaycalendar | BusinessCalendar,
         busday_conv: BusdayConvention,
-        front_stub: Date | None = None,
-        back_stub: Date | None = None,
+        front_stub: date | None = None,
+        back_stub: date | None = None,
         *,
         eom: bool = False,
         bom: bool = False,
@@ -59,57 +222,52 @@ class Schedule:
         """
         adjuster = Adjuster(calendar=pay_cal, busday_conv=busday_conv)
 
-        periods: list[Period] = []
+        unadj_dates: list[tuple[date, date]] = []
 
         start = effective
         # handle case where there's a front stub
         if front_stub is not None:
-            periods.append(
-                Period(
-                    start=adjuster.adjust(effective),
-                    end=adjuster.adjust(front_stub),
-                    unadj_start=effective,
-                    unadj_end=front_stub,
-                )
-            )
+            unadj_dates.append((effective, front_stub))
             start = front_stub
 
         roll_conv = cls._get_roll_conv(start, eom=eom, bom=bom)
         end = back_stub or termination
 
+        # only the stubs, the first rolled period and a last rolled period that
+        # overshoots the end can be irregular; the rest are regular by construction.
+        # Each maps to whether it is classified as a front (rather than back) stub.
+        irregular_rows = {0: True} if front_stub is not None else {}
+        first_rolled = len(unadj_dates)
         dt = start
         while dt < end:
             p_end = roll_conv.next(dt, tenor)
-            periods.append(
-                Period(
-                    start=adjuster.adjust(dt),
-                    end=adjuster.adjust(p_end),
-                    unadj_start=dt,
-                    unadj_end=p_end,
-                )
-            )
+            unadj_dates.append((dt, p_end))
             dt = p_end
+        if len(unadj_dates) > first_rolled:
+            irregular_rows[first_rolled] = True
+            if dt > end:
+                irregular_rows.setdefault(len(unadj_dates) - 1, False)
 
         # handle back stubs
         if back_stub is not None:
-            periods.append(
-                Period(
-                    start=adjuster.adjust(back_stub),
-                    end=adjuster.adjust(termination),
-                    unadj_start=back_stub,
-                    unadj_end=termination,
-                )
-            )
+            unadj_dates.append((back_stub, termination))
+            irregular_rows[len(unadj_dates) - 1] = False
 
+        unadj_start = from_dates(dt for dt, _ in unadj_dates)
+        unadj_end = from_dates(dt for _, dt in unadj_dates)
         return cls(
-            periods=periods,
+            start=adjuster.adjust_many(unadj_start),
+            end=adjuster.adjust_many(unadj_end),
+            unadj_start=unadj_start,
+            unadj_end=unadj_end,
             roll_conv=roll_conv,
             adjuster=adjuster,
             tenor=tenor,
+            period_types=_classify_rows(unadj_dates, irregular_rows, roll_conv, tenor),
         )
 
     @staticmethod
-    def _get_roll_conv(start: Date, *, eom: bool, bom: bool) -> RollConventions:
+    def _get_roll_conv(start: date, *, eom: bool, bom: bool) -> RollConventions:
         if eom and bom:
             msg = "Schedule cannot roll both beginning and end of month!"
             raise ValueError(msg)
@@ -121,3 +279,35 @@ class Schedule:
             return Bom()
 
         return DayOfMonth(start.day)
+
+
+def _classify(
+    unadj_start: NDArray[np.datetime64],
+    unadj_end: NDArray[np.datetime64],
+    roll_conv: RollConventions,
+    tenor: Duration,
+) -> NDArray[np.int8]:
+    """Classify every period; irregular ones before any regular one are front stubs."""
+    period_types: list[PeriodType] = []
+    front = True
+    for start, end in zip(unadj_start.tolist(), unadj_end.tolist(), strict=True):
+        period_type = classify_period(start, end, roll_conv, tenor, front=front)
+        front = front and period_type != PeriodType.REGULAR
+        period_types.append(period_type)
+    return np.array(period_types, dtype=np.int8)
+
+
+def _classify_rows(
+    unadj_dates: Sequence[tuple[date, date]],
+    rows: Mapping[int, bool],
+    roll_conv: RollConventions,
+    tenor: Duration,
+) -> NDArray[np.int8]:
+    """Classify only the given rows, as front stubs or not; the rest are regular."""
+    classified = {
+        row: classify_period(*unadj_dates[row], roll_conv, tenor, front=front)
+        for row, front in rows.items()
+    }
+    period_types = np.zeros(len(unadj_dates), dtype=np.int8)
+    period_types[list(classified)] = list(classified.values())
+    return period_types
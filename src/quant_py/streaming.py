@@ -0,0 +1,412 @@
+"""Streaming schedule and cashflow generation for books too large for memory.
+
+The pipeline reads trade terms in chunks, builds each chunk's schedules in one
+batch and yields the coupons as fixed-size columnar batches, so peak memory is
+bounded by the chunk and batch sizes rather than the size of the book. Each stage
+is a generator; with prefetching every stage runs on its own thread, a bounded
+number of items ahead of the stage consuming it.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, Self
+
+import numpy as np
+
+from quant_py.lazy import lazy_import
+from quant_py.scheduling.batch import ScheduleBatch
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator
+
+    from numpy.typing import NDArray
+
+    from quant_py.buscal import BusinessCalendar
+    from quant_py.daycounter import Daycounter
+    from quant_py.scheduling.adjuster import BusdayConvention
+
+pendulum = lazy_import("pendulum")
+
+_NAT = np.datetime64("NaT", "D")
+_TERM_DTYPES = (
+    "M8[D]",
+    "M8[D]",
+    np.int64,
+    np.float64,
+    np.float64,
+    "M8[D]",
+    "M8[D]",
+    bool,
+    bool,
+)
+# fill values of the optional columns when they're not given
+_TERM_DEFAULTS = {"front_stub": _NAT, "back_stub": _NAT, "eom": False, "bom": False}
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class TradeTerms:
+    """Terms of fixed rate trades stored as columns.
+
+    Columns are only converted if they are not of their dtype already, so memory
+    mapped columns (e.g. from ``np.load(path, mmap_mode="r")``) stay on disk until
+    the rows of a chunk are read.
+
+    Attributes:
+        effective: Start date of each trade.
+        termination: End date of each trade.
+        tenor_months: Coupon tenor of each trade in months.
+        rates: Fixed rate of each trade.
+        notionals: Notional of each trade.
+        front_stub: First regular payment date of each trade, NaT if there's no
+            front stub. Defaults to None (no front stubs).
+        back_stub: Last regular payment date of each trade, NaT if there's no back
+            stub. Defaults to None (no back stubs).
+        eom: Whether each trade rolls to the end of the month. Defaults to None.
+        bom: Whether each trade rolls to the beginning of the month. Defaults to
+            None.
+    """
+
+    effective: NDArray[np.datetime64]
+    termination: NDArray[np.datetime64]
+    tenor_months: NDArray[np.int64]
+    rates: NDArray[np.float64]
+    notionals: NDArray[np.float64]
+    front_stub: NDArray[np.datetime64] | None = None
+    back_stub: NDArray[np.datetime64] | None = None
+    eom: NDArray[np.bool_] | None = None
+    bom: NDArray[np.bool_] | None = None
+
+    def __post_init__(self: Self) -> None:
+        """Convert the columns to their dtypes and check they line up."""
+        shape = np.shape(self.effective)
+        columns = {}
+        for column, dtype in zip(fields(self), _TERM_DTYPES, strict=True):
+            value = getattr(self, column.name)
+            columns[column.name] = (
+                np.broadcast_to(np.array(_TERM_DEFAULTS[column.name], dtype), shape)
+                if value is None
+                else np.asarray(value, dtype=dtype)
+            )
+        if len(shape) != 1 or any(column.shape != shape for column in columns.values()):
+            msg = "Trade term columns must be 1-d arrays of equal length!"
+            raise ValueError(msg)
+
+        for name, column in columns.items():
+            object.__setattr__(self, name, column)
+
+    def __len__(self: Self) -> int:  # noqa: D105
+        return self.effective.size
+
+    def __getitem__(self: Self, rows: slice) -> TradeTerms:
+        """Get the terms of a range of trades as views of the columns.
+
+        Args:
+            rows: Slice of the trades to get.
+
+        Returns:
+            TradeTerms.
+        """
+        return type(self)(
+            **{column.name: getattr(self, column.name)[rows] for column in fields(self)}
+        )
+
+
+class ColumnBatch(Protocol):
+    """Named tuple of equal length 1-d columns, e.g. ``CashflowBatch``."""
+
+    def __iter__(self: Self) -> Iterator[NDArray[Any]]: ...  # noqa: D105
+
+    def __getitem__(self: Self, index: int, /) -> NDArray[Any]: ...  # noqa: D105
+
+    @classmethod
+    def _make(cls, iterable: Iterable[NDArray[Any]]) -> Self: ...
+
+
+class ScheduleChunk(NamedTuple):
+    """Schedules of a chunk of trades.
+
+    Attributes:
+        first: Row of the chunk's first trade in the book.
+        terms: Terms of the trades.
+        schedules: Schedule of each trade.
+    """
+
+    first: int
+    terms: TradeTerms
+    schedules: ScheduleBatch
+
+
+class CashflowBatch(NamedTuple):
+    """Fixed coupons of a book's trades stored as columns.
+
+    Each coupon is paid on the adjusted end date of its period.
+
+    Attributes:
+        trades: Row of each coupon's trade in the book.
+        start: Adjusted accrual start date of each coupon.
+        end: Adjusted accrual end date of each coupon.
+        period_types: ``PeriodType`` of each coupon's period as an int8 column.
+        year_fracs: Year fraction of each coupon's period.
+        amounts: Amount of each coupon.
+    """
+
+    trades: NDArray[np.int64]
+    start: NDArray[np.datetime64]
+    end: NDArray[np.datetime64]
+    period_types: NDArray[np.int8]
+    year_fracs: NDArray[np.float64]
+    amounts: NDArray[np.float64]
+
+
+@dataclass(
+    init=True,
+    frozen=True,
+    slots=True,
+    weakref_slot=False,
+)
+class CashflowPipeline:
+    """Stream the fixed coupons of a book of trades in fixed-size batches.
+
+    Schedules are generated with the conventions of ``Schedule.of`` (via
+    ``ScheduleBatch.of``) on a single calendar and busday convention.
+
+    Attributes:
+        pay_cal: Busday calendar to use to adjust schedule dates to busdays.
+        busday_conv: The busday adjust convention.
+        daycounter: Daycounter of the fixed rates.
+        chunk_size: Maximum number of trades scheduled at once. Defaults to 50,000.
+        batch_size: Number of coupons in each batch yielded; only the last batch
+            may be smaller. Defaults to 100,000.
+        prefetch: Number of items each stage may run ahead of the next, on its own
+            thread. Defaults to 1; 0 runs every stage on the consumer's thread.
+    """
+
+    pay_cal: np.busdaycalendar | BusinessCalendar
+    busday_conv: BusdayConvention
+    daycounter: Daycounter
+    chunk_size: int = 50_000
+    batch_size: int = 100_000
+    prefetch: int = 1
+
+    def __post_init__(self: Self) -> None:
+        """Check the chunk and batch sizes."""
+        if self.chunk_size <= 0 or self.batch_size <= 0:
+            msg = "Chunk and batch sizes must be positive!"
+            raise ValueError(msg)
+
+        if self.prefetch < 0:
+            msg = "Prefetch depth cannot be negative!"
+            raise ValueError(msg)
+
+    def chunks(
+        self: Self, terms: TradeTerms | Iterable[TradeTerms]
+    ) -> Iterator[TradeTerms]:
+        """Cut trade terms into chunks of at most ``chunk_size`` trades.
+
+        Args:
+            terms: Terms of the book, whole or already in chunks of any size.
+
+        Yields:
+            Terms of each chunk, as views of the input columns.
+        """
+        for part in [terms] if isinstance(terms, TradeTerms) else terms:
+            for start in range(0, len(part), self.chunk_size):
+                yield part[start : start + self.chunk_size]
+
+    def schedules(self: Self, chunks: Iterable[TradeTerms]) -> Iterator[ScheduleChunk]:
+        """Build the schedules of each chunk of trades.
+
+        Args:
+            chunks: Terms of consecutive chunks of the book.
+
+        Yields:
+            Schedules of each chunk.
+        """
+        first = 0
+        tenors: dict[int, Any] = {}
+        for terms in chunks:
+            months = terms.tenor_months.tolist()
+            for n in set(months) - tenors.keys():
+                if n <= 0:
+                    msg = "Trade tenors must be a positive number of months!"
+                    raise ValueError(msg)
+                tenors[n] = pendulum.Duration(months=n)
+
+            schedules = ScheduleBatch.of(
+                terms.effective,
+                terms.termination,
+                [tenors[n] for n in months],
+                self.pay_cal,
+                self.busday_conv,
+                terms.front_stub,
+                terms.back_stub,
+                eom=terms.eom,
+                bom=terms.bom,
+            )
+            yield ScheduleChunk(first, terms, schedules)
+            first += len(terms)
+
+    def cashflows(
+        self: Self, chunks: Iterable[ScheduleChunk]
+    ) -> Iterator[CashflowBatch]:
+        """Compute the coupons of each chunk of scheduled trades.
+
+        Args:
+            chunks: Schedules of consecutive chunks of the book.
+
+        Yields:
+            Coupons of each chunk, one batch per chunk.
+        """
+        for first, terms, schedules in chunks:
+            counts = schedules.counts
+            year_fracs = schedules.year_fracs(self.daycounter)
+            yield CashflowBatch(
+                trades=np.repeat(np.arange(first, first + len(terms)), counts),
+                start=schedules.start,
+                end=schedules.end,
+                period_types=schedules.period_types,
+                year_fracs=year_fracs,
+                amounts=np.repeat(terms.notionals * terms.rates, counts) * year_fracs,
+            )
+
+    def stream(
+        self: Self, terms: TradeTerms | Iterable[TradeTerms]
+    ) -> Iterator[CashflowBatch]:
+        """Generate the coupons of a book.
+
+        Args:
+            terms: Terms of the book, whole or in chunks (e.g. as read from disk).
+
+        Yields:
+            Coupons of the book in trade order, ``batch_size`` at a time.
+        """
+        chunks = self._ahead(self.chunks(terms))
+        schedules = self._ahead(self.schedules(chunks))
+        yield from rebatch(self._ahead(self.cashflows(schedules)), self.batch_size)
+
+    def _ahead[T](self: Self, items: Iterator[T]) -> Iterator[T]:
+        return prefetch(items, self.prefetch) if self.prefetch else items
+
+
+def rebatch[T: ColumnBatch](batches: Iterable[T], size: int) -> Iterator[T]:
+    """Regroup a stream of columnar batches into batches of a fixed size.
+
+    Args:
+        batches: Named tuples of equal length 1-d columns, of any length.
+        size: Number of rows in each batch yielded.
+
+    Yields:
+        Batches of ``size`` rows with the rows in order; the last may be smaller.
+    """
+    pending: list[T] = []
+    n_pending = 0
+    for batch in batches:
+        pending.append(batch)
+        n_pending += _n_rows(batch)
+        if n_pending < size:
+            continue
+
+        merged = _concat(pending)
+        n_full = n_pending - n_pending % size
+        for start in range(0, n_full, size):
+            yield _rows(merged, slice(start, start + size))
+        n_pending -= n_full
+        # a view of the remainder would keep all of merged alive until the next batch
+        pending = [_rows(merged, slice(n_full, None), copy=True)] if n_pending else []
+
+    if n_pending:
+        yield _concat(pending)
+
+
+def prefetch[T](items: Iterable[T], depth: int = 1) -> Generator[T]:
+    """Run an iterable on a background thread, buffering items ahead of use.
+
+    Exceptions raised by the iterable are re-raised to the consumer. Closing the
+    returned generator early stops the thread and closes the iterable.
+
+    Args:
+        items: The iterable to run, e.g. a generator stage.
+        depth: Maximum number of items produced but not yet consumed. Defaults to 1.
+
+    Yields:
+        The items of the iterable.
+    """
+    buffer: queue.Queue[tuple[bool, Any]] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_produce, args=(items, buffer, stop), name="prefetch", daemon=True
+    )
+    thread.start()
+    try:
+        while True:
+            done, item = buffer.get()
+            if done:
+                if item is not None:
+                    raise item
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _produce(
+    items: Iterable[object],
+    buffer: queue.Queue[tuple[bool, Any]],
+    stop: threading.Event,
+) -> None:
+    """Put the items of an iterable, then its outcome, in the prefetch buffer.
+
+    Each entry is a (done, item) pair; the final entry is done with the exception
+    raised by the iterable, if any. Gives up once the consumer sets ``stop``.
+    """
+    iterator = iter(items)
+    try:
+        for item in iterator:
+            if not _put(buffer, stop, (False, item)):
+                return
+    except BaseException as exc:  # noqa: BLE001
+        _put(buffer, stop, (True, exc))
+    else:
+        _put(buffer, stop, (True, None))
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+def _put(
+    buffer: queue.Queue[tuple[bool, Any]],
+    stop: threading.Event,
+    entry: tuple[bool, Any],
+) -> bool:
+    """Put an entry in a bounded buffer unless stopped while waiting for space."""
+    while not stop.is_set():
+        try:
+            buffer.put(entry, timeout=0.1)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _n_rows(batch: ColumnBatch) -> int:
+    return len(batch[0])
+
+
+def _concat[T: ColumnBatch](batches: list[T]) -> T:
+    if len(batches) == 1:
+        return batches[0]
+    return batches[0]._make(map(np.concatenate, zip(*batches, strict=True)))
+
+
+def _rows[T: ColumnBatch](batch: T, rows: slice, *, copy: bool = False) -> T:
+    return batch._make(
+        column[rows].copy() if copy else column[rows] for column in batch
+    )
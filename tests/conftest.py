@@ -1,5 +1,13 @@
 import numpy as np
 import pytest
+from pendulum.duration import Duration
+
+from quant_py.curves.discount_curve import DiscountCurve
+from quant_py.curves.interpolation import Interpolation
+from quant_py.daycounters.act360 import Act360
+from quant_py.daycounters.act365f import Act365F
+from quant_py.indices.ois_index import OisRateIndexMetadata
+from quant_py.scheduling.adjuster import BusdayConvention
 
 
 @pytest.fixture
@@ -25,3 +33,74 @@ def sifma() -> np.busdaycalendar:
         weekmask="1111100",
         holidays=holidays,
     )
+
+
+@pytest.fixture
+def sofr_metadata(sifma: np.busdaycalendar) -> OisRateIndexMetadata:
+    return OisRateIndexMetadata(
+        name="SOFR",
+        currency="USD",
+        pay_cal=sifma,
+        busday_conv=BusdayConvention.MODIFIEDFOLLOWING,
+        daycounter=Act360(),
+        publish_lag=1,
+    )
+
+
+@pytest.fixture
+def ois_tenors() -> list[Duration]:
+    return [
+        Duration(weeks=1),
+        Duration(months=1),
+        Duration(months=3),
+        Duration(months=6),
+        Duration(months=9),
+        Duration(years=1),
+        Duration(months=18),
+        Duration(years=2),
+        Duration(years=3),
+        Duration(years=5),
+        Duration(years=7),
+        Duration(years=10),
+        Duration(years=15),
+        Duration(years=20),
+        Duration(years=30),
+    ]
+
+
+@pytest.fixture
+def ois_quotes() -> np.ndarray:
+    return np.array(
+        [
+            0.0433,
+            0.0431,
+            0.0425,
+            0.0412,
+            0.0401,
+            0.0392,
+            0.0375,
+            0.0363,
+            0.0352,
+            0.0348,
+            0.0352,
+            0.0361,
+            0.0372,
+            0.0376,
+            0.0369,
+        ]
+    )
+
+
+@pytest.fixture
+def sofr_curve() -> DiscountCurve:
+    pillars = np.array(
+        ["2025-09-15", "2026-02-17", "2026-08-17", "2027-08-16", "2030-08-15"],
+        dtype="M8[D]",
+    )
+    return DiscountCurve.from_zero_rates(
+        np.datetime64("2025-08-15"),
+        pillars,
+        [0.043, 0.042, 0.04, 0.038, 0.037],
+        Act365F(),
+        Interpolation.MONOTONE_CONVEX,
+    )
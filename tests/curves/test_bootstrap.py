@@ -0,0 +1,131 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from quant_py.curves.bootstrap import OisBootstrapper
+from quant_py.curves.discount_curve import DiscountCurve
+from quant_py.curves.interpolation import Interpolation
+
+if TYPE_CHECKING:
+    from pendulum.duration import Duration
+
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+
+REF_DT = np.datetime64("2025-08-13")
+
+
+def _swap_pvs(
+    bootstrapper: OisBootstrapper, curve: DiscountCurve, quotes: np.ndarray
+) -> np.ndarray:
+    pvs = []
+    for i, schedule in enumerate(bootstrapper.schedules):
+        year_fracs = schedule.year_fracs(bootstrapper.metadata.daycounter)
+        fixed = quotes[i] * np.sum(year_fracs * curve.df(schedule.end))
+        floating = curve.df(schedule.start[:1])[0] - curve.df(schedule.end[-1:])[0]
+        pvs.append(fixed - floating)
+    return np.array(pvs)
+
+
+@pytest.mark.parametrize(argnames="interpolation", argvalues=list(Interpolation))
+@pytest.mark.unit
+def test_reprices_quotes(
+    interpolation: Interpolation,
+    sofr_metadata: OisRateIndexMetadata,
+    ois_tenors: list[Duration],
+    ois_quotes: np.ndarray,
+) -> None:
+    bootstrapper = OisBootstrapper(
+        REF_DT, ois_tenors, sofr_metadata, interpolation=interpolation
+    )
+    result = bootstrapper.solve(ois_quotes)
+    assert result.max_residual < 1e-12
+    np.testing.assert_allclose(
+        _swap_pvs(bootstrapper, result.curve, ois_quotes), 0.0, atol=1e-12
+    )
+    np.testing.assert_array_equal(result.curve.pillars, bootstrapper.pillars)
+
+
+@pytest.mark.unit
+def test_schedules(
+    sofr_metadata: OisRateIndexMetadata, ois_tenors: list[Duration]
+) -> None:
+    bootstrapper = OisBootstrapper(REF_DT, ois_tenors, sofr_metadata)
+    # spot is 2025-08-15; the 18m swap has a 6m front stub
+    schedule = bootstrapper.schedules[ois_tenors.index(ois_tenors[6])]
+    np.testing.assert_array_equal(
+        schedule.unadj_end, np.array(["2026-02-15", "2027-02-15"], dtype="M8[D]")
+    )
+    np.testing.assert_array_equal(bootstrapper.schedules.counts[:6], 1)
+    assert bootstrapper.schedules.counts[-1] == 30
+
+
+@pytest.mark.parametrize(argnames="interpolation", argvalues=list(Interpolation))
+@pytest.mark.unit
+def test_warm_start(
+    interpolation: Interpolation,
+    sofr_metadata: OisRateIndexMetadata,
+    ois_tenors: list[Duration],
+    ois_quotes: np.ndarray,
+) -> None:
+    bootstrapper = OisBootstrapper(
+        REF_DT, ois_tenors, sofr_metadata, interpolation=interpolation
+    )
+    cold = bootstrapper.solve(ois_quotes)
+    shocked = ois_quotes + np.random.default_rng(3).normal(
+        scale=1e-5, size=ois_quotes.size
+    )
+    warm = bootstrapper.solve(shocked, guess=cold.curve)
+    assert warm.iterations <= 2
+    assert warm.iterations < bootstrapper.solve(shocked).iterations
+    np.testing.assert_allclose(
+        _swap_pvs(bootstrapper, warm.curve, shocked), 0.0, atol=1e-12
+    )
+
+
+@pytest.mark.unit
+def test_jacobian(
+    sofr_metadata: OisRateIndexMetadata,
+    ois_tenors: list[Duration],
+    ois_quotes: np.ndarray,
+) -> None:
+    bootstrapper = OisBootstrapper(
+        REF_DT, ois_tenors, sofr_metadata, interpolation=Interpolation.MONOTONE_CONVEX
+    )
+    result = bootstrapper.solve(ois_quotes)
+    log_dfs = np.log(result.curve.dfs)
+    h = 1e-7
+    for k in (0, 5, 9, 14):
+        bumped = []
+        for sign in (1.0, -1.0):
+            dfs = result.curve.dfs.copy()
+            dfs[k] = np.exp(log_dfs[k] + sign * h)
+            curve = DiscountCurve(
+                REF_DT,
+                result.curve.pillars,
+                dfs,
+                result.curve.daycounter,
+                result.curve.interpolation,
+            )
+            bumped.append(_swap_pvs(bootstrapper, curve, ois_quotes))
+        np.testing.assert_allclose(
+            result.jacobian[:, k], (bumped[0] - bumped[1]) / (2 * h), atol=1e-7
+        )
+
+
+@pytest.mark.unit
+def test_bad_quotes(
+    sofr_metadata: OisRateIndexMetadata,
+    ois_tenors: list[Duration],
+    ois_quotes: np.ndarray,
+) -> None:
+    with pytest.raises(ValueError, match="one quote per swap"):
+        _ = OisBootstrapper(REF_DT, ois_tenors, sofr_metadata).solve(ois_quotes[:-1])
+
+
+@pytest.mark.unit
+def test_unsorted_tenors(
+    sofr_metadata: OisRateIndexMetadata, ois_tenors: list[Duration]
+) -> None:
+    with pytest.raises(ValueError, match="strictly increasing"):
+        _ = OisBootstrapper(REF_DT, ois_tenors[::-1], sofr_metadata)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from quant_py.curves.discount_curve import DiscountCurve
+from quant_py.curves.interpolation import Interpolation
+from quant_py.daycounters.act360 import Act360
+from quant_py.daycounters.act365f import Act365F
+
+REF_DT = np.datetime64("2025-08-15")
+PILLARS = np.array(
+    ["2025-11-17", "2026-02-17", "2026-08-17", "2027-08-16", "2030-08-15"],
+    dtype="M8[D]",
+)
+ZEROS = np.array([0.043, 0.042, 0.04, 0.038, 0.037])
+
+
+@pytest.fixture(params=list(Interpolation))
+def curve(request: pytest.FixtureRequest) -> DiscountCurve:
+    return DiscountCurve.from_zero_rates(
+        REF_DT, PILLARS, ZEROS, Act365F(), request.param
+    )
+
+
+@pytest.mark.unit
+def test_pillars(curve: DiscountCurve) -> None:
+    np.testing.assert_allclose(curve.zero_rates(PILLARS), ZEROS)
+    np.testing.assert_allclose(curve.df(PILLARS), np.exp(-ZEROS * curve.pillar_times))
+    assert curve.df([REF_DT])[0] == 1.0
+
+
+@pytest.mark.unit
+def test_forward_rates(curve: DiscountCurve) -> None:
+    starts = np.array(["2025-08-15", "2026-01-05", "2028-03-01"], dtype="M8[D]")
+    ends = np.array(["2025-09-15", "2026-07-06", "2028-09-01"], dtype="M8[D]")
+    dfs = curve.df(starts) / curve.df(ends)
+    expected = (dfs - 1.0) / Act365F().count_many(starts, ends)
+    np.testing.assert_allclose(curve.forward_rates(starts, ends), expected)
+
+
+@pytest.mark.unit
+def test_short_rate() -> None:
+    curve = DiscountCurve.from_zero_rates(REF_DT, PILLARS, ZEROS, Act365F())
+    assert curve.zero_rates([REF_DT])[0] == pytest.approx(ZEROS[0])
+
+
+@pytest.mark.unit
+def test_dates_shape(curve: DiscountCurve) -> None:
+    dts = np.array(
+        [["2026-01-01", "2027-01-01"], ["2035-01-01", "2025-08-15"]], "M8[D]"
+    )
+    assert curve.df(dts).shape == (2, 2)
+
+
+@pytest.mark.unit
+def test_repeated_dates(curve: DiscountCurve) -> None:
+    dts = np.datetime64("2026-01-01") + np.tile(np.arange(10), 5).astype("m8[D]")
+    expected = [curve.df([dt])[0] for dt in dts]
+    np.testing.assert_allclose(curve.df(dts.reshape(5, 10)).ravel(), expected)
+    with pytest.raises(ValueError, match="before its reference date"):
+        _ = curve.df(np.repeat(np.datetime64("2025-08-14"), 5))
+    dense = curve.jacobian(dts).dense()
+    expected = np.vstack([curve.jacobian([dt]).dense() for dt in dts])
+    np.testing.assert_allclose(dense, expected, atol=1e-15)
+
+
+@pytest.mark.unit
+def test_before_ref_dt(curve: DiscountCurve) -> None:
+    with pytest.raises(ValueError, match="before its reference date"):
+        _ = curve.df(["2025-08-14"])
+
+
+@pytest.mark.parametrize(
+    argnames=("pillars", "dfs", "match"),
+    argvalues=[
+        (PILLARS[::-1], np.full(5, 0.9), "strictly increasing"),
+        (np.array(["2025-08-15"], dtype="M8[D]"), [0.99], "after the reference"),
+        (PILLARS, np.full(4, 0.9), "equal length"),
+        (PILLARS, [0.99, 0.98, 0.0, 0.95, 0.9], "positive"),
+    ],
+)
+@pytest.mark.unit
+def test_invalid(pillars: np.ndarray, dfs: list[float], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        _ = DiscountCurve(REF_DT, pillars, np.asarray(dfs), Act360())
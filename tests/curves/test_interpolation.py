@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from quant_py.curves.interpolation import (
+    Interpolation,
+    LogDfInterpolator,
+    _monotone_convex,
+)
+
+TIMES = np.array([0.0, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 20.0, 30.0])
+FORWARDS = np.array(
+    [0.0431, 0.0412, 0.0377, 0.0352, 0.0338, 0.0361, 0.0374, 0.0389, 0.0413, 0.0398]
+)
+LOG_DFS = np.concatenate(([0.0], -np.cumsum(np.diff(TIMES) * FORWARDS)))
+
+
+@pytest.mark.parametrize(argnames="method", argvalues=list(Interpolation))
+@pytest.mark.unit
+def test_reprices_nodes(method: Interpolation) -> None:
+    interpolator = LogDfInterpolator(TIMES, LOG_DFS, method)
+    np.testing.assert_allclose(interpolator(TIMES), LOG_DFS, atol=1e-15)
+
+
+@pytest.mark.unit
+def test_linear_log_df() -> None:
+    interpolator = LogDfInterpolator(TIMES, LOG_DFS)
+    rslt = interpolator([0.125, 1.5, 40.0])
+    expected = [
+        0.5 * LOG_DFS[1],
+        0.5 * (LOG_DFS[3] + LOG_DFS[4]),
+        LOG_DFS[-1] - 10.0 * FORWARDS[-1],
+    ]
+    np.testing.assert_allclose(rslt, expected)
+    assert interpolator.short_rate == pytest.approx(FORWARDS[0])
+
+
+@pytest.mark.unit
+def test_monotone_convex_forwards() -> None:
+    interpolator = LogDfInterpolator(TIMES, LOG_DFS, Interpolation.MONOTONE_CONVEX)
+    times = np.linspace(0.0, 30.0, 30001)
+    forwards = -np.diff(interpolator(times)) / np.diff(times)
+    # forwards are continuous and stay within the range of the discrete forwards
+    assert np.max(np.abs(np.diff(forwards))) < 1e-4
+    assert forwards.min() > FORWARDS.min() - 2e-3
+    assert forwards.max() < FORWARDS.max() + 2e-3
+
+
+@pytest.mark.unit
+def test_monotone_convex_partials() -> None:
+    rng = np.random.default_rng(0)
+    x = rng.random(5000)
+    g0 = rng.normal(size=5000)
+    g1 = rng.normal(size=5000)
+    _, d_g0, d_g1 = _monotone_convex(x, g0, g1)
+    h = 1e-7
+    up, _, _ = _monotone_convex(x, g0 + h, g1)
+    down, _, _ = _monotone_convex(x, g0 - h, g1)
+    np.testing.assert_allclose(d_g0, (up - down) / (2 * h), atol=1e-6)
+    up, _, _ = _monotone_convex(x, g0, g1 + h)
+    down, _, _ = _monotone_convex(x, g0, g1 - h)
+    np.testing.assert_allclose(d_g1, (up - down) / (2 * h), atol=1e-6)
+
+
+@pytest.mark.parametrize(argnames="method", argvalues=list(Interpolation))
+@pytest.mark.unit
+def test_jacobian(method: Interpolation) -> None:
+    times = np.random.default_rng(1).random(200) * 35.0
+    jacobian = LogDfInterpolator(TIMES, LOG_DFS, method).jacobian(times)
+    dense = jacobian.dense()
+    h = 1e-7
+    for k in range(1, TIMES.size):
+        bump = np.zeros(TIMES.size)
+        bump[k] = h
+        up = LogDfInterpolator(TIMES, LOG_DFS + bump, method)(times)
+        down = LogDfInterpolator(TIMES, LOG_DFS - bump, method)(times)
+        np.testing.assert_allclose(dense[:, k - 1], (up - down) / (2 * h), atol=1e-7)
+
+    grad = np.random.default_rng(2).normal(size=times.size)
+    np.testing.assert_allclose(jacobian.pullback(grad), dense.T @ grad, atol=1e-12)
+    rows = np.arange(times.size) % 3
+    grouped = jacobian.pullback(grad, rows, n_rows=4)
+    for row in range(3):
+        expected = dense[rows == row].T @ grad[rows == row]
+        np.testing.assert_allclose(grouped[row], expected, atol=1e-12)
+    np.testing.assert_array_equal(grouped[3], 0.0)
+
+
+@pytest.mark.parametrize(argnames="method", argvalues=list(Interpolation))
+@pytest.mark.unit
+def test_interpolate_many(method: Interpolation) -> None:
+    times = np.linspace(0.0, 35.0, 101)
+    rng = np.random.default_rng(4)
+    log_dfs = LOG_DFS * (1.0 + rng.normal(scale=0.05, size=(6, LOG_DFS.size)))
+    rslt = LogDfInterpolator(TIMES, LOG_DFS, method).interpolate_many(log_dfs, times)
+    expected = [LogDfInterpolator(TIMES, row, method)(times) for row in log_dfs]
+    np.testing.assert_allclose(rslt, expected, atol=1e-14)
+    with pytest.raises(ValueError, match="one log df per node"):
+        _ = LogDfInterpolator(TIMES, LOG_DFS, method).interpolate_many(LOG_DFS, times)
+
+
+@pytest.mark.parametrize(argnames="method", argvalues=list(Interpolation))
+@pytest.mark.unit
+def test_single_pillar(method: Interpolation) -> None:
+    interpolator = LogDfInterpolator(
+        np.array([0.0, 2.0]), np.array([0.0, -0.08]), method
+    )
+    np.testing.assert_allclose(interpolator([1.0, 4.0]), [-0.04, -0.16])
+
+
+@pytest.mark.unit
+def test_bad_nodes() -> None:
+    with pytest.raises(ValueError, match="strictly increasing"):
+        _ = LogDfInterpolator(np.array([0.0, 1.0, 1.0]), np.array([0.0, -0.1, -0.2]))
+
+
+@pytest.mark.unit
+def test_before_first_node() -> None:
+    with pytest.raises(ValueError, match="before the first node"):
+        _ = LogDfInterpolator(TIMES, LOG_DFS)([-0.1])
@@ -0,0 +1,139 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from pendulum.duration import Duration
+
+from quant_py.curves.bootstrap import OisBootstrapper
+from quant_py.curves.discount_curve import DiscountCurve
+from quant_py.curves.interpolation import Interpolation
+from quant_py.curves.risk import CurveRisk, Exposures
+from quant_py.daycounters.act360 import Act360
+from quant_py.fixings import Fixings
+from quant_py.products.swap import OisSwapBatch
+
+if TYPE_CHECKING:
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+
+FIXING_DTS = np.arange("2025-01-01", "2025-08-15", dtype="M8[D]")
+FIXINGS = Fixings(FIXING_DTS, np.full(FIXING_DTS.size, 0.0433))
+
+
+def _book(metadata: OisRateIndexMetadata, n_swaps: int = 30) -> OisSwapBatch:
+    rng = np.random.default_rng(23)
+    effective = np.datetime64("2025-03-03") + rng.integers(0, 400, n_swaps).astype(
+        "m8[D]"
+    )
+    termination = effective + 365 * rng.integers(1, 12, n_swaps).astype("m8[D]")
+    return OisSwapBatch.of(
+        effective=effective,
+        termination=termination,
+        rates=rng.uniform(0.03, 0.045, n_swaps),
+        notionals=rng.integers(1, 100, n_swaps) * 1e6,
+        metadata=metadata,
+        fixed_tenors=Duration(years=1),
+        float_tenors=Duration(years=1),
+        fixed_daycounter=Act360(),
+        payer=rng.random(n_swaps) < 0.5,
+    )
+
+
+def _bumped(curve: DiscountCurve, pillar: int, bump: float) -> DiscountCurve:
+    zero_rates = curve.zero_rates(curve.pillars)
+    zero_rates[pillar] += bump
+    return DiscountCurve.from_zero_rates(
+        curve.ref_dt,
+        curve.pillars,
+        zero_rates,
+        curve.daycounter,
+        curve.interpolation,
+    )
+
+
+@pytest.mark.unit
+def test_pvs(sofr_metadata: OisRateIndexMetadata, sofr_curve: DiscountCurve) -> None:
+    book = _book(sofr_metadata)
+    risk = CurveRisk.of(sofr_curve, book.exposures(sofr_curve, FIXINGS))
+    np.testing.assert_allclose(
+        risk.pvs, book.pvs(sofr_curve, FIXINGS), rtol=1e-10, atol=1e-6
+    )
+
+
+@pytest.mark.unit
+def test_bucketed_dv01(
+    sofr_metadata: OisRateIndexMetadata, sofr_curve: DiscountCurve
+) -> None:
+    book = _book(sofr_metadata)
+    risk = CurveRisk.of(sofr_curve, book.exposures(sofr_curve, FIXINGS))
+    dv01 = risk.bucketed_dv01()
+    assert dv01.shape == (len(book), sofr_curve.pillars.size)
+    h = 1e-7
+    for pillar in range(sofr_curve.pillars.size):
+        up = book.pvs(_bumped(sofr_curve, pillar, h), FIXINGS)
+        down = book.pvs(_bumped(sofr_curve, pillar, -h), FIXINGS)
+        np.testing.assert_allclose(
+            dv01[:, pillar], 1e-4 * (up - down) / (2 * h), rtol=1e-5, atol=1e-3
+        )
+
+    durations = risk.key_rate_durations()
+    np.testing.assert_allclose(
+        durations, -1e4 * dv01 / risk.pvs[:, np.newaxis], rtol=1e-12
+    )
+
+
+@pytest.mark.parametrize(argnames="interpolation", argvalues=list(Interpolation))
+@pytest.mark.unit
+def test_quote_dv01(
+    interpolation: Interpolation,
+    sofr_metadata: OisRateIndexMetadata,
+    ois_tenors: list[Duration],
+    ois_quotes: np.ndarray,
+) -> None:
+    bootstrapper = OisBootstrapper(
+        np.datetime64("2025-08-13"),
+        ois_tenors,
+        sofr_metadata,
+        interpolation=interpolation,
+    )
+    result = bootstrapper.solve(ois_quotes)
+    book = _book(sofr_metadata)
+    risk = CurveRisk.of(result.curve, book.exposures(result.curve, FIXINGS))
+    dv01 = risk.quote_dv01(result)
+    h = 1e-7
+    for quote in range(ois_quotes.size):
+        bump = np.zeros(ois_quotes.size)
+        bump[quote] = h
+        up = bootstrapper.solve(ois_quotes + bump, guess=result.curve).curve
+        down = bootstrapper.solve(ois_quotes - bump, guess=result.curve).curve
+        expected = 1e-4 * (book.pvs(up, FIXINGS) - book.pvs(down, FIXINGS)) / (2 * h)
+        np.testing.assert_allclose(dv01[:, quote], expected, rtol=1e-5, atol=1e-3)
+
+
+@pytest.mark.unit
+def test_quote_dv01_other_curve(
+    sofr_metadata: OisRateIndexMetadata,
+    sofr_curve: DiscountCurve,
+    ois_tenors: list[Duration],
+    ois_quotes: np.ndarray,
+) -> None:
+    result = OisBootstrapper(
+        np.datetime64("2025-08-13"), ois_tenors, sofr_metadata
+    ).solve(ois_quotes)
+    risk = CurveRisk.of(sofr_curve, _book(sofr_metadata).exposures(sofr_curve, FIXINGS))
+    with pytest.raises(ValueError, match="does not match the pillars"):
+        _ = risk.quote_dv01(result)
+
+
+@pytest.mark.unit
+def test_concat() -> None:
+    exposures = Exposures(
+        dates=np.array(["2026-01-01"], dtype="M8[D]"),
+        amounts=np.array([1.0]),
+        trades=np.array([0]),
+        n_trades=2,
+    )
+    combined = Exposures.concat(exposures, exposures)
+    np.testing.assert_array_equal(combined.amounts, [1.0, 1.0])
+    assert combined.n_trades == 2
+    with pytest.raises(ValueError, match="same number of trades"):
+        _ = Exposures.concat(exposures, exposures._replace(n_trades=3))
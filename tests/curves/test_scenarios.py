@@ -0,0 +1,92 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from pendulum.duration import Duration
+
+from quant_py.curves.discount_curve import DiscountCurve
+from quant_py.curves.interpolation import Interpolation
+from quant_py.curves.scenarios import ScenarioEngine
+from quant_py.daycounters.act360 import Act360
+from quant_py.fixings import Fixings
+from quant_py.products.swap import OisSwapBatch
+
+if TYPE_CHECKING:
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+
+FIXING_DTS = np.arange("2025-01-01", "2025-08-15", dtype="M8[D]")
+FIXINGS = Fixings(FIXING_DTS, np.full(FIXING_DTS.size, 0.0433))
+
+
+def _book(metadata: OisRateIndexMetadata, n_swaps: int = 40) -> OisSwapBatch:
+    rng = np.random.default_rng(31)
+    effective = np.datetime64("2025-03-03") + rng.integers(0, 400, n_swaps).astype(
+        "m8[D]"
+    )
+    tenor = Duration(months=6)
+    return OisSwapBatch.of(
+        effective=effective,
+        termination=effective + 365 * rng.integers(1, 12, n_swaps).astype("m8[D]"),
+        rates=rng.uniform(0.03, 0.045, n_swaps),
+        notionals=rng.integers(1, 100, n_swaps) * 1e6,
+        metadata=metadata,
+        fixed_tenors=tenor,
+        float_tenors=tenor,
+        fixed_daycounter=Act360(),
+        payer=rng.random(n_swaps) < 0.5,
+    )
+
+
+def _shocked(curve: DiscountCurve, shocks: np.ndarray) -> DiscountCurve:
+    return DiscountCurve.from_zero_rates(
+        curve.ref_dt,
+        curve.pillars,
+        curve.zero_rates(curve.pillars) + shocks,
+        curve.daycounter,
+        curve.interpolation,
+    )
+
+
+@pytest.mark.parametrize(argnames="interpolation", argvalues=list(Interpolation))
+@pytest.mark.unit
+def test_pvs(
+    interpolation: Interpolation,
+    sofr_metadata: OisRateIndexMetadata,
+    sofr_curve: DiscountCurve,
+) -> None:
+    curve = DiscountCurve(
+        sofr_curve.ref_dt,
+        sofr_curve.pillars,
+        sofr_curve.dfs,
+        sofr_curve.daycounter,
+        interpolation,
+    )
+    book = _book(sofr_metadata)
+    # small blocks so the scenarios are priced over several passes
+    engine = ScenarioEngine(curve, book.exposures(curve, FIXINGS), max_block=500)
+    rng = np.random.default_rng(37)
+    n_pillars = curve.pillars.size
+    shocks = np.vstack(
+        [
+            np.zeros(n_pillars),
+            np.full(n_pillars, 0.01),
+            np.linspace(-0.005, 0.005, n_pillars),
+            rng.normal(scale=0.002, size=(7, n_pillars)),
+        ]
+    )
+    pvs = engine.pvs(shocks)
+    assert pvs.shape == (shocks.shape[0], len(book))
+    for scenario, shock in enumerate(shocks):
+        expected = book.pvs(_shocked(curve, shock), FIXINGS)
+        np.testing.assert_allclose(pvs[scenario], expected, rtol=1e-10, atol=1e-6)
+
+
+@pytest.mark.unit
+def test_bad_shocks(
+    sofr_metadata: OisRateIndexMetadata, sofr_curve: DiscountCurve
+) -> None:
+    engine = ScenarioEngine(
+        sofr_curve, _book(sofr_metadata).exposures(sofr_curve, FIXINGS)
+    )
+    with pytest.raises(ValueError, match="one shock per pillar"):
+        _ = engine.pvs(np.zeros((3, sofr_curve.pillars.size + 1)))
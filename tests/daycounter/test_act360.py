@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pendulum.date import Date
 
@@ -10,3 +11,13 @@ def test_act360() -> None:
     start = Date(2025, 1, 1)
     end = Date(2025, 6, 30)
     assert dc.count(start, end) == 180.0 / 360.0
+
+
+@pytest.mark.unit
+def test_act360_count_many() -> None:
+    dc = Act360()
+    starts = np.array(["2025-01-01", "2025-06-30"], dtype="M8[D]")
+    ends = np.array(["2025-06-30", "2025-01-01"], dtype="M8[D]")
+    np.testing.assert_array_equal(
+        dc.count_many(starts, ends), [180.0 / 360.0, -180.0 / 360.0]
+    )
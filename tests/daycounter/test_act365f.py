@@ -0,0 +1,12 @@
+import pytest
+from pendulum.date import Date
+
+from quant_py.daycounters.act365f import Act365F
+
+
+@pytest.mark.unit
+def test_act365f() -> None:
+    dc = Act365F()
+    start = Date(2024, 1, 1)
+    end = Date(2024, 12, 31)
+    assert dc.count(start, end) == 365.0 / 365.0
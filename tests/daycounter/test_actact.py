@@ -0,0 +1,19 @@
+import pytest
+from pendulum.date import Date
+
+from quant_py.daycounters.actact import ActActIsda
+
+
+@pytest.mark.parametrize(
+    argnames=("start", "end", "expected"),
+    argvalues=[
+        (Date(2025, 1, 1), Date(2025, 7, 1), 181.0 / 365.0),
+        (Date(2024, 1, 1), Date(2024, 7, 1), 182.0 / 366.0),
+        (Date(2024, 7, 1), Date(2025, 7, 1), 184.0 / 366.0 + 181.0 / 365.0),
+        (Date(2023, 7, 1), Date(2025, 7, 1), 184.0 / 365.0 + 1.0 + 181.0 / 365.0),
+        (Date(2025, 7, 1), Date(2024, 7, 1), -(184.0 / 366.0 + 181.0 / 365.0)),
+    ],
+)
+@pytest.mark.unit
+def test_actact_isda(start: Date, end: Date, expected: float) -> None:
+    assert ActActIsda().count(start, end) == expected
@@ -1,14 +1,21 @@
+from datetime import date
 from typing import Self, override
 
+import numpy as np
 import pytest
 from pendulum import Date
 
+from quant_py.dates import to_dates
 from quant_py.daycounter import Daycounter
+from quant_py.daycounters.act360 import Act360
+from quant_py.daycounters.act365f import Act365F
+from quant_py.daycounters.actact import ActActIsda
+from quant_py.daycounters.thirty360 import Thirty360, Thirty360E, Thirty360EIsda
 
 
 class MockDaycounter(Daycounter):
     @override
-    def count(self: Self, start: Date, end: Date) -> float:
+    def count(self: Self, start: date, end: date) -> float:
         return -1004.0
 
 
@@ -18,3 +25,67 @@ def test_call_magic_method() -> None:
     start = Date(2025, 1, 1)
     end = Date(2025, 12, 31)
     assert dc(start, end) == -1004.0
+
+
+@pytest.mark.unit
+def test_count_many_default() -> None:
+    dc = MockDaycounter()
+    starts = np.array(["2025-01-01", "2025-02-01"], dtype="M8[D]")
+    ends = np.array(["2025-12-31", "2026-02-01"], dtype="M8[D]")
+    np.testing.assert_array_equal(dc.count_many(starts, ends), [-1004.0, -1004.0])
+
+
+@pytest.mark.parametrize(
+    argnames="daycounter",
+    argvalues=[
+        Act360(),
+        Act365F(),
+        Thirty360(),
+        Thirty360E(),
+        Thirty360EIsda(),
+        Thirty360EIsda(maturity=Date(2026, 2, 28)),
+        ActActIsda(),
+    ],
+    ids=lambda dc: type(dc).__name__,
+)
+@pytest.mark.unit
+def test_count_many_matches_count(daycounter: Daycounter) -> None:
+    rng = np.random.default_rng(0)
+    month_ends = np.arange("2019-02", "2031-01", dtype="M8[M]") + np.timedelta64(1, "M")
+    starts = np.concatenate(
+        [
+            np.datetime64("2020-01-01") + rng.integers(0, 3650, 500).astype("m8[D]"),
+            month_ends.astype("M8[D]") - np.timedelta64(1, "D"),
+        ]
+    )
+    ends = np.concatenate(
+        [
+            starts[:500] + rng.integers(-400, 4000, 500).astype("m8[D]"),
+            np.roll(starts[500:], 7),
+        ]
+    )
+    expected = [
+        daycounter.count(start, end)
+        for start, end in zip(to_dates(starts), to_dates(ends), strict=True)
+    ]
+    np.testing.assert_array_equal(daycounter.count_many(starts, ends), expected)
+    plain = [
+        daycounter.count(start, end)
+        for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+    ]
+    assert all(isinstance(dt, date) for dt in starts.tolist())
+    np.testing.assert_array_equal(plain, expected)
+
+
+@pytest.mark.unit
+def test_eq_and_hash() -> None:
+    assert Act360() == Act360()
+    assert hash(Act360()) == hash(Act360())
+    assert Act360() != Act365F()
+    assert Thirty360EIsda(Date(2026, 2, 28)) == Thirty360EIsda(Date(2026, 2, 28))
+    assert Thirty360EIsda(Date(2026, 2, 28)) != Thirty360EIsda()
+    assert hash(Thirty360EIsda(Date(2026, 2, 28))) == hash(
+        Thirty360EIsda(Date(2026, 2, 28))
+    )
+    assert Thirty360() != Thirty360E()
+    assert not hasattr(Thirty360EIsda(), "__dict__")
@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from pendulum.date import Date
+
+from quant_py.daycounters.thirty360 import Thirty360, Thirty360E, Thirty360EIsda
+
+if TYPE_CHECKING:
+    from quant_py.daycounter import Daycounter
+
+
+@pytest.mark.parametrize(
+    argnames=("daycounter", "start", "end", "expected"),
+    argvalues=[
+        (Thirty360(), Date(2025, 1, 31), Date(2025, 3, 31), 60.0 / 360.0),
+        (Thirty360(), Date(2025, 2, 28), Date(2025, 3, 31), 33.0 / 360.0),
+        (Thirty360E(), Date(2025, 1, 31), Date(2025, 3, 31), 60.0 / 360.0),
+        (Thirty360E(), Date(2025, 2, 28), Date(2025, 3, 31), 32.0 / 360.0),
+        (Thirty360EIsda(), Date(2025, 2, 28), Date(2025, 3, 31), 30.0 / 360.0),
+        (Thirty360EIsda(), Date(2024, 8, 31), Date(2025, 2, 28), 180.0 / 360.0),
+        (
+            Thirty360EIsda(maturity=Date(2025, 2, 28)),
+            Date(2024, 8, 31),
+            Date(2025, 2, 28),
+            178.0 / 360.0,
+        ),
+    ],
+)
+@pytest.mark.unit
+def test_count(daycounter: Daycounter, start: Date, end: Date, expected: float) -> None:
+    assert daycounter.count(start, end) == expected
@@ -0,0 +1,192 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from pendulum.date import Date
+
+from quant_py.daycounters.act360 import Act360
+from quant_py.fixings import Fixings
+from quant_py.indices.ois_index import (
+    LockoutOisRateIndex,
+    LookbackOisRateIndex,
+    ObservationShiftOisRateIndex,
+    OisRateIndex,
+    OisRateIndexMetadata,
+    PaymentDelayOisRateIndex,
+)
+from quant_py.scheduling.adjuster import BusdayConvention
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@pytest.fixture
+def metadata(sifma: np.busdaycalendar) -> OisRateIndexMetadata:
+    return OisRateIndexMetadata(
+        name="SOFR",
+        currency="USD",
+        pay_cal=sifma,
+        busday_conv=BusdayConvention.MODIFIEDFOLLOWING,
+        daycounter=Act360(),
+        publish_lag=1,
+    )
+
+
+@pytest.fixture
+def sofr(metadata: OisRateIndexMetadata) -> OisRateIndex:
+    return OisRateIndex(metadata)
+
+
+@pytest.fixture
+def fixings(sifma: np.busdaycalendar) -> Fixings:
+    dates = np.arange("2025-01-01", "2026-01-01", dtype="M8[D]")
+    dates = dates[np.is_busday(dates, busdaycal=sifma)]
+    rng = np.random.default_rng(7)
+    return Fixings(dates, 0.04 + 0.005 * rng.standard_normal(dates.size))
+
+
+def _compound_loop(
+    fixings: Fixings, start: np.datetime64, end: np.datetime64, sifma: np.busdaycalendar
+) -> float:
+    factor = 1.0
+    dt = start
+    while dt < end:
+        nxt = np.busday_offset(dt, 1, busdaycal=sifma)
+        rate = fixings.values[np.searchsorted(fixings.dates, dt)]
+        factor *= 1.0 + rate * (nxt - dt).astype(int) / 360.0
+        dt = nxt
+    return (factor - 1.0) * 360.0 / (end - start).astype(int)
+
+
+@pytest.mark.unit
+def test_calc_fixing_dt(sofr: OisRateIndex) -> None:
+    assert sofr.calc_fixing_dt(Date(2025, 8, 15)) == Date(2025, 8, 15)
+
+
+@pytest.mark.unit
+def test_compound(
+    sofr: OisRateIndex, fixings: Fixings, sifma: np.busdaycalendar
+) -> None:
+    starts = np.array(["2025-01-02", "2025-02-14", "2025-06-30"], dtype="M8[D]")
+    ends = np.array(["2025-04-02", "2025-05-14", "2025-12-31"], dtype="M8[D]")
+    rslt = sofr.compound(fixings, starts, ends)
+    expected = [
+        _compound_loop(fixings, start, end, sifma)
+        for start, end in zip(starts, ends, strict=True)
+    ]
+    np.testing.assert_allclose(rslt, expected, rtol=1e-12)
+
+
+@pytest.mark.unit
+def test_compound_flat(sofr: OisRateIndex, sifma: np.busdaycalendar) -> None:
+    dates = np.arange("2025-08-01", "2025-09-01", dtype="M8[D]")
+    dates = dates[np.is_busday(dates, busdaycal=sifma)]
+    fixings = Fixings(dates, np.full(dates.size, 0.05))
+    # a week of daily compounding: four one day periods and one over the weekend
+    rslt = sofr.compound(fixings, ["2025-08-04"], ["2025-08-11"])
+    expected = ((1 + 0.05 / 360) ** 4 * (1 + 0.05 * 3 / 360) - 1) * 360 / 7
+    np.testing.assert_allclose(rslt, [expected], rtol=1e-12)
+
+
+@pytest.mark.unit
+def test_compound_missing_fixing(sofr: OisRateIndex, fixings: Fixings) -> None:
+    with pytest.raises(ValueError, match="Missing fixing for 2026-01-01"):
+        _ = sofr.compound(fixings, ["2025-12-01"], ["2026-01-05"])
+
+
+@pytest.mark.unit
+def test_compound_empty(sofr: OisRateIndex, fixings: Fixings) -> None:
+    rslt = sofr.compound(fixings, np.array([], "M8[D]"), np.array([], "M8[D]"))
+    assert rslt.shape == (0,)
+
+
+CONVENTIONS: list[Callable[[OisRateIndexMetadata, int | None], OisRateIndex]] = [
+    lambda metadata, days: LookbackOisRateIndex(metadata, lookback=days),
+    lambda metadata, days: ObservationShiftOisRateIndex(metadata, shift=days),
+    lambda metadata, days: LockoutOisRateIndex(metadata, lockout=days),
+]
+
+
+@pytest.mark.parametrize(
+    argnames=("convention", "days"),
+    argvalues=[
+        (convention, days) for convention in CONVENTIONS for days in (None, 2, 5)
+    ],
+)
+@pytest.mark.unit
+def test_compound_conventions(
+    convention: Callable[[OisRateIndexMetadata, int | None], OisRateIndex],
+    days: int | None,
+    metadata: OisRateIndexMetadata,
+    fixings: Fixings,
+    sifma: np.busdaycalendar,
+) -> None:
+    index = convention(metadata, days)
+    starts = np.array(
+        ["2025-02-14", "2025-06-30", "2025-09-02", "2025-09-02"], dtype="M8[D]"
+    )
+    ends = np.array(
+        ["2025-05-14", "2025-12-31", "2025-09-03", "2025-09-05"], dtype="M8[D]"
+    )
+    rslt = index.compound(fixings, starts, ends)
+
+    expected: list[float] = []
+    for start, end in zip(starts, ends, strict=True):
+        dts = np.arange(start, end, dtype="M8[D]")
+        dts = dts[np.is_busday(dts, busdaycal=sifma)]
+        fixing_dts, weights = index.observations(dts, end)
+        growth = np.prod(1.0 + fixings.lookup(fixing_dts) * weights)
+        expected.append(float((growth - 1.0) / weights.sum()))
+    np.testing.assert_allclose(rslt, expected, rtol=1e-12)
+
+
+@pytest.mark.unit
+def test_lookback_observations(metadata: OisRateIndexMetadata) -> None:
+    index = LookbackOisRateIndex(metadata, lookback=2)
+    dts = np.array(["2025-08-29", "2025-09-02"], dtype="M8[D]")
+    fixing_dts, weights = index.observations(dts)
+    np.testing.assert_array_equal(
+        fixing_dts, np.array(["2025-08-27", "2025-08-28"], dtype="M8[D]")
+    )
+    # friday accrues over the weekend and labor day
+    np.testing.assert_allclose(weights, [4 / 360, 1 / 360])
+    assert index.calc_fixing_dt(Date(2025, 9, 2)) == Date(2025, 8, 28)
+
+
+@pytest.mark.unit
+def test_observation_shift_observations(metadata: OisRateIndexMetadata) -> None:
+    index = ObservationShiftOisRateIndex(metadata, shift=2)
+    dts = np.array(["2025-09-03", "2025-09-04"], dtype="M8[D]")
+    fixing_dts, weights = index.observations(dts)
+    np.testing.assert_array_equal(
+        fixing_dts, np.array(["2025-08-29", "2025-09-02"], dtype="M8[D]")
+    )
+    np.testing.assert_allclose(weights, [4 / 360, 1 / 360])
+
+
+@pytest.mark.unit
+def test_lockout_observations(metadata: OisRateIndexMetadata) -> None:
+    index = LockoutOisRateIndex(metadata)
+    dts = np.array(["2025-08-26", "2025-08-27", "2025-08-28", "2025-08-29"], "M8[D]")
+    fixing_dts, _ = index.observations(dts, np.datetime64("2025-09-02"))
+    np.testing.assert_array_equal(
+        fixing_dts,
+        np.array(["2025-08-26", "2025-08-27", "2025-08-28", "2025-08-28"], "M8[D]"),
+    )
+    fixing_dts, _ = index.observations(dts)
+    np.testing.assert_array_equal(fixing_dts, dts)
+
+
+@pytest.mark.unit
+def test_payment_delay(metadata: OisRateIndexMetadata, fixings: Fixings) -> None:
+    index = PaymentDelayOisRateIndex(metadata, payment_delay=2)
+    ends = np.array(["2025-08-28", "2025-11-10"], dtype="M8[D]")
+    np.testing.assert_array_equal(
+        index.calc_payment_dts(ends),
+        np.array(["2025-09-02", "2025-11-13"], dtype="M8[D]"),
+    )
+    starts = np.array(["2025-05-28", "2025-08-08"], dtype="M8[D]")
+    np.testing.assert_array_equal(
+        index.compound(fixings, starts, ends),
+        OisRateIndex(metadata).compound(fixings, starts, ends),
+    )
@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from pendulum.date import Date
+from pendulum.duration import Duration
+
+from quant_py.daycounters.act360 import Act360
+from quant_py.products.fixed_leg import FixedLeg, FixedLegBatch
+from quant_py.scheduling.batch import ScheduleBatch
+from quant_py.scheduling.schedule import Schedule
+
+if TYPE_CHECKING:
+    from quant_py.curves.discount_curve import DiscountCurve
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+
+
+@pytest.mark.unit
+def test_pv(sofr_metadata: OisRateIndexMetadata, sofr_curve: DiscountCurve) -> None:
+    # first period is already paid on the curve date
+    schedule = Schedule.of(
+        effective=Date(2024, 8, 15),
+        termination=Date(2027, 8, 16),
+        tenor=Duration(years=1),
+        pay_cal=sofr_metadata.pay_cal,
+        busday_conv=sofr_metadata.busday_conv,
+    )
+    leg = FixedLeg(schedule, Act360(), rate=0.04, notional=1e6)
+    year_fracs = schedule.year_fracs(Act360())[1:]
+    annuity = float(np.sum(year_fracs * sofr_curve.df(schedule.end[1:])))
+    assert leg.annuity(sofr_curve) == pytest.approx(annuity, rel=1e-14)
+    assert leg.pv(sofr_curve) == pytest.approx(1e6 * 0.04 * annuity, rel=1e-14)
+
+
+@pytest.mark.unit
+def test_batch(sofr_metadata: OisRateIndexMetadata, sofr_curve: DiscountCurve) -> None:
+    rng = np.random.default_rng(5)
+    n_legs = 50
+    effective = np.datetime64("2025-01-15") + rng.integers(0, 400, n_legs).astype(
+        "m8[D]"
+    )
+    termination = effective + rng.integers(200, 2000, n_legs).astype("m8[D]")
+    schedules = ScheduleBatch.of(
+        effective=effective,
+        termination=termination,
+        tenors=[Duration(months=6)] * n_legs,
+        pay_cal=sofr_metadata.pay_cal,
+        busday_conv=sofr_metadata.busday_conv,
+    )
+    rates = rng.uniform(0.02, 0.05, n_legs)
+    batch = FixedLegBatch(schedules, Act360(), rates, np.full(n_legs, 1e6))
+    assert len(batch) == n_legs
+    np.testing.assert_allclose(
+        batch.annuities(sofr_curve),
+        [batch[i].annuity(sofr_curve) for i in range(n_legs)],
+        rtol=1e-14,
+    )
+    np.testing.assert_allclose(
+        batch.pvs(sofr_curve),
+        [batch[i].pv(sofr_curve) for i in range(n_legs)],
+        rtol=1e-14,
+    )
@@ -0,0 +1,99 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from pendulum.date import Date
+from pendulum.duration import Duration
+
+from quant_py.fixings import Fixings
+from quant_py.products.floating_leg import FloatingLeg, FloatingLegBatch
+from quant_py.scheduling.batch import ScheduleBatch
+from quant_py.scheduling.schedule import Schedule
+
+if TYPE_CHECKING:
+    from quant_py.curves.discount_curve import DiscountCurve
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+
+
+def _schedule(
+    metadata: OisRateIndexMetadata, effective: Date, termination: Date
+) -> Schedule:
+    return Schedule.of(
+        effective=effective,
+        termination=termination,
+        tenor=Duration(months=3),
+        pay_cal=metadata.pay_cal,
+        busday_conv=metadata.busday_conv,
+    )
+
+
+@pytest.mark.unit
+def test_pv_telescopes(
+    sofr_metadata: OisRateIndexMetadata, sofr_curve: DiscountCurve
+) -> None:
+    schedule = _schedule(sofr_metadata, Date(2025, 8, 19), Date(2028, 8, 19))
+    leg = FloatingLeg(schedule, sofr_metadata, notional=1e6)
+    dfs = sofr_curve.df([schedule.start[0], schedule.end[-1]])
+    assert leg.pv(sofr_curve) == pytest.approx(1e6 * (dfs[0] - dfs[1]), rel=1e-12)
+
+
+@pytest.mark.unit
+def test_coupons(
+    sofr_metadata: OisRateIndexMetadata, sofr_curve: DiscountCurve
+) -> None:
+    schedule = _schedule(sofr_metadata, Date(2025, 8, 19), Date(2026, 8, 19))
+    leg = FloatingLeg(schedule, sofr_metadata, notional=100.0, spread=0.001)
+    year_fracs = schedule.year_fracs(sofr_metadata.daycounter)
+    forwards = sofr_curve.df(schedule.start) / sofr_curve.df(schedule.end) - 1.0
+    np.testing.assert_allclose(
+        leg.coupons(sofr_curve), 100.0 * (forwards + 0.001 * year_fracs)
+    )
+
+
+@pytest.mark.unit
+def test_seasoned(
+    sifma: np.busdaycalendar,
+    sofr_metadata: OisRateIndexMetadata,
+    sofr_curve: DiscountCurve,
+) -> None:
+    # first period is paid, second is half way through on the curve date
+    schedule = _schedule(sofr_metadata, Date(2025, 4, 15), Date(2026, 4, 15))
+    leg = FloatingLeg(schedule, sofr_metadata)
+    with pytest.raises(ValueError, match="Fixings are needed"):
+        _ = leg.pv(sofr_curve)
+
+    dates = np.arange("2025-07-01", "2025-08-15", dtype="M8[D]")
+    fixings = Fixings(dates, np.full(dates.size, 0.05))
+    coupons = leg.coupons(sofr_curve, fixings)
+    assert coupons[0] == 0.0
+    days = np.busday_count("2025-07-15", "2025-08-15", busdaycal=sifma)
+    # no holidays from the period start to the curve date, only weekends
+    weekends = (31 - days) // 2
+    realized = (1 + 0.05 / 360) ** (days - weekends) * (1 + 0.05 * 3 / 360) ** weekends
+    expected = realized / sofr_curve.df(schedule.end[1:2])[0] - 1.0
+    assert coupons[1] == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.unit
+def test_batch(sofr_metadata: OisRateIndexMetadata, sofr_curve: DiscountCurve) -> None:
+    rng = np.random.default_rng(11)
+    n_legs = 50
+    effective = np.datetime64("2025-08-15") + rng.integers(0, 300, n_legs).astype(
+        "m8[D]"
+    )
+    termination = effective + rng.integers(200, 2000, n_legs).astype("m8[D]")
+    schedules = ScheduleBatch.of(
+        effective=effective,
+        termination=termination,
+        tenors=[Duration(months=3)] * n_legs,
+        pay_cal=sofr_metadata.pay_cal,
+        busday_conv=sofr_metadata.busday_conv,
+    )
+    notionals = rng.integers(1, 100, n_legs).astype(np.float64) * 1e6
+    spreads = rng.normal(scale=0.001, size=n_legs)
+    batch = FloatingLegBatch(schedules, sofr_metadata, notionals, spreads)
+    pvs = batch.pvs(sofr_curve)
+    expected = [leg.pv(sofr_curve) for leg in (batch[i] for i in range(n_legs))]
+    np.testing.assert_allclose(pvs, expected, rtol=1e-12)
+    assert batch.pv(sofr_curve) == pytest.approx(pvs.sum(), rel=1e-12)
+    assert batch.coupons(sofr_curve).shape == schedules.start.shape
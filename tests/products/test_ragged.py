@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from quant_py.products.ragged import segment_sums
+
+
+@pytest.mark.unit
+def test_segment_sums() -> None:
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    offsets = np.array([0, 2, 2, 5, 5])
+    np.testing.assert_array_equal(segment_sums(values, offsets), [3.0, 0.0, 12.0, 0.0])
+
+
+@pytest.mark.unit
+def test_segment_sums_2d() -> None:
+    values = np.arange(8.0).reshape(4, 2)
+    offsets = np.array([0, 0, 1, 4])
+    np.testing.assert_array_equal(
+        segment_sums(values, offsets), [[0.0, 0.0], [0.0, 1.0], [12.0, 15.0]]
+    )
+
+
+@pytest.mark.unit
+def test_segment_sums_empty() -> None:
+    rslt = segment_sums(np.array([]), np.array([0, 0, 0]))
+    np.testing.assert_array_equal(rslt, [0.0, 0.0])
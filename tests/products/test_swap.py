@@ -0,0 +1,150 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from pendulum.date import Date
+from pendulum.duration import Duration
+
+from quant_py.daycounters.act360 import Act360
+from quant_py.fixings import Fixings
+from quant_py.products.fixed_leg import FixedLeg
+from quant_py.products.floating_leg import FloatingLeg
+from quant_py.products.swap import OisSwap, OisSwapBatch
+from quant_py.scheduling.schedule import Schedule
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from quant_py.curves.discount_curve import DiscountCurve
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+
+
+def _swap(metadata: OisRateIndexMetadata, rate: float, *, payer: bool) -> OisSwap:
+    schedule = Schedule.of(
+        effective=Date(2025, 8, 19),
+        termination=Date(2030, 8, 19),
+        tenor=Duration(years=1),
+        pay_cal=metadata.pay_cal,
+        busday_conv=metadata.busday_conv,
+    )
+    return OisSwap(
+        fixed=FixedLeg(schedule, Act360(), rate, notional=1e7),
+        floating=FloatingLeg(schedule, metadata, notional=1e7),
+        payer=payer,
+    )
+
+
+@pytest.mark.unit
+def test_par_rate(
+    sofr_metadata: OisRateIndexMetadata, sofr_curve: DiscountCurve
+) -> None:
+    swap = _swap(sofr_metadata, 0.04, payer=True)
+    par_rate = swap.par_rate(sofr_curve)
+    assert _swap(sofr_metadata, par_rate, payer=True).pv(sofr_curve) == pytest.approx(
+        0.0, abs=1e-6
+    )
+    # paying above par loses the rate difference on the annuity
+    annuity = 1e7 * swap.fixed.annuity(sofr_curve)
+    assert swap.pv(sofr_curve) == pytest.approx((par_rate - 0.04) * annuity)
+    receiver = _swap(sofr_metadata, 0.04, payer=False)
+    assert receiver.pv(sofr_curve) == -swap.pv(sofr_curve)
+
+
+@pytest.mark.unit
+def test_batch(sofr_metadata: OisRateIndexMetadata, sofr_curve: DiscountCurve) -> None:
+    rng = np.random.default_rng(17)
+    n_swaps = 40
+    effective = np.datetime64("2025-02-15") + rng.integers(0, 300, n_swaps).astype(
+        "m8[D]"
+    )
+    termination = effective + 365 * rng.integers(1, 10, n_swaps).astype("m8[D]")
+    batch = OisSwapBatch.of(
+        effective=effective,
+        termination=termination,
+        rates=rng.uniform(0.03, 0.045, n_swaps),
+        notionals=rng.integers(1, 100, n_swaps) * 1e6,
+        metadata=sofr_metadata,
+        fixed_tenors=Duration(years=1),
+        float_tenors=Duration(years=1),
+        fixed_daycounter=Act360(),
+        payer=rng.random(n_swaps) < 0.5,
+    )
+    assert batch.fixed.schedules is not batch.floating.schedules
+    dates = np.arange("2025-02-01", "2025-08-15", dtype="M8[D]")
+    fixings = Fixings(dates, np.full(dates.size, 0.043))
+    swaps = [batch[i] for i in range(n_swaps)]
+    np.testing.assert_allclose(
+        batch.pvs(sofr_curve, fixings),
+        [swap.pv(sofr_curve, fixings) for swap in swaps],
+        rtol=1e-12,
+    )
+    np.testing.assert_allclose(
+        batch.par_rates(sofr_curve, fixings),
+        [swap.par_rate(sofr_curve, fixings) for swap in swaps],
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.unit
+def test_mismatched_legs(sofr_metadata: OisRateIndexMetadata) -> None:
+    def batch(n_swaps: int) -> OisSwapBatch:
+        return OisSwapBatch.of(
+            effective=["2025-08-19"] * n_swaps,
+            termination=["2027-08-19"] * n_swaps,
+            rates=0.04,
+            notionals=1e6,
+            metadata=sofr_metadata,
+            fixed_tenors=Duration(years=1),
+            float_tenors=Duration(years=1),
+            fixed_daycounter=Act360(),
+        )
+
+    with pytest.raises(ValueError, match="same number of fixed and floating legs"):
+        _ = OisSwapBatch(
+            batch(2).fixed, batch(1).floating, payer=np.ones(2, dtype=np.bool_)
+        )
+
+
+@pytest.mark.unit
+def test_shared_schedules(sofr_metadata: OisRateIndexMetadata) -> None:
+    tenor = Duration(months=6)
+    batch = OisSwapBatch.of(
+        effective=["2025-08-19"],
+        termination=["2027-08-19"],
+        rates=0.04,
+        notionals=1e6,
+        metadata=sofr_metadata,
+        fixed_tenors=tenor,
+        float_tenors=tenor,
+        fixed_daycounter=Act360(),
+    )
+    assert batch.fixed.schedules is batch.floating.schedules
+
+
+@pytest.mark.unit
+def test_tenor_sequences(sofr_metadata: OisRateIndexMetadata) -> None:
+    def batch(
+        fixed_tenors: Duration | Sequence[Duration],
+        float_tenors: Duration | Sequence[Duration],
+    ) -> OisSwapBatch:
+        return OisSwapBatch.of(
+            effective=["2025-08-19", "2025-08-19"],
+            termination=["2027-08-19", "2027-08-19"],
+            rates=0.04,
+            notionals=1e6,
+            metadata=sofr_metadata,
+            fixed_tenors=fixed_tenors,
+            float_tenors=float_tenors,
+            fixed_daycounter=Act360(),
+        )
+
+    annual, quarterly = Duration(years=1), Duration(months=3)
+    expected = batch(annual, quarterly)
+    for fixed_tenors in ([annual, annual], (annual, annual)):
+        got = batch(fixed_tenors, (quarterly, quarterly))
+        np.testing.assert_array_equal(
+            got.fixed.schedules.end, expected.fixed.schedules.end
+        )
+        np.testing.assert_array_equal(
+            got.floating.schedules.end, expected.floating.schedules.end
+        )
@@ -1,7 +1,10 @@
+from datetime import date
+
 import numpy as np
 import pytest
 from pendulum.date import Date
 
+from quant_py.buscal import as_business_calendar
 from quant_py.scheduling.adjuster import Adjuster, BusdayConvention
 
 
@@ -50,3 +53,69 @@ def test_adjust(
     adjuster = Adjuster(calendar=calendar, busday_conv=busday_conv)
     rslt = adjuster.adjust(dt)
     assert rslt == expected
+
+
+@pytest.mark.parametrize(
+    argnames="busday_conv",
+    argvalues=list(BusdayConvention),
+)
+@pytest.mark.unit
+def test_adjust_many_matches_adjust(
+    busday_conv: BusdayConvention, calendar: np.busdaycalendar
+) -> None:
+    adjuster = Adjuster(calendar=calendar, busday_conv=busday_conv)
+    dts = np.arange("2025-01-01", "2026-01-01", dtype="M8[D]")
+    rslt = adjuster.adjust_many(dts)
+    expected = np.array(
+        [
+            np.datetime64(adjuster.adjust(Date(dt.year, dt.month, dt.day)))
+            for dt in dts.astype(object)
+        ],
+        dtype="M8[D]",
+    )
+    assert rslt.dtype == np.dtype("M8[D]")
+    np.testing.assert_array_equal(rslt, expected)
+
+
+@pytest.mark.parametrize(
+    argnames="busday_conv",
+    argvalues=list(BusdayConvention),
+)
+@pytest.mark.unit
+def test_adjust_keeps_date_type(
+    busday_conv: BusdayConvention, calendar: np.busdaycalendar
+) -> None:
+    for cal in (calendar, as_business_calendar(calendar)):
+        adjuster = Adjuster(calendar=cal, busday_conv=busday_conv)
+        rslt = adjuster.adjust(date(2025, 11, 29))
+        assert type(rslt) is date
+        assert type(adjuster.adjust(Date(2025, 11, 29))) is Date
+        assert rslt == adjuster.adjust(Date(2025, 11, 29))
+
+
+@pytest.mark.parametrize(
+    argnames=("busday_conv", "expected"),
+    argvalues=[
+        (BusdayConvention.FOLLOWING, ["2025-11-28", "2025-12-01", "2025-11-03"]),
+        (BusdayConvention.PRECEDING, ["2025-11-26", "2025-11-28", "2025-10-31"]),
+        (
+            BusdayConvention.MODIFIEDFOLLOWING,
+            ["2025-11-28", "2025-11-28", "2025-11-03"],
+        ),
+        (
+            BusdayConvention.MODIFIEDPRECEDING,
+            ["2025-11-26", "2025-11-28", "2025-11-03"],
+        ),
+        (BusdayConvention.NONE, ["2025-11-27", "2025-11-29", "2025-11-01"]),
+    ],
+)
+@pytest.mark.unit
+def test_adjust_many(
+    busday_conv: BusdayConvention,
+    expected: list[str],
+    calendar: np.busdaycalendar,
+) -> None:
+    adjuster = Adjuster(calendar=calendar, busday_conv=busday_conv)
+    dts = np.array(["2025-11-27", "2025-11-29", "2025-11-01"], dtype="M8[D]")
+    rslt = adjuster.adjust_many(dts)
+    np.testing.assert_array_equal(rslt, np.array(expected, dtype="M8[D]"))
@@ -0,0 +1,157 @@
+import numpy as np
+import pytest
+from pendulum.date import Date
+from pendulum.duration import Duration
+
+from quant_py.daycounters.act360 import Act360
+from quant_py.scheduling.adjuster import BusdayConvention
+from quant_py.scheduling.batch import ScheduleBatch
+from quant_py.scheduling.schedule import Schedule
+
+TENORS = [Duration(months=1), Duration(months=3), Duration(months=6), Duration(years=1)]
+
+
+def _random_trades(n: int, seed: int = 42) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    trades = []
+    for _ in range(n):
+        effective = Date(2020, 1, 1).add(days=int(rng.integers(0, 2000)))
+        termination = effective.add(months=int(rng.integers(1, 120)))
+        tenor = TENORS[int(rng.integers(0, len(TENORS)))]
+        roll = int(rng.integers(0, 3))
+        front_stub = None
+        back_stub = None
+        if rng.random() < 0.3:
+            front_stub = effective.add(days=int(rng.integers(5, 200)))
+        if rng.random() < 0.3:
+            back_stub = termination.subtract(days=int(rng.integers(5, 200)))
+        if front_stub is not None and back_stub is not None and front_stub >= back_stub:
+            back_stub = None
+        trades.append(
+            {
+                "effective": effective,
+                "termination": termination,
+                "tenor": tenor,
+                "front_stub": front_stub,
+                "back_stub": back_stub,
+                "eom": roll == 1,
+                "bom": roll == 2,
+            }
+        )
+    return trades
+
+
+def _to_np(dates: list[Date | None]) -> np.ndarray:
+    return np.array(
+        [
+            np.datetime64("NaT", "D") if dt is None else np.datetime64(dt)
+            for dt in dates
+        ],
+        dtype="M8[D]",
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="busday_conv",
+    argvalues=list(BusdayConvention),
+)
+@pytest.mark.unit
+def test_matches_schedule_of(
+    busday_conv: BusdayConvention, sifma: np.busdaycalendar
+) -> None:
+    trades = _random_trades(200)
+    # a back stub directly following a front stub
+    trades.append(
+        {
+            "effective": Date(2025, 1, 10),
+            "termination": Date(2025, 5, 28),
+            "tenor": Duration(months=3),
+            "front_stub": Date(2025, 2, 15),
+            "back_stub": Date(2025, 2, 15),
+            "eom": False,
+            "bom": False,
+        }
+    )
+    batch = ScheduleBatch.of(
+        effective=_to_np([t["effective"] for t in trades]),
+        termination=_to_np([t["termination"] for t in trades]),
+        tenors=[t["tenor"] for t in trades],
+        pay_cal=sifma,
+        busday_conv=busday_conv,
+        front_stub=_to_np([t["front_stub"] for t in trades]),
+        back_stub=_to_np([t["back_stub"] for t in trades]),
+        eom=[t["eom"] for t in trades],
+        bom=[t["bom"] for t in trades],
+    )
+    assert len(batch) == len(trades)
+    for trade, schedule in zip(trades, batch, strict=True):
+        expected = Schedule.of(
+            effective=trade["effective"],
+            termination=trade["termination"],
+            tenor=trade["tenor"],
+            pay_cal=sifma,
+            busday_conv=busday_conv,
+            front_stub=trade["front_stub"],
+            back_stub=trade["back_stub"],
+            eom=trade["eom"],
+            bom=trade["bom"],
+        )
+        assert schedule == expected
+
+
+@pytest.mark.unit
+def test_counts(sifma: np.busdaycalendar) -> None:
+    batch = ScheduleBatch.of(
+        effective=np.array(["2025-08-15", "2025-01-10"], dtype="M8[D]"),
+        termination=np.array(["2027-08-15", "2027-08-15"], dtype="M8[D]"),
+        tenors=[Duration(months=6), Duration(months=6)],
+        pay_cal=sifma,
+        busday_conv=BusdayConvention.FOLLOWING,
+        front_stub=np.array(["NaT", "2025-08-15"], dtype="M8[D]"),
+    )
+    np.testing.assert_array_equal(batch.counts, [4, 5])
+    np.testing.assert_array_equal(batch.offsets, [0, 4, 9])
+
+
+@pytest.mark.unit
+def test_bad_tenor(sifma: np.busdaycalendar) -> None:
+    with pytest.raises(ValueError, match="month or year based tenors"):
+        _ = ScheduleBatch.of(
+            effective=np.array(["2025-08-15"], dtype="M8[D]"),
+            termination=np.array(["2027-08-15"], dtype="M8[D]"),
+            tenors=[Duration(weeks=1)],
+            pay_cal=sifma,
+            busday_conv=BusdayConvention.FOLLOWING,
+        )
+
+
+@pytest.mark.unit
+def test_eom_and_bom(sifma: np.busdaycalendar) -> None:
+    with pytest.raises(
+        ValueError, match="Schedule cannot roll both beginning and end of month!"
+    ):
+        _ = ScheduleBatch.of(
+            effective=np.array(["2025-08-15"], dtype="M8[D]"),
+            termination=np.array(["2027-08-15"], dtype="M8[D]"),
+            tenors=[Duration(months=6)],
+            pay_cal=sifma,
+            busday_conv=BusdayConvention.FOLLOWING,
+            eom=[True],
+            bom=[True],
+        )
+
+
+@pytest.mark.unit
+def test_year_fracs(sifma: np.busdaycalendar) -> None:
+    batch = ScheduleBatch.of(
+        effective=np.array(["2025-08-15", "2025-01-10"], dtype="M8[D]"),
+        termination=np.array(["2027-08-15", "2027-08-15"], dtype="M8[D]"),
+        tenors=[Duration(months=6), Duration(months=6)],
+        pay_cal=sifma,
+        busday_conv=BusdayConvention.FOLLOWING,
+        front_stub=np.array(["NaT", "2025-08-15"], dtype="M8[D]"),
+    )
+    rslt = batch.year_fracs(Act360())
+    expected = np.concatenate([schedule.year_fracs(Act360()) for schedule in batch])
+    np.testing.assert_array_equal(rslt, expected)
+    assert batch.year_fracs(Act360()) is rslt
@@ -0,0 +1,118 @@
+import gc
+import weakref
+
+import numpy as np
+import pytest
+from pendulum.date import Date
+from pendulum.duration import Duration
+
+from quant_py.buscal import BusinessCalendar, calendar_key
+from quant_py.scheduling.adjuster import BusdayConvention
+from quant_py.scheduling.cache import CacheInfo, ScheduleCache
+from quant_py.scheduling.schedule import Schedule
+
+EFFECTIVE = Date(2025, 8, 15)
+SEMIANNUAL = Duration(months=6)
+
+
+def _of(
+    cache: ScheduleCache,
+    pay_cal: np.busdaycalendar | BusinessCalendar,
+    effective: Date = EFFECTIVE,
+    tenor: Duration = SEMIANNUAL,
+) -> Schedule:
+    return cache.of(
+        effective=effective,
+        termination=Date(2027, 8, 15),
+        tenor=tenor,
+        pay_cal=pay_cal,
+        busday_conv=BusdayConvention.FOLLOWING,
+    )
+
+
+@pytest.mark.unit
+def test_hit(sifma: np.busdaycalendar) -> None:
+    cache = ScheduleCache()
+    schedule = _of(cache, sifma)
+    assert _of(cache, sifma) is schedule
+    assert schedule == Schedule.of(
+        effective=Date(2025, 8, 15),
+        termination=Date(2027, 8, 15),
+        tenor=Duration(months=6),
+        pay_cal=sifma,
+        busday_conv=BusdayConvention.FOLLOWING,
+    )
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=4096, currsize=1)
+
+
+@pytest.mark.unit
+def test_miss_on_different_terms(sifma: np.busdaycalendar) -> None:
+    cache = ScheduleCache()
+    schedule = _of(cache, sifma)
+    assert _of(cache, sifma, tenor=Duration(months=3)) is not schedule
+    assert _of(cache, sifma, effective=Date(2025, 9, 15)) is not schedule
+    assert cache.cache_info() == CacheInfo(hits=0, misses=3, maxsize=4096, currsize=3)
+
+
+@pytest.mark.unit
+def test_equal_calendars_share(sifma: np.busdaycalendar) -> None:
+    cache = ScheduleCache()
+    copy = np.busdaycalendar(weekmask=sifma.weekmask, holidays=sifma.holidays)
+    schedule = _of(cache, sifma)
+    assert _of(cache, copy) is schedule
+    assert calendar_key(copy) == calendar_key(sifma)
+    assert calendar_key(np.busdaycalendar()) != calendar_key(sifma)
+
+
+@pytest.mark.unit
+def test_business_calendar_key(sifma: np.busdaycalendar) -> None:
+    buscal = BusinessCalendar(holidays=sifma.holidays)
+    assert calendar_key(buscal) == calendar_key(BusinessCalendar(sifma.holidays))
+    assert calendar_key(buscal) != calendar_key(BusinessCalendar())
+    cache = ScheduleCache()
+    assert _of(cache, buscal) is _of(cache, BusinessCalendar(sifma.holidays))
+
+
+@pytest.mark.unit
+def test_lru_eviction(sifma: np.busdaycalendar) -> None:
+    cache = ScheduleCache(maxsize=2)
+    first = _of(cache, sifma, effective=Date(2025, 8, 15))
+    _ = _of(cache, sifma, effective=Date(2025, 9, 15))
+    assert _of(cache, sifma, effective=Date(2025, 8, 15)) is first
+    _ = _of(cache, sifma, effective=Date(2025, 10, 15))
+    assert len(cache) == 2
+    # the september schedule was least recently used
+    _ = _of(cache, sifma, effective=Date(2025, 9, 15))
+    assert cache.cache_info() == CacheInfo(hits=1, misses=4, maxsize=2, currsize=2)
+
+
+@pytest.mark.unit
+def test_clear(sifma: np.busdaycalendar) -> None:
+    cache = ScheduleCache()
+    _ = _of(cache, sifma)
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=4096, currsize=0)
+
+
+@pytest.mark.unit
+def test_bad_maxsize() -> None:
+    with pytest.raises(ValueError, match="maxsize must be positive"):
+        _ = ScheduleCache(maxsize=0)
+
+
+def _cache_year(cache: ScheduleCache, year: int) -> weakref.ref[BusinessCalendar]:
+    holidays = np.array([f"{year}-12-25"], dtype="M8[D]")
+    calendar = BusinessCalendar(
+        holidays, start=np.datetime64("2020-01-01"), end=np.datetime64("2040-01-01")
+    )
+    _ = _of(cache, calendar)
+    return weakref.ref(calendar)
+
+
+@pytest.mark.unit
+def test_calendars_evicted_with_schedules() -> None:
+    cache = ScheduleCache(maxsize=2)
+    refs = [_cache_year(cache, year) for year in range(2025, 2030)]
+    gc.collect()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=5, maxsize=2, currsize=2)
+    assert [ref() is not None for ref in refs] == [False, False, False, True, True]
@@ -1,8 +1,12 @@
+from datetime import date
+from typing import Self, override
+
+import numpy as np
 import pytest
 from pendulum.date import Date
 from pendulum.duration import Duration
 
-from quant_py.scheduling.roll_convention import Bom, DayOfMonth, Eom
+from quant_py.scheduling.roll_convention import Bom, DayOfMonth, Eom, RollConventions
 
 
 @pytest.mark.unit
@@ -60,3 +64,63 @@ def test_day_of_month_eq_bad() -> None:
     rc1 = DayOfMonth(1)
     rc2 = Eom()
     assert rc1 != rc2
+
+
+class IdentityRoll(RollConventions):
+    @override
+    def adjust(self: Self, dt: date) -> date:
+        return dt
+
+
+ROLL_CONVS = [DayOfMonth(15), DayOfMonth(29), DayOfMonth(31), Eom(), Bom()]
+MONTH_TENORS = [Duration(months=1), Duration(months=3), Duration(years=1)]
+
+
+@pytest.mark.parametrize(argnames="tenor", argvalues=MONTH_TENORS)
+@pytest.mark.parametrize(argnames="roll_conv", argvalues=ROLL_CONVS)
+@pytest.mark.unit
+def test_next_previous_fast_path(roll_conv: RollConventions, tenor: Duration) -> None:
+    dt = Date(2023, 1, 1)
+    for _ in range(800):
+        dt = dt.add(days=1)
+        assert roll_conv.next(dt, tenor) == roll_conv.adjust(dt + tenor)
+        assert roll_conv.previous(dt, tenor) == roll_conv.adjust(dt - tenor)
+
+
+@pytest.mark.parametrize(argnames="roll_conv", argvalues=ROLL_CONVS)
+@pytest.mark.unit
+def test_plain_dates(roll_conv: RollConventions) -> None:
+    # plain dates roll exactly like pendulum dates and keep their type
+    dt = Date(2024, 1, 20)
+    for tenor in [*MONTH_TENORS, Duration(weeks=1)]:
+        plain = date(dt.year, dt.month, dt.day)
+        for rslt, expected in (
+            (roll_conv.next(plain, tenor), roll_conv.next(dt, tenor)),
+            (roll_conv.previous(plain, tenor), roll_conv.previous(dt, tenor)),
+            (roll_conv.adjust(plain), roll_conv.adjust(dt)),
+        ):
+            assert type(rslt) is date
+            assert type(expected) is Date
+            assert rslt == expected
+
+
+@pytest.mark.parametrize(argnames="tenor", argvalues=MONTH_TENORS)
+@pytest.mark.parametrize(argnames="roll_conv", argvalues=ROLL_CONVS)
+@pytest.mark.unit
+def test_sequence(roll_conv: RollConventions, tenor: Duration) -> None:
+    dt = Date(2024, 1, 31)
+    rslt = roll_conv.sequence(dt, tenor, 600)
+    expected = []
+    for _ in range(600):
+        dt = roll_conv.next(dt, tenor)
+        expected.append(np.datetime64(dt, "D"))
+    np.testing.assert_array_equal(rslt, np.array(expected, dtype="M8[D]"))
+
+
+@pytest.mark.unit
+def test_sequence_no_roll_day() -> None:
+    roll_conv = IdentityRoll()
+    assert roll_conv.roll_day is None
+    rslt = roll_conv.sequence(Date(2025, 1, 1), Duration(weeks=1), 3)
+    expected = np.array(["2025-01-08", "2025-01-15", "2025-01-22"], dtype="M8[D]")
+    np.testing.assert_array_equal(rslt, expected)
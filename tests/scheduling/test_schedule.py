@@ -1,17 +1,14 @@
-from typing import TYPE_CHECKING
-
+import numpy as np
 import pytest
 from pendulum.date import Date
 from pendulum.duration import Duration
 
+from quant_py.daycounters.act360 import Act360
 from quant_py.scheduling.adjuster import BusdayConvention
-from quant_py.scheduling.period import Period
+from quant_py.scheduling.period import Period, PeriodType
 from quant_py.scheduling.roll_convention import Bom, DayOfMonth, Eom, RollConventions
 from quant_py.scheduling.schedule import Schedule
 
-if TYPE_CHECKING:
-    import numpy as np
-
 
 @pytest.fixture
 def schedule_semiannual_reg(sifma: np.busdaycalendar) -> Schedule:
@@ -170,3 +167,231 @@ def test_get_roll_conv_bad_input() -> None:
         ValueError, match="Schedule cannot roll both beginning and end of month!"
     ):
         _ = Schedule._get_roll_conv(Date.today(), eom=True, bom=True)
+
+
+@pytest.mark.unit
+def test_columns(schedule_semiannual_reg: Schedule) -> None:
+    expected_start = np.array(
+        ["2025-08-15", "2026-02-16", "2026-08-17", "2027-02-15"], dtype="M8[D]"
+    )
+    expected_unadj_end = np.array(
+        ["2026-02-15", "2026-08-15", "2027-02-15", "2027-08-15"], dtype="M8[D]"
+    )
+    assert schedule_semiannual_reg.start.dtype == np.dtype("M8[D]")
+    np.testing.assert_array_equal(schedule_semiannual_reg.start, expected_start)
+    np.testing.assert_array_equal(schedule_semiannual_reg.unadj_end, expected_unadj_end)
+
+
+@pytest.mark.unit
+def test_columns_read_only(schedule_semiannual_reg: Schedule) -> None:
+    with pytest.raises(ValueError, match="read-only"):
+        schedule_semiannual_reg.start[0] = np.datetime64("2025-01-01")
+
+
+@pytest.mark.unit
+def test_len_and_getitem(schedule_semiannual_long_front: Schedule) -> None:
+    assert len(schedule_semiannual_long_front) == 5
+    assert schedule_semiannual_long_front[0] == Period(
+        start=Date(2025, 1, 10),
+        end=Date(2025, 8, 15),
+        unadj_start=Date(2025, 1, 10),
+        unadj_end=Date(2025, 8, 15),
+    )
+    assert list(schedule_semiannual_long_front) == (
+        schedule_semiannual_long_front.periods
+    )
+
+
+@pytest.mark.unit
+def test_from_periods(schedule_semiannual_short_back: Schedule) -> None:
+    rslt = Schedule.from_periods(
+        schedule_semiannual_short_back.periods,
+        roll_conv=schedule_semiannual_short_back.roll_conv,
+        adjuster=schedule_semiannual_short_back.adjuster,
+        tenor=schedule_semiannual_short_back.tenor,
+    )
+    assert rslt == schedule_semiannual_short_back
+    assert rslt.periods == schedule_semiannual_short_back.periods
+
+
+@pytest.mark.parametrize(argnames="adjusted", argvalues=[True, False])
+@pytest.mark.unit
+def test_year_fracs(
+    adjusted: bool,  # noqa: FBT001
+    schedule_semiannual_long_front: Schedule,
+) -> None:
+    expected = [
+        period.calc_year_frac(Act360(), adjusted=adjusted)
+        for period in schedule_semiannual_long_front
+    ]
+    rslt = schedule_semiannual_long_front.year_fracs(Act360(), adjusted=adjusted)
+    np.testing.assert_array_equal(rslt, expected)
+
+
+@pytest.mark.unit
+def test_year_fracs_memoized(schedule_semiannual_reg: Schedule) -> None:
+    rslt = schedule_semiannual_reg.year_fracs(Act360())
+    assert schedule_semiannual_reg.year_fracs(Act360()) is rslt
+    assert schedule_semiannual_reg.year_fracs(Act360(), adjusted=False) is not rslt
+    assert not rslt.flags.writeable
+
+
+@pytest.mark.unit
+def test_period_types(
+    schedule_semiannual_reg: Schedule,
+    schedule_semiannual_long_front: Schedule,
+    schedule_semiannual_short_back: Schedule,
+) -> None:
+    assert schedule_semiannual_reg.period_types.dtype == np.int8
+    assert not schedule_semiannual_reg.stub_mask.any()
+    assert schedule_semiannual_long_front.period_type(0) == PeriodType.LONG_FRONT
+    np.testing.assert_array_equal(
+        schedule_semiannual_long_front.stub_mask, [True, False, False, False, False]
+    )
+    assert schedule_semiannual_short_back.period_type(3) == PeriodType.SHORT_BACK
+
+
+@pytest.mark.parametrize(
+    argnames=("effective", "front_stub", "back_stub", "termination", "expected"),
+    argvalues=[
+        (
+            Date(2025, 6, 1),
+            Date(2025, 8, 15),
+            None,
+            Date(2026, 8, 15),
+            [PeriodType.SHORT_FRONT, PeriodType.REGULAR, PeriodType.REGULAR],
+        ),
+        (
+            Date(2025, 8, 15),
+            None,
+            Date(2026, 8, 15),
+            Date(2027, 5, 1),
+            [
+                PeriodType.REGULAR,
+                PeriodType.REGULAR,
+                PeriodType.LONG_BACK,
+            ],
+        ),
+    ],
+)
+@pytest.mark.unit
+def test_period_types_stubs(
+    effective: Date,
+    front_stub: Date | None,
+    back_stub: Date | None,
+    termination: Date,
+    expected: list[PeriodType],
+    sifma: np.busdaycalendar,
+) -> None:
+    schedule = Schedule.of(
+        effective=effective,
+        termination=termination,
+        tenor=Duration(months=6),
+        pay_cal=sifma,
+        busday_conv=BusdayConvention.FOLLOWING,
+        front_stub=front_stub,
+        back_stub=back_stub,
+    )
+    np.testing.assert_array_equal(schedule.period_types, expected)
+
+
+@pytest.mark.unit
+def test_period_types_adjacent_stubs() -> None:
+    # no rolled periods between the stubs, so the back stub directly follows
+    schedule = Schedule.of(
+        effective=Date(2025, 1, 10),
+        termination=Date(2025, 5, 28),
+        tenor=Duration(months=3),
+        pay_cal=np.busdaycalendar(),
+        busday_conv=BusdayConvention.FOLLOWING,
+        front_stub=Date(2025, 2, 15),
+        back_stub=Date(2025, 2, 15),
+    )
+    np.testing.assert_array_equal(
+        schedule.period_types, [PeriodType.SHORT_FRONT, PeriodType.LONG_BACK]
+    )
+
+
+@pytest.mark.unit
+def test_period_types_match_period(schedule_semiannual_long_front: Schedule) -> None:
+    roll_conv = schedule_semiannual_long_front.roll_conv
+    tenor = schedule_semiannual_long_front.tenor
+    for idx, period in enumerate(schedule_semiannual_long_front):
+        period_type = schedule_semiannual_long_front.period_type(idx)
+        assert (period_type == PeriodType.REGULAR) == period.is_regular(
+            roll_conv, tenor
+        )
+        assert (
+            period_type in {PeriodType.LONG_FRONT, PeriodType.LONG_BACK}
+        ) == period.is_long_stub(roll_conv, tenor)
+
+
+@pytest.mark.unit
+def test_period_types_off_roll_start(sifma: np.busdaycalendar) -> None:
+    schedule = Schedule.of(
+        effective=Date(2025, 1, 15),
+        termination=Date(2025, 6, 30),
+        tenor=Duration(months=1),
+        pay_cal=sifma,
+        busday_conv=BusdayConvention.FOLLOWING,
+        eom=True,
+    )
+    assert schedule.period_type(0) == PeriodType.LONG_FRONT
+    assert not schedule.stub_mask[1:].any()
+    assert schedule[0].is_long_stub(schedule.roll_conv, schedule.tenor, front=True)
+
+
+@pytest.mark.parametrize(
+    argnames=("effective", "termination", "front_stub", "back_stub", "eom", "bom"),
+    argvalues=[
+        (Date(2025, 1, 15), Date(2025, 6, 30), None, None, True, False),
+        (Date(2025, 1, 15), Date(2025, 6, 20), None, None, False, False),
+        (Date(2025, 1, 10), Date(2026, 8, 15), Date(2025, 2, 15), None, False, False),
+        (Date(2025, 2, 15), Date(2026, 9, 5), None, Date(2026, 8, 15), False, False),
+        (Date(2025, 1, 20), Date(2026, 3, 31), None, Date(2026, 1, 31), True, False),
+        (Date(2025, 1, 20), Date(2026, 4, 1), Date(2025, 3, 1), None, False, True),
+    ],
+)
+@pytest.mark.unit
+def test_period_types_consistent(
+    effective: Date,
+    termination: Date,
+    front_stub: Date | None,
+    back_stub: Date | None,
+    eom: bool,  # noqa: FBT001
+    bom: bool,  # noqa: FBT001
+    sifma: np.busdaycalendar,
+) -> None:
+    schedule = Schedule.of(
+        effective=effective,
+        termination=termination,
+        tenor=Duration(months=3),
+        pay_cal=sifma,
+        busday_conv=BusdayConvention.FOLLOWING,
+        front_stub=front_stub,
+        back_stub=back_stub,
+        eom=eom,
+        bom=bom,
+    )
+    rslt = Schedule.from_periods(
+        schedule.periods,
+        roll_conv=schedule.roll_conv,
+        adjuster=schedule.adjuster,
+        tenor=schedule.tenor,
+    )
+    np.testing.assert_array_equal(rslt.period_types, schedule.period_types)
+
+    roll_conv, tenor = schedule.roll_conv, schedule.tenor
+    front = True
+    for idx, period in enumerate(schedule):
+        period_type = schedule.period_type(idx)
+        front = front and period_type != PeriodType.REGULAR
+        assert (period_type == PeriodType.REGULAR) == period.is_regular(
+            roll_conv, tenor
+        )
+        assert (
+            period_type in {PeriodType.LONG_FRONT, PeriodType.LONG_BACK}
+        ) == period.is_long_stub(roll_conv, tenor, front=front)
+        assert (
+            period_type in {PeriodType.SHORT_FRONT, PeriodType.SHORT_BACK}
+        ) == period.is_short_stub(roll_conv, tenor, front=front)
@@ -1,8 +1,13 @@
+from datetime import date
+
 import numpy as np
 import pytest
 from pendulum.date import Date
 
-from quant_py.buscal import BusinessCalendar
+from quant_py import buscal as buscal_module
+from quant_py.buscal import BusinessCalendar, JointCalendarRule, as_business_calendar
+from quant_py.dates import from_dates
+from quant_py.scheduling.adjuster import Adjuster, BusdayConvention
 
 
 @pytest.fixture
@@ -39,3 +44,229 @@ def buscal() -> BusinessCalendar:
 @pytest.mark.unit
 def test_is_busday(dt: Date, expected: bool, buscal: BusinessCalendar) -> None:  # noqa: FBT001
     assert buscal.is_busday(dt) == expected
+
+
+@pytest.fixture
+def dates() -> np.ndarray:
+    return np.arange("2024-12-01", "2026-02-01", dtype="M8[D]")
+
+
+@pytest.mark.unit
+def test_is_busday_many(buscal: BusinessCalendar, dates: np.ndarray) -> None:
+    expected = np.is_busday(dates, busdaycal=buscal.busdaycalendar)
+    np.testing.assert_array_equal(buscal.is_busday_many(dates), expected)
+
+
+@pytest.mark.parametrize(
+    argnames="busday_conv",
+    argvalues=list(BusdayConvention),
+)
+@pytest.mark.unit
+def test_roll(
+    busday_conv: BusdayConvention, buscal: BusinessCalendar, dates: np.ndarray
+) -> None:
+    expected = Adjuster(
+        calendar=buscal.busdaycalendar, busday_conv=busday_conv
+    ).adjust_many(dates)
+    np.testing.assert_array_equal(buscal.roll(dates, busday_conv), expected)
+
+
+@pytest.mark.parametrize(
+    argnames="busday_conv",
+    argvalues=list(BusdayConvention),
+)
+@pytest.mark.unit
+def test_roll_date(
+    busday_conv: BusdayConvention, buscal: BusinessCalendar, dates: np.ndarray
+) -> None:
+    rslt = [buscal.roll_date(dt, busday_conv) for dt in dates.tolist()]
+    assert all(type(dt) is date for dt in rslt)
+    np.testing.assert_array_equal(from_dates(rslt), buscal.roll(dates, busday_conv))
+    assert buscal.roll_date(Date(2025, 11, 29), busday_conv) == Adjuster(
+        buscal.busdaycalendar, busday_conv
+    ).adjust(Date(2025, 11, 29))
+
+
+@pytest.mark.parametrize(argnames="n", argvalues=[-3, 0, 1, 10])
+@pytest.mark.unit
+def test_add_busdays(n: int, buscal: BusinessCalendar, dates: np.ndarray) -> None:
+    expected = np.busday_offset(
+        dates, n, roll="following", busdaycal=buscal.busdaycalendar
+    )
+    np.testing.assert_array_equal(buscal.add_busdays(dates, n), expected)
+
+
+@pytest.mark.unit
+def test_busday_count(buscal: BusinessCalendar, dates: np.ndarray) -> None:
+    ends = dates[::-1]
+    expected = np.busday_count(dates, ends, busdaycal=buscal.busdaycalendar)
+    np.testing.assert_array_equal(buscal.busday_count(dates, ends), expected)
+
+
+@pytest.mark.unit
+def test_from_tables(buscal: BusinessCalendar, dates: np.ndarray) -> None:
+    rebuilt = BusinessCalendar._from_tables(
+        buscal.holidays, buscal.weekmask, buscal.start, buscal.end, buscal.tables
+    )
+    assert rebuilt.key == buscal.key
+    assert rebuilt.tables.cum_count is buscal.tables.cum_count
+    np.testing.assert_array_equal(
+        rebuilt.roll(dates, BusdayConvention.MODIFIEDFOLLOWING),
+        buscal.roll(dates, BusdayConvention.MODIFIEDFOLLOWING),
+    )
+
+
+@pytest.mark.unit
+def test_outside_range() -> None:
+    buscal = BusinessCalendar(
+        start=np.datetime64("2025-01-01"), end=np.datetime64("2026-01-01")
+    )
+    with pytest.raises(ValueError, match="outside of the calendar range"):
+        _ = buscal.is_busday(Date(2026, 1, 1))
+    with pytest.raises(ValueError, match="outside of the calendar range"):
+        _ = buscal.roll(
+            np.array(["2024-12-31"], dtype="M8[D]"), BusdayConvention.FOLLOWING
+        )
+    with pytest.raises(ValueError, match="outside of the calendar range"):
+        _ = buscal.add_busdays(np.array(["2025-12-31"], dtype="M8[D]"), 1)
+    with pytest.raises(ValueError, match="outside of the calendar range"):
+        _ = buscal.roll_date(Date(2024, 12, 31), BusdayConvention.FOLLOWING)
+
+
+@pytest.mark.unit
+def test_adjuster_drop_in(buscal: BusinessCalendar) -> None:
+    adjuster = Adjuster(calendar=buscal, busday_conv=BusdayConvention.FOLLOWING)
+    assert adjuster.adjust(Date(2025, 11, 27)) == Date(2025, 11, 28)
+
+
+@pytest.fixture
+def target() -> BusinessCalendar:
+    holidays = [
+        "2025-01-01",
+        "2025-04-18",
+        "2025-04-21",
+        "2025-05-01",
+        "2025-12-25",
+        "2025-12-26",
+    ]
+    return BusinessCalendar(
+        holidays=np.asarray(holidays, dtype="M8[D]"),
+        weekmask="1111100",
+        start=np.datetime64("2020-01-01"),
+        end=np.datetime64("2030-01-01"),
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=("rule", "expected"),
+    argvalues=[
+        (JointCalendarRule.UNION, np.logical_and),
+        (JointCalendarRule.INTERSECTION, np.logical_or),
+    ],
+)
+@pytest.mark.unit
+def test_join(
+    rule: JointCalendarRule,
+    expected: np.ufunc,
+    buscal: BusinessCalendar,
+    target: BusinessCalendar,
+    dates: np.ndarray,
+) -> None:
+    joint = BusinessCalendar.join(buscal, target, rule=rule)
+    assert joint.start == target.start
+    assert joint.end == target.end
+    np.testing.assert_array_equal(
+        joint.is_busday_many(dates),
+        expected(buscal.is_busday_many(dates), target.is_busday_many(dates)),
+    )
+
+
+@pytest.mark.unit
+def test_join_weekmasks() -> None:
+    mon_fri = BusinessCalendar(weekmask="1111100")
+    sun_thu = BusinessCalendar(weekmask="1111001")
+    assert BusinessCalendar.join(mon_fri, sun_thu).weekmask == "1111000"
+    assert (
+        BusinessCalendar.join(
+            mon_fri, sun_thu, rule=JointCalendarRule.INTERSECTION
+        ).weekmask
+        == "1111101"
+    )
+
+
+@pytest.mark.unit
+def test_join_memoized(buscal: BusinessCalendar, target: BusinessCalendar) -> None:
+    joint = BusinessCalendar.join(buscal, target)
+    assert BusinessCalendar.join(target, buscal) is joint
+    assert BusinessCalendar.join(buscal, target, buscal) is joint
+    assert (
+        BusinessCalendar.join(buscal, target, rule=JointCalendarRule.INTERSECTION)
+        is not joint
+    )
+    assert BusinessCalendar.join(buscal) is buscal
+
+    # equal calendars share the joint calendar too
+    copy = BusinessCalendar(buscal.holidays, start=buscal.start, end=buscal.end)
+    assert BusinessCalendar.join(copy, target) is joint
+    assert BusinessCalendar.join(buscal, copy) is buscal
+
+
+@pytest.mark.unit
+def test_join_bounded() -> None:
+    base = BusinessCalendar(
+        start=np.datetime64("2020-01-01"), end=np.datetime64("2030-01-01")
+    )
+    for year in range(2000, 2050):
+        other = BusinessCalendar(
+            np.array([f"{year}-12-25"], dtype="M8[D]"),
+            start=np.datetime64("2020-01-01"),
+            end=np.datetime64("2030-01-01"),
+        )
+        _ = BusinessCalendar.join(base, other)
+    assert len(buscal_module._joined) <= buscal_module._CACHE_SIZE
+
+
+@pytest.mark.unit
+def test_join_no_overlap() -> None:
+    early = BusinessCalendar(
+        start=np.datetime64("2000-01-01"), end=np.datetime64("2010-01-01")
+    )
+    late = BusinessCalendar(
+        start=np.datetime64("2010-01-01"), end=np.datetime64("2020-01-01")
+    )
+    with pytest.raises(ValueError, match="overlapping"):
+        _ = BusinessCalendar.join(early, late)
+
+
+@pytest.mark.unit
+def test_ordinal(buscal: BusinessCalendar) -> None:
+    dts = np.array(["2025-08-29", "2025-08-30", "2025-09-01", "2025-09-02"], "M8[D]")
+    ordinals = buscal.ordinal(dts)
+    # weekend and holiday share the ordinal of the following busday
+    np.testing.assert_array_equal(np.diff(ordinals), [1, 0, 0])
+    np.testing.assert_array_equal(
+        buscal.from_ordinal(ordinals),
+        np.array(["2025-08-29", "2025-09-02", "2025-09-02", "2025-09-02"], "M8[D]"),
+    )
+
+
+@pytest.mark.unit
+def test_as_business_calendar(
+    buscal: BusinessCalendar, sifma: np.busdaycalendar
+) -> None:
+    assert as_business_calendar(buscal) is buscal
+    converted = as_business_calendar(sifma)
+    assert as_business_calendar(sifma) is converted
+    assert converted.key == buscal.key
+
+    # equal calendars share the conversion
+    copy = np.busdaycalendar(weekmask=sifma.weekmask, holidays=sifma.holidays)
+    assert as_business_calendar(copy) is converted
+
+
+@pytest.mark.unit
+def test_as_business_calendar_bounded() -> None:
+    for year in range(2000, 2050):
+        holidays = np.array([f"{year}-12-25"], dtype="M8[D]")
+        _ = as_business_calendar(np.busdaycalendar(holidays=holidays))
+    assert len(buscal_module._converted) <= buscal_module._CACHE_SIZE
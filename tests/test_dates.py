@@ -0,0 +1,122 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from pendulum.date import Date
+from pendulum.duration import Duration
+
+from quant_py.dates import (
+    add_tenor,
+    days_in_month,
+    from_dates,
+    from_ymd,
+    roll_months,
+    roll_to_day,
+    tenor_in_months,
+    to_date,
+    ymd,
+)
+
+
+@pytest.mark.parametrize(
+    argnames=("tenor", "expected"),
+    argvalues=[
+        (Duration(months=6), 6),
+        (Duration(years=2), 24),
+        (Duration(years=1, months=6), 18),
+        (Duration(weeks=1), None),
+        (Duration(days=3), None),
+    ],
+)
+@pytest.mark.unit
+def test_tenor_in_months(tenor: Duration, expected: int | None) -> None:
+    assert tenor_in_months(tenor) == expected
+
+
+@pytest.mark.unit
+def test_days_in_month() -> None:
+    months = np.array(["2024-02", "2025-02", "2025-11", "2025-12"], dtype="M8[M]")
+    np.testing.assert_array_equal(days_in_month(months), [29, 28, 30, 31])
+
+
+@pytest.mark.unit
+def test_roll_to_day() -> None:
+    months = np.array(["2024-02", "2025-11", "2025-12"], dtype="M8[M]")
+    rslt = roll_to_day(months, [31, 31, 15])
+    expected = np.array(["2024-02-29", "2025-11-30", "2025-12-15"], dtype="M8[D]")
+    np.testing.assert_array_equal(rslt, expected)
+
+
+@pytest.mark.unit
+def test_ymd() -> None:
+    dates = np.array(["1969-12-31", "2024-02-29", "2025-11-01"], dtype="M8[D]")
+    year, month, day = ymd(dates)
+    np.testing.assert_array_equal(year, [1969, 2024, 2025])
+    np.testing.assert_array_equal(month, [12, 2, 11])
+    np.testing.assert_array_equal(day, [31, 29, 1])
+
+    with pytest.raises(ValueError, match="NaT"):
+        _ = ymd(np.array(["2025-11-01", "NaT"], dtype="M8[D]"))
+    # in a later block of a long array too
+    dates = np.arange("2000-01-01", "2100-01-01", dtype="M8[D]")
+    dates[-1] = np.datetime64("NaT", "D")
+    with pytest.raises(ValueError, match="NaT"):
+        _ = ymd(dates)
+
+
+@pytest.mark.unit
+def test_ymd_round_trip() -> None:
+    # long enough to be decoded in blocks, through leap and non-leap centuries
+    dates = np.arange("1899-01-01", "2101-01-01", dtype="M8[D]")
+    year, month, day = ymd(dates)
+    months = dates.astype("M8[M]")
+    np.testing.assert_array_equal(year, months.astype("M8[Y]").astype(np.int64) + 1970)
+    np.testing.assert_array_equal(month, months.astype(np.int64) % 12 + 1)
+    np.testing.assert_array_equal(from_ymd(year, month, day), dates)
+
+    year, _, _ = ymd(dates[1:].reshape(-1, 2)[:, ::-1])
+    assert year.shape == (dates.size // 2, 2)
+    assert year[-1, 0] == 2100
+
+
+@pytest.mark.unit
+def test_from_dates() -> None:
+    dates = [Date(2024, 2, 29), date(1969, 12, 31)]
+    expected = np.array(["2024-02-29", "1969-12-31"], dtype="M8[D]")
+    np.testing.assert_array_equal(from_dates(dates), expected)
+
+
+@pytest.mark.unit
+def test_to_date() -> None:
+    assert to_date(np.datetime64("2024-02-29")) == Date(2024, 2, 29)
+    assert type(to_date(np.datetime64("2024-02-29"))) is Date
+    with pytest.raises(ValueError, match="NaT"):
+        _ = to_date(np.datetime64("NaT", "D"))
+
+
+@pytest.mark.parametrize(
+    argnames="tenor",
+    argvalues=[
+        Duration(months=1),
+        Duration(years=1, months=3),
+        Duration(weeks=2),
+        Duration(months=1, days=3),
+    ],
+)
+@pytest.mark.unit
+def test_add_tenor_matches_pendulum(tenor: Duration) -> None:
+    dt = Date(2023, 12, 25)
+    for _ in range(100):
+        dt = dt.add(days=1)
+        plain = date(dt.year, dt.month, dt.day)
+        assert add_tenor(plain, tenor) == dt + tenor
+        assert add_tenor(plain, tenor, -1) == dt - tenor
+        assert type(add_tenor(plain, tenor)) is date
+        assert type(add_tenor(dt, tenor)) is Date
+
+
+@pytest.mark.unit
+def test_roll_months() -> None:
+    assert roll_months(date(2024, 1, 31), 1, 31) == date(2024, 2, 29)
+    assert roll_months(date(2025, 1, 15), -13, 31) == date(2023, 12, 31)
+    assert roll_months(Date(2025, 3, 30), 0, 1) == Date(2025, 3, 1)
@@ -0,0 +1,98 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from quant_py.fixings import Fixings, FixingsStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+DATES = np.array(["2025-08-13", "2025-08-14", "2025-08-15"], dtype="M8[D]")
+VALUES = np.array([0.043, 0.0435, 0.044])
+
+
+@pytest.mark.unit
+def test_lookup() -> None:
+    fixings = Fixings(DATES, VALUES)
+    rslt = fixings.lookup(["2025-08-15", "2025-08-13"])
+    np.testing.assert_array_equal(rslt, [0.044, 0.043])
+    assert len(fixings) == 3
+
+
+@pytest.mark.unit
+def test_read_only() -> None:
+    fixings = Fixings(DATES, VALUES)
+    with pytest.raises(ValueError, match="read-only"):
+        fixings.values[0] = 0.0
+
+
+@pytest.mark.parametrize(
+    argnames="dt",
+    argvalues=["2025-08-12", "2025-08-16", "2025-08-14"],
+)
+@pytest.mark.unit
+def test_lookup_missing(dt: str) -> None:
+    fixings = Fixings(DATES[[0, 2]], VALUES[[0, 2]])
+    with pytest.raises(ValueError, match="Missing fixing"):
+        _ = fixings.lookup([dt])
+
+
+@pytest.mark.unit
+def test_unsorted() -> None:
+    with pytest.raises(ValueError, match="strictly increasing"):
+        _ = Fixings(DATES[::-1], VALUES)
+
+
+@pytest.mark.unit
+def test_mismatched_lengths() -> None:
+    with pytest.raises(ValueError, match="equal length"):
+        _ = Fixings(DATES, VALUES[:2])
+
+
+@pytest.mark.unit
+def test_store_roundtrip(tmp_path: Path) -> None:
+    store = FixingsStore(tmp_path)
+    store.save("SOFR", Fixings(DATES, VALUES))
+    fixings = store.load("SOFR")
+    for column in (fixings.dates, fixings.values):
+        base: object = column
+        while isinstance(base, np.ndarray) and not isinstance(base, np.memmap):
+            base = base.base
+        assert isinstance(base, np.memmap)
+        assert base.mode == "r"
+    np.testing.assert_array_equal(fixings.dates, DATES)
+    np.testing.assert_array_equal(fixings.values, VALUES)
+    assert store["SOFR"] is fixings
+    assert "SOFR" in store
+    assert store.names() == ["SOFR"]
+
+
+@pytest.mark.unit
+def test_store_shared_across_instances(tmp_path: Path) -> None:
+    FixingsStore(tmp_path).save("ESTR", Fixings(DATES, VALUES))
+    fixings = FixingsStore(tmp_path).load("ESTR")
+    np.testing.assert_array_equal(fixings.lookup(["2025-08-14"]), [0.0435])
+
+
+@pytest.mark.unit
+def test_store_replace(tmp_path: Path) -> None:
+    store = FixingsStore(tmp_path)
+    store.save("SONIA", Fixings(DATES[:2], VALUES[:2]))
+    _ = store.load("SONIA")
+    store.save("SONIA", Fixings(DATES, VALUES))
+    assert len(store.load("SONIA")) == 3
+    assert store.names() == ["SONIA"]
+    assert [path.name for path in tmp_path.iterdir()] == ["SONIA.npy"]
+
+
+@pytest.mark.unit
+def test_store_missing(tmp_path: Path) -> None:
+    with pytest.raises(KeyError, match="No fixings stored for SOFR"):
+        _ = FixingsStore(tmp_path).load("SOFR")
+
+
+@pytest.mark.unit
+def test_store_invalid_name(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Invalid index name"):
+        FixingsStore(tmp_path).save("../SOFR", Fixings(DATES, VALUES))
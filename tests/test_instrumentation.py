@@ -0,0 +1,143 @@
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+from pendulum.date import Date
+from pendulum.duration import Duration
+
+from quant_py import instrumentation
+from quant_py.daycounter import Daycounter
+from quant_py.daycounters.act360 import Act360
+from quant_py.daycounters.thirty360 import Thirty360, Thirty360E
+from quant_py.instrumentation import instrumented
+from quant_py.scheduling.adjuster import Adjuster, BusdayConvention
+from quant_py.scheduling.roll_convention import RollConventions
+from quant_py.scheduling.schedule import Schedule
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import date
+
+    import numpy as np
+
+
+@pytest.fixture(autouse=True)
+def _clean() -> Iterator[None]:
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+@pytest.mark.unit
+def test_disabled_leaves_methods_alone() -> None:
+    adjust = Adjuster.__dict__["adjust"]
+    of = Schedule.__dict__["of"]
+    instrumentation.enable()
+    assert Adjuster.__dict__["adjust"] is not adjust
+    instrumentation.disable()
+    assert Adjuster.__dict__["adjust"] is adjust
+    assert Schedule.__dict__["of"] is of
+    assert not instrumentation.is_enabled()
+
+
+@pytest.mark.unit
+def test_instrumented(sifma: np.busdaycalendar) -> None:
+    adjust = Adjuster.__dict__["adjust"]
+    with instrumented() as stats:
+        schedule = Schedule.of(
+            Date(2025, 1, 31),
+            Date(2026, 1, 31),
+            Duration(months=3),
+            sifma,
+            BusdayConvention.MODIFIEDFOLLOWING,
+            eom=True,
+        )
+        assert Adjuster.__dict__["adjust"] is not adjust
+        assert not instrumentation.is_enabled()
+        assert stats == {}
+
+    assert Adjuster.__dict__["adjust"] is adjust
+    assert set(stats) >= {"Schedule.of", "Eom.next", "Eom.previous"}
+    assert stats["Schedule.of"].calls == 1
+    assert stats["Eom.next"].calls >= len(schedule)
+    assert stats["Adjuster.adjust_many"].calls == 2
+    assert stats["Schedule.of"].seconds >= stats["Eom.next"].seconds > 0
+
+    # calls outside the block aren't recorded
+    Act360().count(Date(2025, 1, 1), Date(2025, 7, 1))
+    assert "Act360.count" not in instrumentation.snapshot()
+
+
+@pytest.mark.unit
+def test_keyed_by_receiver() -> None:
+    with instrumented() as stats:
+        Thirty360().count(Date(2025, 1, 31), Date(2025, 3, 31))
+        Thirty360E().count(Date(2025, 1, 31), Date(2025, 3, 31))
+        Thirty360E().count(Date(2025, 1, 31), Date(2025, 3, 31))
+
+    assert stats["Thirty360.count"].calls == 1
+    assert stats["Thirty360E.count"].calls == 2
+    assert getattr(RollConventions.next, "__wrapped__", None) is None
+
+
+@pytest.mark.unit
+def test_nested_and_cumulative(sifma: np.busdaycalendar) -> None:
+    adjuster = Adjuster(sifma, BusdayConvention.FOLLOWING)
+    instrumentation.enable()
+    adjuster.adjust(Date(2025, 1, 1))
+    with instrumented() as stats:
+        adjuster.adjust(Date(2025, 1, 1))
+
+    assert stats["Adjuster.adjust"].calls == 1
+    assert instrumentation.is_enabled()
+    assert instrumentation.snapshot()["Adjuster.adjust"].calls == 2
+
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
+
+
+@pytest.mark.unit
+def test_records_failed_calls(sifma: np.busdaycalendar) -> None:
+    adjuster = Adjuster(sifma, BusdayConvention.FOLLOWING)
+    with instrumented() as stats, pytest.raises(ValueError, match="not a date"):
+        adjuster.adjust_many("not a date")
+
+    assert stats["Adjuster.adjust_many"].calls == 1
+
+
+@pytest.mark.unit
+def test_scoped_to_thread() -> None:
+    start, end = Date(2025, 1, 1), Date(2025, 7, 1)
+    entered, done = threading.Event(), threading.Event()
+
+    def other() -> None:
+        entered.wait()
+        Act360().count(start, end)
+        done.set()
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    with instrumented() as stats:
+        entered.set()
+        done.wait()
+        Act360().count(start, end)
+    thread.join()
+
+    assert stats["Act360.count"].calls == 1
+
+
+@pytest.mark.unit
+def test_late_subclass_and_super() -> None:
+    start, end = Date(2025, 1, 1), Date(2025, 7, 1)
+    with instrumented() as stats:
+
+        class Scaled(Act360):
+            def count(self, start: date, end: date) -> float:
+                return 2 * super().count(start, end)
+
+        assert Scaled().count(start, end) == 2 * Act360().count(start, end)
+
+    assert stats[f"{Scaled.__qualname__}.count"].calls == 1
+    assert stats["Act360.count"].calls == 1
+    assert "__init_subclass__" not in Daycounter.__dict__
+    assert "__wrapped__" not in vars(Scaled.count)
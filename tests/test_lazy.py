@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+from quant_py.lazy import lazy_import
+
+
+@pytest.mark.unit
+def test_lazy_import() -> None:
+    assert lazy_import("sys") is sys
+    with pytest.raises(ModuleNotFoundError, match="no_such_module"):
+        _ = lazy_import("no_such_module")
+
+
+@pytest.mark.unit
+def test_deferred_until_used() -> None:
+    # run in a fresh interpreter, as the test session has loaded pendulum already;
+    # lazy modules are in sys.modules from the start, their submodules only once
+    # they are loaded
+    code = """
+import sys
+import quant_py.curves.bootstrap
+import quant_py.revaluation
+import quant_py.scheduling.schedule
+eager = {"pendulum.date", "dateutil", "concurrent.futures.process"}
+print(sorted(name for name in eager if name in sys.modules))
+from quant_py.dates import to_date
+import numpy as np
+print(type(to_date(np.datetime64("2025-01-01"))).__module__)
+"""
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    deferred, loaded = proc.stdout.splitlines()
+    assert deferred == "[]"
+    assert loaded == "pendulum.date"
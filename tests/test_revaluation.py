@@ -0,0 +1,169 @@
+from dataclasses import replace
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from pendulum.duration import Duration
+
+from quant_py.buscal import BusinessCalendar
+from quant_py.fixings import Fixings, FixingsStore
+from quant_py.products.swap import OisSwapBatch
+from quant_py.revaluation import RevaluationRunner, SwapBook, _assign_workers
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from quant_py.curves.discount_curve import DiscountCurve
+    from quant_py.indices.ois_index import OisRateIndexMetadata
+
+
+def _book(n_swaps: int) -> SwapBook:
+    rng = np.random.default_rng(29)
+    effective = np.datetime64("2025-03-03") + rng.integers(0, 400, n_swaps).astype(
+        "m8[D]"
+    )
+    return SwapBook(
+        index=rng.integers(0, 2, n_swaps),
+        tenor_months=rng.choice([3, 6, 12], n_swaps),
+        effective=effective,
+        termination=effective + 365 * rng.integers(1, 8, n_swaps).astype("m8[D]"),
+        rates=rng.uniform(0.03, 0.045, n_swaps),
+        notionals=rng.integers(1, 100, n_swaps).astype(np.float64) * 1e6,
+        payer=rng.random(n_swaps) < 0.5,
+    )
+
+
+@pytest.fixture
+def indices(sofr_metadata: OisRateIndexMetadata) -> list[OisRateIndexMetadata]:
+    holidays = np.asarray(sofr_metadata.pay_cal.holidays)
+    return [
+        sofr_metadata,
+        replace(sofr_metadata, name="ESTR", pay_cal=BusinessCalendar(holidays)),
+    ]
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> FixingsStore:
+    store = FixingsStore(tmp_path)
+    dates = np.arange("2025-01-01", "2025-08-15", dtype="M8[D]")
+    store.save("SOFR", Fixings(dates, np.full(dates.size, 0.0433)))
+    store.save("ESTR", Fixings(dates, np.full(dates.size, 0.0215)))
+    return store
+
+
+@pytest.mark.unit
+def test_partitions(
+    indices: list[OisRateIndexMetadata], sofr_curve: DiscountCurve
+) -> None:
+    book = _book(500)
+    runner = RevaluationRunner(indices, [sofr_curve] * 2, chunk_size=40)
+    order, bounds = runner.partitions(book)
+    np.testing.assert_array_equal(np.sort(order), np.arange(500))
+    assert bounds[0] == 0
+    assert bounds[-1] == 500
+    for start, stop in pairwise(bounds):
+        assert 0 < stop - start <= 40
+        rows = order[start:stop]
+        assert np.unique(book.index[rows]).size == 1
+        assert np.unique(book.tenor_months[rows]).size == 1
+
+
+@pytest.mark.unit
+def test_run(
+    indices: list[OisRateIndexMetadata],
+    sofr_curve: DiscountCurve,
+    store: FixingsStore,
+) -> None:
+    book = _book(300)
+    runner = RevaluationRunner(
+        indices, [sofr_curve] * 2, fixings=store, max_workers=2, chunk_size=25
+    )
+    result = runner.run(book)
+    expected = np.empty(len(book))
+    for row in range(len(book)):
+        metadata = indices[int(book.index[row])]
+        tenor = Duration(months=int(book.tenor_months[row]))
+        swap = OisSwapBatch.of(
+            effective=book.effective[row : row + 1],
+            termination=book.termination[row : row + 1],
+            rates=book.rates[row],
+            notionals=book.notionals[row],
+            metadata=metadata,
+            fixed_tenors=tenor,
+            float_tenors=tenor,
+            fixed_daycounter=metadata.daycounter,
+            payer=book.payer[row],
+        )
+        expected[row] = swap.pvs(sofr_curve, store.load(metadata.name))[0]
+    np.testing.assert_allclose(result.pvs, expected, rtol=1e-10, atol=1e-6)
+    assert sum(stats.trades for stats in result.workers.values()) == len(book)
+    assert all(stats.throughput > 0 for stats in result.workers.values())
+
+
+@pytest.mark.unit
+def test_partition_affinity(
+    indices: list[OisRateIndexMetadata],
+    sofr_curve: DiscountCurve,
+    store: FixingsStore,
+) -> None:
+    book = _book(300)
+    runner = RevaluationRunner(
+        indices, [sofr_curve] * 2, fixings=store, max_workers=2, chunk_size=10
+    )
+    workers: dict[tuple[int, int], set[int]] = {}
+    for chunk in runner.stream(book):
+        (partition,) = {
+            (int(book.index[row]), int(book.tenor_months[row])) for row in chunk.rows
+        }
+        workers.setdefault(partition, set()).add(chunk.worker)
+    # every partition is within a worker's share, so each runs on a single worker
+    assert len(workers) == 6
+    assert all(len(pids) == 1 for pids in workers.values())
+    assert len(set().union(*workers.values())) == 2
+
+
+@pytest.mark.unit
+def test_assign_workers() -> None:
+    # partitions of 3, 1 and 2 chunks of 10 swaps on 2 workers, share of 30 each
+    slots = _assign_workers([10] * 6, [0, 0, 0, 1, 2, 2], 2)
+    assert len(set(slots[:3])) == 1
+    assert slots[3] != slots[0]
+    assert slots[4] == slots[5] == slots[3]
+
+    # a partition bigger than a worker's share is split in consecutive runs
+    slots = _assign_workers([10] * 6, [0] * 6, 3)
+    assert slots[0] == slots[1]
+    assert slots[2] == slots[3]
+    assert slots[4] == slots[5]
+    assert len(set(slots)) == 3
+    assert _assign_workers([], [], 4) == []
+
+
+@pytest.mark.unit
+def test_empty_book(
+    indices: list[OisRateIndexMetadata], sofr_curve: DiscountCurve
+) -> None:
+    result = RevaluationRunner(indices, [sofr_curve] * 2, max_workers=1).run(_book(0))
+    assert result.pvs.size == 0
+    assert not result.workers
+
+
+@pytest.mark.unit
+def test_invalid(
+    indices: list[OisRateIndexMetadata], sofr_curve: DiscountCurve
+) -> None:
+    with pytest.raises(ValueError, match="one curve per index"):
+        _ = RevaluationRunner(indices, [sofr_curve])
+    with pytest.raises(ValueError, match="unknown index"):
+        _ = RevaluationRunner(indices[:1], [sofr_curve]).partitions(_book(50))
+    with pytest.raises(ValueError, match="equal length"):
+        _ = SwapBook(
+            index=np.array([0]),
+            tenor_months=np.array([3]),
+            effective=np.array([], dtype="M8[D]"),
+            termination=np.array([], dtype="M8[D]"),
+            rates=np.array([]),
+            notionals=np.array([]),
+            payer=np.array([], dtype=np.bool_),
+        )
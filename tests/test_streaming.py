@@ -0,0 +1,198 @@
+import threading
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+import pytest
+from pendulum.date import Date
+from pendulum.duration import Duration
+
+from quant_py.daycounters.act360 import Act360
+from quant_py.scheduling.adjuster import BusdayConvention
+from quant_py.scheduling.schedule import Schedule
+from quant_py.streaming import CashflowPipeline, TradeTerms, prefetch, rebatch
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+
+def _terms(n_trades: int) -> TradeTerms:
+    rng = np.random.default_rng(0)
+    effective = np.datetime64("2025-01-01") + rng.integers(0, 365, n_trades)
+    termination = effective + rng.integers(365, 5 * 365, n_trades)
+    stub = rng.integers(0, 3, n_trades)
+    nat = np.datetime64("NaT", "D")
+    days = np.timedelta64(10, "D")
+    return TradeTerms(
+        effective=effective,
+        termination=termination,
+        tenor_months=rng.choice([1, 3, 6, 12], n_trades),
+        rates=rng.uniform(0.01, 0.05, n_trades),
+        notionals=rng.uniform(1e6, 1e7, n_trades),
+        front_stub=np.where(stub == 1, effective + days, nat),
+        back_stub=np.where(stub == 2, termination - days, nat),
+    )
+
+
+def _collect(batches: Iterator[tuple[np.ndarray, ...]]) -> list[np.ndarray]:
+    return [np.concatenate(column) for column in zip(*batches, strict=True)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("prefetch_depth", [0, 2])
+def test_stream(sifma: np.busdaycalendar, prefetch_depth: int) -> None:
+    terms = _terms(50)
+    pipeline = CashflowPipeline(
+        sifma,
+        BusdayConvention.MODIFIEDFOLLOWING,
+        Act360(),
+        chunk_size=7,
+        batch_size=16,
+        prefetch=prefetch_depth,
+    )
+    batches = list(pipeline.stream(terms))
+    assert all(len(batch.trades) == 16 for batch in batches[:-1])
+    assert 0 < len(batches[-1].trades) <= 16
+
+    # same cashflows as scheduling the whole book at once
+    (whole,) = pipeline.cashflows(pipeline.schedules([terms]))
+    for streamed, expected in zip(_collect(iter(batches)), whole, strict=True):
+        np.testing.assert_array_equal(streamed, expected)
+
+    trades, start, end, _, year_fracs, amounts = _collect(iter(batches))
+    assert terms.front_stub is not None
+    front = terms.front_stub[3]
+    schedule = Schedule.of(
+        Date.fromordinal(terms.effective[3].item().toordinal()),
+        Date.fromordinal(terms.termination[3].item().toordinal()),
+        Duration(months=int(terms.tenor_months[3])),
+        sifma,
+        BusdayConvention.MODIFIEDFOLLOWING,
+        None if np.isnat(front) else Date.fromordinal(front.item().toordinal()),
+    )
+    rows = trades == 3
+    np.testing.assert_array_equal(start[rows], schedule.start)
+    np.testing.assert_array_equal(end[rows], schedule.end)
+    np.testing.assert_allclose(
+        amounts[rows], terms.notionals[3] * terms.rates[3] * year_fracs[rows]
+    )
+
+
+@pytest.mark.unit
+def test_stream_chunks_from_disk(sifma: np.busdaycalendar, tmp_path: Path) -> None:
+    terms = _terms(20)
+    columns: dict[str, NDArray[Any]] = {}
+    for name in ("effective", "termination", "tenor_months", "rates", "notionals"):
+        np.save(tmp_path / f"{name}.npy", getattr(terms, name))
+        columns[name] = np.load(tmp_path / f"{name}.npy", mmap_mode="r")
+    on_disk = TradeTerms(**columns)
+    assert np.shares_memory(on_disk.effective, columns["effective"])
+
+    pipeline = CashflowPipeline(
+        sifma, BusdayConvention.FOLLOWING, Act360(), chunk_size=4, batch_size=10
+    )
+    parts = [on_disk[:9], on_disk[9:]]
+    trades, *_ = _collect(pipeline.stream(parts))
+    assert np.all(np.diff(trades) >= 0)
+    assert np.unique(trades).tolist() == list(range(20))
+
+
+@pytest.mark.unit
+def test_trade_terms_validation() -> None:
+    terms = _terms(3)
+    assert len(terms) == 3
+    assert terms.eom is not None
+    assert not terms.eom.any()
+    assert len(terms[1:]) == 2
+    assert np.shares_memory(terms[1:].effective, terms.effective)
+    with pytest.raises(ValueError, match="equal length"):
+        _ = TradeTerms(
+            terms.effective,
+            terms.termination[:2],
+            np.full(3, 3),
+            np.full(3, 0.01),
+            np.full(3, 1e6),
+        )
+
+
+@pytest.mark.unit
+def test_pipeline_validation(sifma: np.busdaycalendar) -> None:
+    with pytest.raises(ValueError, match="positive"):
+        _ = CashflowPipeline(sifma, BusdayConvention.FOLLOWING, Act360(), batch_size=0)
+    with pytest.raises(ValueError, match="negative"):
+        _ = CashflowPipeline(sifma, BusdayConvention.FOLLOWING, Act360(), prefetch=-1)
+
+    terms = _terms(3)
+    bad = TradeTerms(
+        terms.effective,
+        terms.termination,
+        np.array([3, 0, 3]),
+        terms.rates,
+        terms.notionals,
+    )
+    pipeline = CashflowPipeline(sifma, BusdayConvention.FOLLOWING, Act360())
+    with pytest.raises(ValueError, match="positive number of months"):
+        _ = list(pipeline.stream(bad))
+
+
+class _Columns(NamedTuple):
+    a: np.ndarray
+    b: np.ndarray
+
+
+@pytest.mark.unit
+def test_rebatch() -> None:
+    sizes = [0, 3, 11, 1, 4, 2]
+    stops = np.cumsum(sizes)
+    batches = [
+        _Columns(np.arange(stop - size, stop), -np.arange(stop - size, stop))
+        for size, stop in zip(sizes, stops, strict=True)
+    ]
+    out = list(rebatch(batches, 5))
+    assert [len(batch.a) for batch in out] == [5, 5, 5, 5, 1]
+    assert all(isinstance(batch, _Columns) for batch in out)
+    np.testing.assert_array_equal(np.concatenate([batch.a for batch in out]), range(21))
+    np.testing.assert_array_equal(
+        np.concatenate([batch.b for batch in out]), -np.arange(21)
+    )
+    assert list(rebatch([], 5)) == []
+
+    # the remainder is copied rather than keeping the whole batch alive
+    whole = _Columns(np.arange(12), -np.arange(12))
+    *full, rest = rebatch([whole], 5)
+    assert all(np.shares_memory(batch.a, whole.a) for batch in full)
+    assert not np.shares_memory(rest.a, whole.a)
+
+
+@pytest.mark.unit
+def test_prefetch() -> None:
+    assert list(prefetch(range(10), depth=3)) == list(range(10))
+
+    def failing() -> Iterator[int]:
+        yield 1
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    items = prefetch(failing())
+    assert next(items) == 1
+    with pytest.raises(RuntimeError, match="boom"):
+        next(items)
+
+    closed = threading.Event()
+
+    def endless() -> Iterator[int]:
+        try:
+            n = 0
+            while True:
+                yield n
+                n += 1
+        finally:
+            closed.set()
+
+    items = prefetch(endless())
+    assert [next(items) for _ in range(3)] == [0, 1, 2]
+    items.close()
+    assert closed.is_set()
+    assert not any(thread.name == "prefetch" for thread in threading.enumerate())